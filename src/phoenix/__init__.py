@@ -1,20 +1,26 @@
-from .inferences.fixtures import ExampleInferences, load_example
-from .inferences.inferences import Inferences
-from .inferences.schema import EmbeddingColumnNames, RetrievalEmbeddingColumnNames, Schema
-from .session.client import Client
-from .session.evaluation import log_evaluations
-from .session.session import (
-    NotebookEnvironment,
-    Session,
-    active_session,
-    close_app,
-    delete_all,
-    launch_app,
-)
-from .trace.fixtures import load_example_traces
-from .trace.trace_dataset import TraceDataset
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any, List
+
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .inferences.fixtures import ExampleInferences, load_example
+    from .inferences.inferences import Inferences
+    from .inferences.schema import EmbeddingColumnNames, RetrievalEmbeddingColumnNames, Schema
+    from .session.client import Client
+    from .session.evaluation import log_evaluations
+    from .session.session import (
+        NotebookEnvironment,
+        Session,
+        active_session,
+        close_app,
+        delete_all,
+        launch_app,
+    )
+    from .trace.fixtures import load_example_traces
+    from .trace.trace_dataset import TraceDataset
+
 # module level doc-string
 __doc__ = """
 arize-phoenix - ML Observability in a notebook
@@ -51,3 +57,41 @@ __all__ = [
     "Client",
     "evals",
 ]
+
+# The modules are only imported when their attributes are first accessed, so
+# that using e.g. only the client does not import the server or the libraries
+# for embeddings and metrics.
+_LAZY_ATTRIBUTES = {
+    "ExampleInferences": ".inferences.fixtures",
+    "load_example": ".inferences.fixtures",
+    "Inferences": ".inferences.inferences",
+    "EmbeddingColumnNames": ".inferences.schema",
+    "RetrievalEmbeddingColumnNames": ".inferences.schema",
+    "Schema": ".inferences.schema",
+    "Client": ".session.client",
+    "log_evaluations": ".session.evaluation",
+    "NotebookEnvironment": ".session.session",
+    "Session": ".session.session",
+    "active_session": ".session.session",
+    "close_app": ".session.session",
+    "delete_all": ".session.session",
+    "launch_app": ".session.session",
+    "load_example_traces": ".trace.fixtures",
+    "TraceDataset": ".trace.trace_dataset",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module_name := _LAZY_ATTRIBUTES.get(name)) is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+    # Subpackages such as `phoenix.trace` used to be imported along with this
+    # module, so they remain accessible as attributes.
+    if not name.startswith("_") and importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -47,10 +47,60 @@ Note that if you plan on using SQLite, it's advised to to use a persistent volum
 and simply point the PHOENIX_WORKING_DIR to that volume.
 """
 
+ENV_PHOENIX_SQL_DATABASE_POOL_SIZE = "PHOENIX_SQL_DATABASE_POOL_SIZE"
+"""
+The number of connections kept open by each pool of database connections, i.e.
+the pool for reads and, on PostgreSQL, the pool for writes. SQLite databases
+are always written through a single connection. Defaults to 5.
+"""
+ENV_PHOENIX_SQL_DATABASE_MAX_OVERFLOW = "PHOENIX_SQL_DATABASE_MAX_OVERFLOW"
+"""
+The number of connections each pool of database connections may open beyond
+its size under load. Defaults to 10.
+"""
+ENV_PHOENIX_SQL_DATABASE_STATEMENT_TIMEOUT_MS = "PHOENIX_SQL_DATABASE_STATEMENT_TIMEOUT_MS"
+"""
+The time in milliseconds after which PostgreSQL cancels a statement that reads
+from the database, so that long analytical queries can't hold on to the
+connections of the read pool. Writes are never canceled. Defaults to 0, which
+disables the timeout.
+"""
+
 ENV_PHOENIX_ENABLE_PROMETHEUS = "PHOENIX_ENABLE_PROMETHEUS"
 """
 Whether to enable Prometheus. Defaults to false.
 """
+ENV_PHOENIX_RUN_IN_THREAD = "PHOENIX_RUN_IN_THREAD"
+"""
+Whether `launch_app` runs the server in a thread of the notebook process rather
+than in a separate process, when not specified by its `run_in_thread` argument.
+Defaults to true.
+"""
+ENV_PHOENIX_INGESTION_WORKERS = "PHOENIX_INGESTION_WORKERS"
+"""
+The number of worker processes that decompress and decode the OTLP traces
+received over HTTP and gRPC. Defaults to 0, which decodes the traces in the
+server process.
+"""
+ENV_PHOENIX_SPAN_QUERY_CACHE_SIZE_MB = "PHOENIX_SPAN_QUERY_CACHE_SIZE_MB"
+"""
+The size in megabytes of the server-side cache of span query results. Defaults
+to 0, which disables the cache.
+"""
+ENV_PHOENIX_SPAN_STORE_SIZE = "PHOENIX_SPAN_STORE_SIZE"
+"""
+The number of recently inserted spans per project kept in memory to serve live
+views, e.g. of the last 15 minutes, without querying the database. Defaults to
+0, which disables the in-memory store.
+"""
+ENV_PHOENIX_ENABLE_SPAN_FULL_TEXT_INDEX = "PHOENIX_ENABLE_SPAN_FULL_TEXT_INDEX"
+"""
+Whether substring searches of span input and output values, e.g. `'abc' in
+input.value`, are served by a full-text index. The index is created when the
+server starts and dropped when it is disabled. It speeds up such searches of
+large projects, but makes inserting spans slower and the database larger.
+Defaults to false.
+"""
 
 # Phoenix server OpenTelemetry instrumentation environment variables
 ENV_PHOENIX_SERVER_INSTRUMENTATION_OTLP_TRACE_COLLECTOR_HTTP_ENDPOINT = (
@@ -214,6 +264,29 @@ def get_env_database_connection_str() -> str:
     return env_url
 
 
+def get_env_sql_database_pool_size() -> int:
+    return _get_env_non_negative_int(ENV_PHOENIX_SQL_DATABASE_POOL_SIZE, 5)
+
+
+def get_env_sql_database_max_overflow() -> int:
+    return _get_env_non_negative_int(ENV_PHOENIX_SQL_DATABASE_MAX_OVERFLOW, 10)
+
+
+def get_env_sql_database_statement_timeout_ms() -> int:
+    return _get_env_non_negative_int(ENV_PHOENIX_SQL_DATABASE_STATEMENT_TIMEOUT_MS, 0)
+
+
+def _get_env_non_negative_int(env_var: str, default: int) -> int:
+    if (value := os.getenv(env_var)) is None:
+        return default
+    if not value.isdigit():
+        raise ValueError(
+            f"Invalid value for environment variable {env_var}: "
+            f"{value}. Value must be a non-negative integer."
+        )
+    return int(value)
+
+
 def get_env_enable_prometheus() -> bool:
     if (enable_promotheus := os.getenv(ENV_PHOENIX_ENABLE_PROMETHEUS)) is None or (
         enable_promotheus_lower := enable_promotheus.lower()
@@ -227,6 +300,58 @@ def get_env_enable_prometheus() -> bool:
     )
 
 
+def get_env_run_in_thread() -> bool:
+    if (run_in_thread := os.getenv(ENV_PHOENIX_RUN_IN_THREAD)) is None or (
+        run_in_thread_lower := run_in_thread.lower()
+    ) == "true":
+        return True
+    if run_in_thread_lower == "false":
+        return False
+    raise ValueError(
+        f"Invalid value for environment variable {ENV_PHOENIX_RUN_IN_THREAD}: "
+        f"{run_in_thread}. Valid values are 'TRUE' and 'FALSE' (case-insensitive)."
+    )
+
+
+def get_env_ingestion_workers() -> int:
+    if (workers := os.getenv(ENV_PHOENIX_INGESTION_WORKERS)) is None:
+        return 0
+    if not workers.isdigit():
+        raise ValueError(
+            f"Invalid value for environment variable {ENV_PHOENIX_INGESTION_WORKERS}: "
+            f"{workers}. Value must be a non-negative integer."
+        )
+    return int(workers)
+
+
+def get_env_span_query_cache_size_mb() -> int:
+    if (size_mb := os.getenv(ENV_PHOENIX_SPAN_QUERY_CACHE_SIZE_MB)) is None:
+        return 0
+    if not size_mb.isdigit():
+        raise ValueError(
+            f"Invalid value for environment variable {ENV_PHOENIX_SPAN_QUERY_CACHE_SIZE_MB}: "
+            f"{size_mb}. Value must be a non-negative integer."
+        )
+    return int(size_mb)
+
+
+def get_env_span_store_size() -> int:
+    return _get_env_non_negative_int(ENV_PHOENIX_SPAN_STORE_SIZE, 0)
+
+
+def get_env_enable_span_full_text_index() -> bool:
+    if (enable_index := os.getenv(ENV_PHOENIX_ENABLE_SPAN_FULL_TEXT_INDEX)) is None or (
+        enable_index_lower := enable_index.lower()
+    ) == "false":
+        return False
+    if enable_index_lower == "true":
+        return True
+    raise ValueError(
+        f"Invalid value for environment variable {ENV_PHOENIX_ENABLE_SPAN_FULL_TEXT_INDEX}: "
+        f"{enable_index}. Valid values are 'TRUE' and 'FALSE' (case-insensitive)."
+    )
+
+
 def get_env_client_headers() -> Optional[Dict[str, str]]:
     if headers_str := os.getenv(ENV_PHOENIX_CLIENT_HEADERS):
         return parse_env_headers(headers_str)
@@ -39,12 +39,14 @@ from weakref import ProxyType, proxy
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+import pyarrow as pa
 from pandas.core.dtypes.common import (
     is_bool_dtype,
     is_datetime64_any_dtype,
     is_datetime64tz_dtype,
     is_numeric_dtype,
 )
+from pyarrow import parquet
 from typing_extensions import TypeAlias, TypeGuard
 from wrapt import ObjectProxy
 
@@ -754,6 +756,7 @@ class Model:
     _nan_series_factory: _ConstantValueSeriesFactory
     _dimension_categories_from_all_inferences: _Cache[Name, Tuple[str, ...]]
     _dimension_min_max_from_all_inferences: _Cache[Name, Tuple[float, float]]
+    _reference_summaries: _Cache[Hashable, Any]
 
     def __init__(
         self,
@@ -777,6 +780,11 @@ class Model:
             "_dimension_min_max_from_all_inferences",
             _Cache[Name, Tuple[float, float]](),
         )
+        object.__setattr__(
+            self,
+            "_reference_summaries",
+            _Cache[Hashable, Any](),
+        )
 
         df_names, dfs = cast(
             Tuple[Iterable[Name], Iterable[pd.DataFrame]],
@@ -911,13 +919,16 @@ class Model:
         row_numbers: Mapping[InferencesRole, Iterable[int]],
         parquet_file: BinaryIO,
         cluster_ids: Optional[Mapping[InferencesRole, Mapping[int, str]]] = None,
+        columns: Optional[Iterable[str]] = None,
+        row_group_size: int = 10_000,
     ) -> None:
         """
         Given row numbers, exports dataframe subset into parquet file.
         Duplicate rows are removed. If the model hase more than one dataset, a
         new column is added to the dataframe containing the dataset name of
         each row in the exported data. The name of the added column will be
-        `__phoenix_dataset_name__`.
+        `__phoenix_dataset_name__`. Rows are written in row groups, so only
+        one row group at a time is held in memory.
 
         Parameters
         ----------
@@ -930,30 +941,61 @@ class Model:
             If cluster_ids is non-empty, a new column is inserted to the
             dataframe containing the cluster IDs of each row in the exported
             data. The name of the added column name is `__phoenix_cluster_id__`.
+        columns: Optional[Iterable[str]]
+            names of the original columns to export. If None, all original
+            columns are exported.
+        row_group_size: int
+            maximum number of rows in each row group of the parquet file
         """
-        export_dataframes = [pd.DataFrame()]
         model_has_multiple_inference_sets = (
             sum(not df.empty for df in self._inference_sets.values()) > 1
         )
+        selected_columns = None if columns is None else set(columns)
+        export_chunks: List[Iterator[pd.DataFrame]] = []
+        schemas: List[pa.Schema] = []
         for inferences_role, numbers in row_numbers.items():
             df = self._inference_sets[inferences_role]
-            columns = [
-                df.columns.get_loc(column_name)
+            column_positions = [
+                cast(int, df.columns.get_loc(column_name))
                 for column_name in self._original_columns_by_role[inferences_role]
+                if selected_columns is None or column_name in selected_columns
             ]
-            rows = pd.Series(sorted(set(numbers)))
-            filtered_df = df.iloc[rows, columns].reset_index(drop=True)
-            if model_has_multiple_inference_sets:
-                filtered_df["__phoenix_dataset_name__"] = df.display_name
-            if cluster_ids and (ids := cluster_ids.get(inferences_role)):
-                filtered_df["__phoenix_cluster_id__"] = rows.apply(ids.get)
-            export_dataframes.append(filtered_df)
-        pd.concat(export_dataframes).to_parquet(
+            rows = np.unique(np.fromiter(numbers, dtype=np.intp))
+            ids = cluster_ids.get(inferences_role) if cluster_ids else None
+            chunks = _export_chunks(
+                df,
+                rows,
+                column_positions,
+                dataset_name=df.display_name if model_has_multiple_inference_sets else None,
+                cluster_ids=pd.Series(ids, dtype=object) if ids else None,
+                chunk_size=row_group_size,
+            )
+            first_chunk = next(chunks)
+            schemas.append(_export_schema(first_chunk, df, rows, column_positions))
+            export_chunks.append(chain((first_chunk,), chunks))
+        schema = (
+            pa.unify_schemas(schemas, promote_options="permissive") if schemas else pa.schema([])
+        )
+        with parquet.ParquetWriter(
             parquet_file,
-            index=False,
+            schema,
             allow_truncated_timestamps=True,
             coerce_timestamps="ms",
-        )
+        ) as writer:
+            for chunk in chain.from_iterable(export_chunks):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer.write_table(
+                    pa.Table.from_arrays(
+                        [
+                            table.column(arrow_field.name).cast(arrow_field.type)
+                            if arrow_field.name in table.column_names
+                            else pa.nulls(len(table), arrow_field.type)
+                            for arrow_field in schema
+                        ],
+                        schema=schema,
+                    ),
+                    row_group_size=row_group_size,
+                )
 
     @cached_property
     def scalar_dimensions(self) -> Tuple[ScalarDimension, ...]:
@@ -1020,6 +1062,26 @@ class Model:
             cache[dimension_name] = ans
         return ans
 
+    def reference_summary(
+        self,
+        key: Hashable,
+        summarize: Callable[[], _Value],
+    ) -> _Value:
+        """
+        Returns the summary of the reference inferences identified by the key,
+        e.g. the bins and histograms of a dimension for drift metrics. The
+        reference inferences don't change for the life of the model, so each
+        summary is computed by calling `summarize` only once, and then cached.
+        """
+        with self._reference_summaries() as cache:
+            try:
+                return cast(_Value, cache[key])
+            except KeyError:
+                pass
+        ans = summarize()
+        with self._reference_summaries() as cache:
+            return cast(_Value, cache.setdefault(key, ans))
+
     @overload
     def __getitem__(self, key: Type[Inferences]) -> Iterator[Inferences]: ...
 
@@ -1291,6 +1353,54 @@ def _agg_min_max(series: "pd.Series[Any]") -> "pd.Series[Any]":
     return series.agg(["min", "max"])
 
 
+def _export_chunks(
+    df: Inferences,
+    rows: npt.NDArray[np.intp],
+    column_positions: Sequence[int],
+    dataset_name: Optional[str],
+    cluster_ids: Optional["pd.Series[Any]"],
+    chunk_size: int,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yields the exported rows in chunks of at most `chunk_size` rows. At least
+    one chunk is yielded, even when there are no rows, so that the columns of
+    the export can always be determined.
+    """
+    for start in range(0, max(len(rows), 1), chunk_size):
+        chunk_rows = rows[start : start + chunk_size]
+        chunk = df.iloc[chunk_rows, column_positions].reset_index(drop=True)
+        if dataset_name is not None:
+            chunk["__phoenix_dataset_name__"] = dataset_name
+        if cluster_ids is not None:
+            chunk["__phoenix_cluster_id__"] = cluster_ids.reindex(chunk_rows).to_numpy()
+        yield chunk
+
+
+def _export_schema(
+    first_chunk: pd.DataFrame,
+    df: Inferences,
+    rows: npt.NDArray[np.intp],
+    column_positions: Sequence[int],
+) -> pa.Schema:
+    """
+    Infers the arrow schema of the exported rows from their first chunk. When
+    a column is entirely missing in the first chunk, its type is inferred from
+    the first non-missing value among the rest of the rows instead.
+    """
+    schema = pa.Schema.from_pandas(first_chunk, preserve_index=False).remove_metadata()
+    for i, arrow_field in enumerate(schema):
+        if not pa.types.is_null(arrow_field.type):
+            continue
+        if arrow_field.name == "__phoenix_cluster_id__":
+            schema = schema.set(i, arrow_field.with_type(pa.string()))
+        elif i < len(column_positions):
+            values = df.iloc[rows, column_positions[i]].dropna()
+            if not values.empty:
+                arrow_type = pa.Array.from_pandas(values.iloc[:1]).type
+                schema = schema.set(i, arrow_field.with_type(arrow_type))
+    return schema
+
+
 def _get_omitted_column_names(
     dimensions: Iterable[Dimension],
     dataframes: Iterable[pd.DataFrame],
@@ -10,28 +10,37 @@ from typing import (
     AsyncContextManager,
     Awaitable,
     Callable,
+    Dict,
     Iterable,
     List,
     Optional,
     Set,
     Tuple,
+    Union,
     cast,
 )
 
 from cachetools import LRUCache
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import TypeAlias
 
 import phoenix.trace.v1 as pb
+from phoenix.db import models
 from phoenix.db.insertion.evaluation import (
     EvaluationInsertionEvent,
     InsertEvaluationError,
     insert_evaluation,
+    insert_evaluations,
 )
 from phoenix.db.insertion.helpers import DataManipulation, DataManipulationEvent
 from phoenix.db.insertion.span import SpanInsertionEvent, insert_span
 from phoenix.server.api.dataloaders import CacheForDataLoaders
+from phoenix.server.project_updates import ProjectUpdate, ProjectUpdateBroker
+from phoenix.server.span_query_cache import SpanQueryCache
 from phoenix.trace.schemas import Span
+from phoenix.trace.span_evaluations import Evaluations
+from phoenix.utilities.span_store import SpanStore
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +58,9 @@ class BulkInserter:
         db: Callable[[], AsyncContextManager[AsyncSession]],
         *,
         cache_for_dataloaders: Optional[CacheForDataLoaders] = None,
+        span_query_cache: Optional[SpanQueryCache] = None,
+        project_update_broker: Optional[ProjectUpdateBroker] = None,
+        span_store: Optional[SpanStore] = None,
         initial_batch_of_operations: Iterable[DataManipulation] = (),
         initial_batch_of_spans: Optional[Iterable[Tuple[Span, str]]] = None,
         initial_batch_of_evaluations: Optional[Iterable[pb.Evaluation]] = None,
@@ -59,6 +71,12 @@ class BulkInserter:
     ) -> None:
         """
         :param db: A function to initiate a new database session.
+        :param span_query_cache: The cache of span query results, whose data
+        versions are advanced for the projects updated by each transaction.
+        :param project_update_broker: The broker to which the new spans and the
+        summary deltas of each project are published once they are committed.
+        :param span_store: The in-memory store to which the spans are added once
+        they are committed.
         :param initial_batch_of_spans: Initial batch of spans to insert.
         :param sleep: The time to sleep between bulk insertions
         :param max_ops_per_transaction: The maximum number of operations to dequeue from
@@ -75,12 +93,15 @@ class BulkInserter:
         self._spans: List[Tuple[Span, str]] = (
             [] if initial_batch_of_spans is None else list(initial_batch_of_spans)
         )
-        self._evaluations: List[pb.Evaluation] = (
+        self._evaluations: List[Union[pb.Evaluation, Evaluations]] = (
             [] if initial_batch_of_evaluations is None else list(initial_batch_of_evaluations)
         )
         self._task: Optional[asyncio.Task[None]] = None
         self._last_updated_at_by_project: LRUCache[ProjectRowId, datetime] = LRUCache(maxsize=100)
         self._cache_for_dataloaders = cache_for_dataloaders
+        self._span_query_cache = span_query_cache
+        self._project_update_broker = project_update_broker
+        self._span_store = span_store
         self._enable_prometheus = enable_prometheus
 
     def last_updated_at(self, project_rowid: Optional[ProjectRowId] = None) -> Optional[datetime]:
@@ -92,7 +113,7 @@ class BulkInserter:
         self,
     ) -> Tuple[
         Callable[[Span, str], Awaitable[None]],
-        Callable[[pb.Evaluation], Awaitable[None]],
+        Callable[[Union[pb.Evaluation, Evaluations]], Awaitable[None]],
         Callable[[DataManipulation], None],
     ]:
         self._running = True
@@ -114,7 +135,7 @@ class BulkInserter:
     async def _queue_span(self, span: Span, project_name: str) -> None:
         self._spans.append((span, project_name))
 
-    async def _queue_evaluation(self, evaluation: pb.Evaluation) -> None:
+    async def _queue_evaluation(self, evaluation: Union[pb.Evaluation, Evaluations]) -> None:
         self._evaluations.append(evaluation)
 
     async def _process_events(self, events: Iterable[Optional[DataManipulationEvent]]) -> None: ...
@@ -166,11 +187,18 @@ class BulkInserter:
                 evaluations_buffer = None
             for project_rowid in transaction_result.updated_project_rowids:
                 self._last_updated_at_by_project[project_rowid] = datetime.now(timezone.utc)
+                if (span_query_cache := self._span_query_cache) is not None:
+                    span_query_cache.invalidate(project_rowid)
             await asyncio.sleep(self._sleep)
 
     async def _insert_spans(self, spans: List[Tuple[Span, str]]) -> TransactionResult:
         transaction_result = TransactionResult()
         for i in range(0, len(spans), self._max_ops_per_transaction):
+            updates: Dict[ProjectRowId, ProjectUpdate] = {}
+            span_store = self._span_store
+            generation = 0 if span_store is None else span_store.generation
+            inserted_spans: List[Tuple[Span, SpanInsertionEvent]] = []
+            watermarks: Dict[ProjectRowId, Optional[datetime]] = {}
             try:
                 start = perf_counter()
                 async with self._db() as session:
@@ -195,6 +223,11 @@ class BulkInserter:
                             transaction_result.updated_project_rowids.add(result.project_rowid)
                             if (cache := self._cache_for_dataloaders) is not None:
                                 cache.invalidate(result)
+                            _add_span_to_update(updates, result)
+                            if span_store is not None:
+                                inserted_spans.append((span, result))
+                    if span_store is not None:
+                        watermarks = await _get_watermarks(session, span_store, inserted_spans)
                 if self._enable_prometheus:
                     from phoenix.server.prometheus import BULK_LOADER_INSERTION_TIME
 
@@ -205,15 +238,29 @@ class BulkInserter:
 
                     BULK_LOADER_EXCEPTIONS.inc()
                 logger.exception("Failed to insert spans")
+                continue
+            if span_store is not None:
+                span_store.add(inserted_spans, watermarks, generation)
+            if (broker := self._project_update_broker) is not None:
+                for update in updates.values():
+                    broker.publish(update)
         return transaction_result
 
-    async def _insert_evaluations(self, evaluations: List[pb.Evaluation]) -> TransactionResult:
+    async def _insert_evaluations(
+        self,
+        evaluations: List[Union[pb.Evaluation, Evaluations]],
+    ) -> TransactionResult:
         transaction_result = TransactionResult()
         for i in range(0, len(evaluations), self._max_ops_per_transaction):
             try:
                 start = perf_counter()
                 async with self._db() as session:
                     for evaluation in islice(evaluations, i, i + self._max_ops_per_transaction):
+                        if isinstance(evaluation, Evaluations):
+                            await self._insert_evaluations_table(
+                                session, evaluation, transaction_result
+                            )
+                            continue
                         if self._enable_prometheus:
                             from phoenix.server.prometheus import BULK_LOADER_EVALUATION_INSERTIONS
 
@@ -242,4 +289,75 @@ class BulkInserter:
 
                     BULK_LOADER_EXCEPTIONS.inc()
                 logger.exception("Failed to insert evaluations")
+        if (broker := self._project_update_broker) is not None:
+            for project_rowid in transaction_result.updated_project_rowids:
+                broker.publish(ProjectUpdate(project_rowid, has_new_evaluations=True))
         return transaction_result
+
+    async def _insert_evaluations_table(
+        self,
+        session: AsyncSession,
+        evaluations: Evaluations,
+        transaction_result: TransactionResult,
+    ) -> None:
+        if self._enable_prometheus:
+            from phoenix.server.prometheus import BULK_LOADER_EVALUATION_INSERTIONS
+
+            BULK_LOADER_EVALUATION_INSERTIONS.inc(len(evaluations))
+        try:
+            async with session.begin_nested():
+                results = await insert_evaluations(session, evaluations)
+        except Exception:
+            if self._enable_prometheus:
+                from phoenix.server.prometheus import BULK_LOADER_EXCEPTIONS
+
+                BULK_LOADER_EXCEPTIONS.inc()
+            logger.exception(f"Failed to insert evaluations: {evaluations!r}")
+            return
+        for result in results:
+            transaction_result.updated_project_rowids.add(result.project_rowid)
+            if (cache := self._cache_for_dataloaders) is not None:
+                cache.invalidate(result)
+
+
+async def _get_watermarks(
+    session: AsyncSession,
+    span_store: SpanStore,
+    inserted_spans: List[Tuple[Span, SpanInsertionEvent]],
+) -> Dict[ProjectRowId, Optional[datetime]]:
+    """
+    Returns the watermarks of the projects not yet in the span store, i.e. the
+    latest start times of the spans inserted before those of this transaction,
+    which have lower row IDs, since there is a single writer.
+    """
+    min_span_rowids: Dict[ProjectRowId, int] = {}
+    for _, event in inserted_spans:
+        if not span_store.has_project(event.project_rowid):
+            min_span_rowids[event.project_rowid] = min(
+                event.span_rowid,
+                min_span_rowids.get(event.project_rowid, event.span_rowid),
+            )
+    watermarks: Dict[ProjectRowId, Optional[datetime]] = {}
+    for project_rowid, min_span_rowid in min_span_rowids.items():
+        watermarks[project_rowid] = await session.scalar(
+            select(models.Span.start_time)
+            .join(models.Trace)
+            .where(models.Trace.project_rowid == project_rowid)
+            .where(models.Span.id < min_span_rowid)
+            .order_by(models.Span.start_time.desc())
+            .limit(1)
+        )
+    return watermarks
+
+
+def _add_span_to_update(
+    updates: Dict[ProjectRowId, ProjectUpdate],
+    event: SpanInsertionEvent,
+) -> None:
+    if (update := updates.get(event.project_rowid)) is None:
+        update = updates[event.project_rowid] = ProjectUpdate(event.project_rowid)
+    update.span_rowids.append(event.span_rowid)
+    update.record_count_delta += 1
+    update.trace_count_delta += event.is_new_trace
+    update.token_count_prompt_delta += event.llm_token_count_prompt
+    update.token_count_completion_delta += event.llm_token_count_completion
@@ -3,7 +3,7 @@ import json
 from datetime import datetime
 from enum import Enum
 from sqlite3 import Connection
-from typing import Any
+from typing import Any, Dict, Optional
 
 import aiosqlite
 import numpy as np
@@ -12,6 +12,11 @@ from sqlalchemy import URL, event, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from typing_extensions import assert_never
 
+from phoenix.config import (
+    get_env_sql_database_max_overflow,
+    get_env_sql_database_pool_size,
+    get_env_sql_database_statement_timeout_ms,
+)
 from phoenix.db.helpers import SupportedSQLDialect
 from phoenix.db.migrate import migrate_in_thread
 from phoenix.db.models import init_models
@@ -21,12 +26,42 @@ sqlean.extensions.enable("text", "stats")
 
 def set_sqlite_pragma(connection: Connection, _: Any) -> None:
     cursor = connection.cursor()
+    # Only takes effect for a new database, i.e. before any tables are created,
+    # after which pages freed by deletions can be returned to the file system
+    # with `PRAGMA incremental_vacuum`.
+    cursor.execute("PRAGMA auto_vacuum = INCREMENTAL;")
     cursor.execute("PRAGMA foreign_keys = ON;")
     cursor.execute("PRAGMA journal_mode = WAL;")
     cursor.execute("PRAGMA synchronous = OFF;")
     cursor.execute("PRAGMA cache_size = -32000;")
     cursor.execute("PRAGMA busy_timeout = 10000;")
     cursor.close()
+    _create_sqlite_functions(connection)
+
+
+def set_sqlite_read_only_pragma(connection: Connection, _: Any) -> None:
+    cursor = connection.cursor()
+    cursor.execute("PRAGMA query_only = ON;")
+    cursor.execute("PRAGMA cache_size = -32000;")
+    cursor.execute("PRAGMA busy_timeout = 10000;")
+    cursor.close()
+    _create_sqlite_functions(connection)
+
+
+def _create_sqlite_functions(connection: Connection) -> None:
+    connection.create_function("python_str", 1, _python_str, deterministic=True)
+
+
+def _python_str(value: Any) -> Optional[str]:
+    """
+    Renders a number, or a JSON object or array, as Python's `str()` would
+    render its decoded value, e.g. for concatenating the elements of arrays.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return str(json.loads(value))
+    return str(value)
 
 
 def get_printable_db_url(connection_str: str) -> str:
@@ -79,37 +114,82 @@ def create_engine(
         assert_never(backend)
 
 
+def create_read_only_engine(
+    connection_str: str,
+    echo: bool = False,
+) -> Optional[AsyncEngine]:
+    """
+    Factory to create a SQLAlchemy engine for reads from a URL string, whose
+    pool of connections is separate from that of the engine for writes, so that
+    long reads and writes can't starve each other of connections. Returns None
+    for in-memory SQLite databases, which can only be shared by connections of
+    the same engine.
+    """
+    url = get_async_db_url(connection_str)
+    backend = SupportedSQLDialect(url.get_backend_name())
+    if backend is SupportedSQLDialect.SQLITE:
+        if _is_sqlite_in_memory(url):
+            return None
+        return aio_sqlite_engine(url=url, migrate=False, echo=echo, read_only=True)
+    elif backend is SupportedSQLDialect.POSTGRESQL:
+        return aio_postgresql_engine(url=url, migrate=False, echo=echo, read_only=True)
+    else:
+        assert_never(backend)
+
+
 def aio_sqlite_engine(
     url: URL,
     migrate: bool = True,
     echo: bool = False,
     shared_cache: bool = True,
+    read_only: bool = False,
 ) -> AsyncEngine:
-    database = url.database or ":memory:"
-    if database.startswith("file:"):
-        database = database[5:]
-    if database.startswith(":memory:") and shared_cache:
+    """
+    Creates an engine for a SQLite database. The writes to a database file go
+    through a single connection, since SQLite only allows one writer at a time,
+    while an engine for reads (`read_only=True`) keeps a pool of read-only
+    connections, which the write-ahead log lets read alongside the writer.
+    """
+    in_memory = _is_sqlite_in_memory(url)
+    if in_memory and shared_cache:
         url = url.set(query={**url.query, "cache": "shared"}, database=":memory:")
     database = url.render_as_string().partition("///")[-1]
+    if read_only:
+        database += f"{'&' if '?' in database else '?'}mode=ro"
 
     def async_creator() -> aiosqlite.Connection:
         conn = aiosqlite.Connection(
             lambda: sqlean.connect(f"file:{database}", uri=True),
-            iter_chunk_size=64,
+            # Reads fetch the rows of large results in fewer round trips to the
+            # thread of the connection.
+            iter_chunk_size=_SQLITE_READ_ITER_CHUNK_SIZE if read_only else 64,
         )
         conn.daemon = True
         return conn
 
+    pool_options: Dict[str, Any] = {}
+    if read_only:
+        pool_options.update(
+            pool_size=get_env_sql_database_pool_size(),
+            max_overflow=get_env_sql_database_max_overflow(),
+        )
+    elif not in_memory:
+        pool_options.update(pool_size=1, max_overflow=0)
     engine = create_async_engine(
         url=url,
         echo=echo,
         json_serializer=_dumps,
         async_creator=async_creator,
+        **pool_options,
+    )
+    event.listen(
+        engine.sync_engine,
+        "connect",
+        set_sqlite_read_only_pragma if read_only else set_sqlite_pragma,
     )
-    event.listen(engine.sync_engine, "connect", set_sqlite_pragma)
     if not migrate:
         return engine
-    if database.startswith(":memory:"):
+    if in_memory:
         try:
             asyncio.get_running_loop()
         except RuntimeError:
@@ -125,14 +205,37 @@ def aio_postgresql_engine(
     url: URL,
     migrate: bool = True,
     echo: bool = False,
+    read_only: bool = False,
 ) -> AsyncEngine:
-    engine = create_async_engine(url=url, echo=echo, json_serializer=_dumps)
+    server_settings: Dict[str, str] = {}
+    if read_only:
+        server_settings.update(default_transaction_read_only="on")
+        if statement_timeout_ms := get_env_sql_database_statement_timeout_ms():
+            server_settings.update(statement_timeout=str(statement_timeout_ms))
+    engine = create_async_engine(
+        url=url,
+        echo=echo,
+        json_serializer=_dumps,
+        pool_size=get_env_sql_database_pool_size(),
+        max_overflow=get_env_sql_database_max_overflow(),
+        connect_args={"server_settings": server_settings} if server_settings else {},
+    )
     if not migrate:
         return engine
     migrate_in_thread(engine.url)
     return engine
 
 
+def _is_sqlite_in_memory(url: URL) -> bool:
+    database = url.database or ":memory:"
+    if database.startswith("file:"):
+        database = database[5:]
+    return database.startswith(":memory:")
+
+
+_SQLITE_READ_ITER_CHUNK_SIZE = 1024
+
+
 def _dumps(obj: Any) -> str:
     return json.dumps(obj, cls=_Encoder)
 
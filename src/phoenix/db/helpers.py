@@ -1,12 +1,23 @@
 from enum import Enum
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Tuple, Union
 
 from openinference.semconv.trace import (
     OpenInferenceSpanKindValues,
     RerankerAttributes,
     SpanAttributes,
 )
-from sqlalchemy import Integer, Select, SQLColumnExpression, case, distinct, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    SQLColumnExpression,
+    and_,
+    case,
+    distinct,
+    func,
+    or_,
+    select,
+)
 from typing_extensions import assert_never
 
 from phoenix.db import models
@@ -80,3 +91,24 @@ def get_project_names_for_experiments(*experiment_ids: int) -> Select[Tuple[Opti
         .where(models.Experiment.id.in_(set(experiment_ids)))
         .where(models.Experiment.project_name.isnot(None))
     )
+
+
+def is_latest_revision(
+    dataset_version_id: Optional[Union[int, ColumnElement[Any]]] = None,
+) -> ColumnElement[bool]:
+    """
+    Returns the condition that a dataset example revision is the latest one of
+    its example as of the given dataset version, or as of the latest version
+    when no version is given. The condition is false for every revision when
+    the given version is a null-valued expression.
+    """
+    revision = models.DatasetExampleRevision
+    if dataset_version_id is None:
+        return revision.valid_to_version_id.is_(None)
+    return and_(
+        revision.dataset_version_id <= dataset_version_id,
+        or_(
+            revision.valid_to_version_id.is_(None),
+            revision.valid_to_version_id > dataset_version_id,
+        ),
+    )
@@ -2,7 +2,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from itertools import chain
+from itertools import chain, islice
 from typing import (
     Any,
     Awaitable,
@@ -10,8 +10,10 @@ from typing import (
     FrozenSet,
     Iterable,
     Iterator,
+    List,
     Mapping,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -31,6 +33,11 @@ DatasetExampleId: TypeAlias = int
 DatasetExampleRevisionId: TypeAlias = int
 SpanRowId: TypeAlias = int
 
+# Examples are inserted in chunks using multi-row INSERT statements. The chunk
+# size keeps the number of bound parameters per statement well below the
+# limits of both SQLite and PostgreSQL.
+_EXAMPLES_CHUNK_SIZE = 1000
+
 
 @dataclass(frozen=True)
 class ExampleContent:
@@ -105,6 +112,28 @@ async def insert_dataset_example(
     return cast(DatasetExampleId, id_)
 
 
+async def insert_dataset_examples(
+    session: AsyncSession,
+    dataset_id: DatasetId,
+    count: int,
+    created_at: Optional[datetime] = None,
+) -> List[DatasetExampleId]:
+    """
+    Inserts `count` examples into the dataset with a single multi-row INSERT
+    and returns their ids in the order of the rows. RETURNING isn't guaranteed
+    to follow that order, e.g. on SQLite, but the ids are assigned in it, so
+    they are sorted.
+    """
+    if count <= 0:
+        return []
+    ids = await session.scalars(
+        insert(models.DatasetExample)
+        .values([{"dataset_id": dataset_id, "created_at": created_at}] * count)
+        .returning(models.DatasetExample.id)
+    )
+    return sorted(ids)
+
+
 class RevisionKind(Enum):
     CREATE = "CREATE"
     PATCH = "PATCH"
@@ -143,6 +172,33 @@ async def insert_dataset_example_revision(
     return cast(DatasetExampleRevisionId, id_)
 
 
+async def insert_dataset_example_revisions(
+    session: AsyncSession,
+    dataset_version_id: DatasetVersionId,
+    revisions: Iterable[Tuple[DatasetExampleId, ExampleContent]],
+    revision_kind: RevisionKind = RevisionKind.CREATE,
+    created_at: Optional[datetime] = None,
+) -> None:
+    """
+    Inserts a revision for each pair of example id and example content with a
+    single multi-row INSERT.
+    """
+    values = [
+        {
+            "dataset_version_id": dataset_version_id,
+            "dataset_example_id": dataset_example_id,
+            "input": example.input,
+            "output": example.output,
+            "metadata_": example.metadata,
+            "revision_kind": revision_kind.value,
+            "created_at": created_at,
+        }
+        for dataset_example_id, example in revisions
+    ]
+    if values:
+        await session.execute(insert(models.DatasetExampleRevision).values(values))
+
+
 class DatasetAction(Enum):
     CREATE = "create"
     APPEND = "append"
@@ -189,30 +245,28 @@ async def add_dataset_examples(
     except Exception:
         logger.exception(f"Failed to insert dataset version for {dataset_id=}")
         raise
-    for example in (await examples) if isinstance(examples, Awaitable) else examples:
+    contents = iter((await examples) if isinstance(examples, Awaitable) else examples)
+    while chunk := list(islice(contents, _EXAMPLES_CHUNK_SIZE)):
         try:
-            dataset_example_id = await insert_dataset_example(
+            dataset_example_ids = await insert_dataset_examples(
                 session=session,
                 dataset_id=dataset_id,
+                count=len(chunk),
                 created_at=created_at,
             )
         except Exception:
-            logger.exception(f"Failed to insert dataset example for {dataset_id=}")
+            logger.exception(f"Failed to insert dataset examples for {dataset_id=}")
             raise
         try:
-            await insert_dataset_example_revision(
+            await insert_dataset_example_revisions(
                 session=session,
                 dataset_version_id=dataset_version_id,
-                dataset_example_id=dataset_example_id,
-                input=example.input,
-                output=example.output,
-                metadata=example.metadata,
+                revisions=zip(dataset_example_ids, chunk),
                 created_at=created_at,
             )
         except Exception:
             logger.exception(
-                f"Failed to insert dataset example revision for {dataset_version_id=}, "
-                f"{dataset_example_id=}"
+                f"Failed to insert dataset example revisions for {dataset_version_id=}"
             )
             raise
     return DatasetExampleAdditionEvent(dataset_id=dataset_id)
@@ -1,6 +1,9 @@
-from typing import NamedTuple, Optional
+import logging
+from itertools import compress
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import select
+import pandas as pd
+from sqlalchemy import literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import assert_never
 
@@ -9,6 +12,19 @@ from phoenix.db.helpers import SupportedSQLDialect, num_docs_col
 from phoenix.db.insertion.helpers import OnConflict, insert_on_conflict
 from phoenix.exceptions import PhoenixException
 from phoenix.trace import v1 as pb
+from phoenix.trace.span_evaluations import (
+    DocumentEvaluations,
+    Evaluations,
+    SpanEvaluations,
+    TraceEvaluations,
+)
+
+logger = logging.getLogger(__name__)
+
+# The number of evaluations whose subjects are looked up with one query and
+# whose annotations are upserted with one multi-row statement, which is kept
+# well below the limits on the number of bound parameters per statement.
+_BATCH_SIZE = 1000
 
 
 class InsertEvaluationError(PhoenixException):
@@ -207,3 +223,205 @@ async def _insert_document_evaluation(
         )
     )
     return DocumentEvaluationInsertionEvent(project_rowid, evaluation_name)
+
+
+async def insert_evaluations(
+    session: AsyncSession,
+    evaluations: Evaluations,
+) -> List[EvaluationInsertionEvent]:
+    """
+    Inserts a table of evaluations batch by batch, which is equivalent to
+    inserting its rows one at a time via `insert_evaluation`, except that rows
+    whose subjects are missing are skipped with a single warning.
+    """
+    dataframe = evaluations.dataframe
+    if dataframe.empty:
+        return []
+    dialect = SupportedSQLDialect(session.bind.dialect.name)
+    evaluation_name = evaluations.eval_name
+    # Rows without a result are skipped before the remaining later rows take
+    # precedence, as if the rows were inserted one at a time.
+    extracted_results = _extract_results(dataframe, evaluation_name)
+    dataframe = dataframe.loc[[result is not None for result in extracted_results]]
+    is_last = ~dataframe.index.duplicated(keep="last")
+    dataframe = dataframe.loc[is_last]
+    all_results = list(compress(filter(None, extracted_results), is_last))
+    events: Set[EvaluationInsertionEvent] = set()
+    num_missing = 0
+    for start in range(0, len(dataframe), _BATCH_SIZE):
+        batch = dataframe.iloc[start : start + _BATCH_SIZE]
+        results = all_results[start : start + _BATCH_SIZE]
+        values: List[Dict[str, Any]] = []
+        if isinstance(evaluations, TraceEvaluations):
+            trace_ids = batch.index.tolist()
+            traces = await _get_traces(session, trace_ids)
+            for trace_id, result in zip(trace_ids, results):
+                if (trace := traces.get(trace_id)) is None:
+                    num_missing += 1
+                    continue
+                project_rowid, trace_rowid = trace
+                events.add(TraceEvaluationInsertionEvent(project_rowid, evaluation_name))
+                values.append(dict(trace_rowid=trace_rowid, **result))
+            await _upsert_annotations(
+                session,
+                dialect,
+                models.TraceAnnotation,
+                values,
+                constraint="uq_trace_annotations_name_trace_rowid",
+                column_names=("name", "trace_rowid"),
+            )
+        elif isinstance(evaluations, SpanEvaluations):
+            span_ids = batch.index.tolist()
+            spans = await _get_spans(session, dialect, span_ids)
+            for span_id, result in zip(span_ids, results):
+                if (span := spans.get(span_id)) is None:
+                    num_missing += 1
+                    continue
+                project_rowid, span_rowid, _ = span
+                events.add(SpanEvaluationInsertionEvent(project_rowid, evaluation_name))
+                values.append(dict(span_rowid=span_rowid, **result))
+            await _upsert_annotations(
+                session,
+                dialect,
+                models.SpanAnnotation,
+                values,
+                constraint="uq_span_annotations_name_span_rowid",
+                column_names=("name", "span_rowid"),
+            )
+        elif isinstance(evaluations, DocumentEvaluations):
+            span_ids = batch.index.get_level_values(0).tolist()
+            document_positions = batch.index.get_level_values(1).tolist()
+            spans = await _get_spans(session, dialect, span_ids)
+            for span_id, document_position, result in zip(span_ids, document_positions, results):
+                if (span := spans.get(span_id)) is None:
+                    num_missing += 1
+                    continue
+                project_rowid, span_rowid, num_docs = span
+                if num_docs is None or num_docs <= document_position:
+                    num_missing += 1
+                    continue
+                events.add(DocumentEvaluationInsertionEvent(project_rowid, evaluation_name))
+                values.append(
+                    dict(span_rowid=span_rowid, document_position=document_position, **result)
+                )
+            await _upsert_annotations(
+                session,
+                dialect,
+                models.DocumentAnnotation,
+                values,
+                constraint="uq_document_annotations_name_span_rowid_document_position",
+                column_names=("name", "span_rowid", "document_position"),
+            )
+        else:
+            raise InsertEvaluationError(
+                f"Cannot insert evaluations of unknown type: {type(evaluations).__name__}"
+            )
+    if num_missing:
+        logger.warning(
+            f"Skipped {num_missing} evaluations with missing subjects: {evaluation_name=}"
+        )
+    return list(events)
+
+
+async def _get_traces(
+    session: AsyncSession,
+    trace_ids: Sequence[str],
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Returns the project row id and the trace row id by trace id.
+    """
+    stmt = select(
+        models.Trace.trace_id,
+        models.Trace.project_rowid,
+        models.Trace.id,
+    ).where(models.Trace.trace_id.in_(set(trace_ids)))
+    return {
+        trace_id: (project_rowid, trace_rowid)
+        for trace_id, project_rowid, trace_rowid in await session.execute(stmt)
+    }
+
+
+async def _get_spans(
+    session: AsyncSession,
+    dialect: SupportedSQLDialect,
+    span_ids: Sequence[str],
+) -> Dict[str, Tuple[int, int, Optional[int]]]:
+    """
+    Returns the project row id, the span row id and the number of documents
+    by span id.
+    """
+    stmt = (
+        select(
+            models.Span.span_id,
+            models.Trace.project_rowid,
+            models.Span.id,
+            num_docs_col(dialect),
+        )
+        .join_from(models.Span, models.Trace)
+        .where(models.Span.span_id.in_(set(span_ids)))
+    )
+    return {
+        span_id: (project_rowid, span_rowid, num_docs)
+        for span_id, project_rowid, span_rowid, num_docs in await session.execute(stmt)
+    }
+
+
+def _extract_results(
+    dataframe: pd.DataFrame,
+    evaluation_name: str,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Returns the values of the annotation for each row, or None if the row has
+    no result, with the same handling of missing values as `encode_evaluations`.
+    """
+    num_rows = len(dataframe)
+    columns = [
+        dataframe[name].astype(object).where(dataframe[name].notna(), None).tolist()
+        if name in dataframe.columns
+        else [None] * num_rows
+        for name in ("label", "score", "explanation")
+    ]
+    results: List[Optional[Dict[str, Any]]] = []
+    for label, score, explanation in zip(*columns):
+        if score is None and not label and not explanation:
+            results.append(None)
+            continue
+        results.append(
+            dict(
+                name=evaluation_name,
+                label=label or None,
+                score=None if score is None else float(score),
+                explanation=explanation or None,
+                metadata_={},  # `metadata_` must match ORM
+                annotator_kind="LLM",
+            )
+        )
+    return results
+
+
+async def _upsert_annotations(
+    session: AsyncSession,
+    dialect: SupportedSQLDialect,
+    table: Any,
+    values: Sequence[Mapping[str, Any]],
+    constraint: str,
+    column_names: Tuple[str, ...],
+) -> None:
+    if not values:
+        return
+    set_: Dict[str, Any] = {
+        # `metadata` must match database
+        name: literal_column(f"excluded.{name}")
+        for name in ("label", "score", "explanation", "metadata", "annotator_kind")
+    }
+    await session.execute(
+        insert_on_conflict(
+            dialect=dialect,
+            table=table,
+            values=values,
+            constraint=constraint,
+            column_names=column_names,
+            on_conflict=OnConflict.DO_UPDATE,
+            set_=set_,
+        )
+    )
@@ -1,6 +1,6 @@
 from abc import ABC
 from enum import Enum, auto
-from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence
+from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence, Union
 
 from sqlalchemy import Insert
 from sqlalchemy.dialects.postgresql import insert as insert_postgresql
@@ -28,14 +28,15 @@ class OnConflict(Enum):
 def insert_on_conflict(
     dialect: SupportedSQLDialect,
     table: Any,
-    values: Mapping[str, Any],
+    values: Union[Mapping[str, Any], Sequence[Mapping[str, Any]]],
     constraint: str,
     column_names: Sequence[str],
     on_conflict: OnConflict = OnConflict.DO_NOTHING,
     set_: Optional[Mapping[str, Any]] = None,
 ) -> Insert:
     """
-    Dialect specific insertion statement using ON CONFLICT DO syntax.
+    Dialect specific insertion statement using ON CONFLICT DO syntax. A sequence
+    of values is inserted as multiple rows.
     """
     if dialect is SupportedSQLDialect.POSTGRESQL:
         stmt_postgresql = insert_postgresql(table).values(values)
@@ -1,9 +1,10 @@
 from dataclasses import asdict
-from typing import NamedTuple, Optional, cast
+from typing import Any, Dict, NamedTuple, Optional, Tuple, cast
 
 from openinference.semconv.trace import SpanAttributes
-from sqlalchemy import func, insert, select, update
+from sqlalchemy import func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from phoenix.db import models
 from phoenix.db.helpers import SupportedSQLDialect
@@ -14,6 +15,16 @@ from phoenix.trace.schemas import Span, SpanStatusCode
 
 class SpanInsertionEvent(NamedTuple):
     project_rowid: int
+    span_rowid: int
+    is_new_trace: bool = False
+    llm_token_count_prompt: int = 0
+    llm_token_count_completion: int = 0
+    trace_rowid: int = 0
+    cumulative_error_count: int = 0
+    cumulative_llm_token_count_prompt: int = 0
+    cumulative_llm_token_count_completion: int = 0
+    ancestor_ids: Tuple[str, ...] = ()
+    """The span IDs of the ancestors whose cumulative values were updated."""
 
 
 class ClearProjectSpansEvent(NamedTuple):
@@ -38,22 +49,20 @@ async def insert_span(
         ).returning(models.Project.id)
     )
     assert project_rowid is not None
-    if trace := await session.scalar(
-        select(models.Trace).where(models.Trace.trace_id == span.context.trace_id)
-    ):
-        trace_rowid = trace.id
-        if span.start_time < trace.start_time or trace.end_time < span.end_time:
-            trace_start_time = min(trace.start_time, span.start_time)
-            trace_end_time = max(trace.end_time, span.end_time)
-            await session.execute(
-                update(models.Trace)
-                .where(models.Trace.id == trace_rowid)
-                .values(
-                    start_time=trace_start_time,
-                    end_time=trace_end_time,
-                )
-            )
+    is_new_trace = False
+    if trace := (
+        await session.execute(
+            select(
+                models.Trace.id,
+                models.Trace.start_time,
+                models.Trace.end_time,
+            ).where(models.Trace.trace_id == span.context.trace_id)
+        )
+    ).first():
+        trace_rowid, trace_start_time, trace_end_time = trace
     else:
+        is_new_trace = True
+        trace_start_time, trace_end_time = span.start_time, span.end_time
         trace_rowid = cast(
             int,
             await session.scalar(
@@ -61,19 +70,21 @@ async def insert_span(
                 .values(
                     project_rowid=project_rowid,
                     trace_id=span.context.trace_id,
-                    start_time=span.start_time,
-                    end_time=span.end_time,
+                    start_time=trace_start_time,
+                    end_time=trace_end_time,
                 )
                 .returning(models.Trace.id)
             ),
         )
     cumulative_error_count = int(span.status_code is SpanStatusCode.ERROR)
-    cumulative_llm_token_count_prompt = cast(
+    llm_token_count_prompt = cast(
         int, get_attribute_value(span.attributes, SpanAttributes.LLM_TOKEN_COUNT_PROMPT) or 0
     )
-    cumulative_llm_token_count_completion = cast(
+    llm_token_count_completion = cast(
         int, get_attribute_value(span.attributes, SpanAttributes.LLM_TOKEN_COUNT_COMPLETION) or 0
     )
+    cumulative_llm_token_count_prompt = llm_token_count_prompt
+    cumulative_llm_token_count_completion = llm_token_count_completion
     if accumulation := (
         await session.execute(
             select(
@@ -113,24 +124,42 @@ async def insert_span(
     )
     if span_rowid is None:
         return None
+    if span.parent_id is not None:
+        await _insert_span_ancestors(session, span, span_rowid)
+    trace_summary: Dict[str, Any] = dict(
+        span_count=models.Trace.span_count + 1,
+        error_count=models.Trace.error_count + int(span.status_code is SpanStatusCode.ERROR),
+        llm_token_count_prompt=models.Trace.llm_token_count_prompt + llm_token_count_prompt,
+        llm_token_count_completion=models.Trace.llm_token_count_completion
+        + llm_token_count_completion,
+    )
+    if span.start_time < trace_start_time:
+        trace_summary.update(start_time=span.start_time)
+    if trace_end_time < span.end_time:
+        trace_summary.update(end_time=span.end_time)
+    if span.parent_id is None:
+        trace_summary.update(
+            root_span_id=span.context.span_id,
+            root_span_name=span.name,
+            root_span_kind=span.span_kind.value,
+            root_span_status_code=span.status_code.value,
+        )
+    await session.execute(
+        update(models.Trace).where(models.Trace.id == trace_rowid).values(trace_summary)
+    )
     # Propagate cumulative values to ancestors. This is usually a no-op, since
     # the parent usually arrives after the child. But in the event that a
     # child arrives after its parent, we need to make sure that all the
     # ancestors' cumulative values are updated.
-    ancestors = (
-        select(models.Span.id, models.Span.parent_id)
-        .where(models.Span.span_id == span.parent_id)
-        .cte(recursive=True)
-    )
-    child = ancestors.alias()
-    ancestors = ancestors.union_all(
-        select(models.Span.id, models.Span.parent_id).join(
-            child, models.Span.span_id == child.c.parent_id
-        )
-    )
-    await session.execute(
+    ancestor_ids = await session.scalars(
         update(models.Span)
-        .where(models.Span.id.in_(select(ancestors.c.id)))
+        .where(
+            models.Span.span_id.in_(
+                select(models.SpanAncestor.ancestor_id).where(
+                    models.SpanAncestor.span_rowid == span_rowid
+                )
+            )
+        )
         .values(
             cumulative_error_count=models.Span.cumulative_error_count + cumulative_error_count,
             cumulative_llm_token_count_prompt=models.Span.cumulative_llm_token_count_prompt
@@ -138,5 +167,46 @@ async def insert_span(
             cumulative_llm_token_count_completion=models.Span.cumulative_llm_token_count_completion
             + cumulative_llm_token_count_completion,
         )
+        .returning(models.Span.span_id)
+    )
+    return SpanInsertionEvent(
+        project_rowid=project_rowid,
+        span_rowid=span_rowid,
+        is_new_trace=is_new_trace,
+        llm_token_count_prompt=llm_token_count_prompt,
+        llm_token_count_completion=llm_token_count_completion,
+        trace_rowid=trace_rowid,
+        cumulative_error_count=cumulative_error_count,
+        cumulative_llm_token_count_prompt=cumulative_llm_token_count_prompt,
+        cumulative_llm_token_count_completion=cumulative_llm_token_count_completion,
+        ancestor_ids=tuple(ancestor_ids),
+    )
+
+
+async def _insert_span_ancestors(session: AsyncSession, span: Span, span_rowid: int) -> None:
+    """
+    Adds the span to the closure of its trace. The ancestors of the span are
+    its parent and the parent's known ancestors. The span's descendants that
+    have already arrived become descendants of those ancestors as well.
+    """
+    parent_rowid = select(models.Span.id).where(models.Span.span_id == span.parent_id)
+    ancestors = (
+        select(literal(span.parent_id).label("ancestor_id"))
+        .union_all(
+            select(models.SpanAncestor.ancestor_id).where(
+                models.SpanAncestor.span_rowid == parent_rowid.scalar_subquery()
+            )
+        )
+        .cte()
+    )
+    descendants = aliased(models.SpanAncestor)
+    await session.execute(
+        insert(models.SpanAncestor).from_select(
+            ["ancestor_id", "span_rowid"],
+            select(ancestors.c.ancestor_id, literal(span_rowid)).union_all(
+                select(ancestors.c.ancestor_id, descendants.span_rowid).join(
+                    descendants, descendants.ancestor_id == span.context.span_id
+                )
+            ),
+        )
     )
-    return SpanInsertionEvent(project_rowid)
@@ -0,0 +1,43 @@
+"""promoted span attributes
+
+Revision ID: 3be8647b87d8
+Revises: 6ef005a9ed0b
+Create Date: 2024-07-10 14:03:21.528119
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from phoenix.db.migrations.types import JSON_
+
+# revision identifiers, used by Alembic.
+revision: str = "3be8647b87d8"
+down_revision: Union[str, None] = "6ef005a9ed0b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The generated columns are frozen here rather than imported from the models,
+# so that later changes to the models don't change what this migration does.
+_PROMOTED_SPAN_ATTRIBUTES = {
+    "llm_model_name": ["llm", "model_name"],
+    "session_id": ["session", "id"],
+    "user_id": ["user", "id"],
+}
+
+
+def upgrade() -> None:
+    attributes = sa.column("attributes", JSON_)
+    for name, keys in _PROMOTED_SPAN_ATTRIBUTES.items():
+        op.add_column(
+            "spans",
+            sa.Column(name, sa.String, sa.Computed(attributes[keys].as_string()), nullable=True),
+        )
+        op.create_index(f"ix_spans_{name}", "spans", [name])
+
+
+def downgrade() -> None:
+    for name in reversed(_PROMOTED_SPAN_ATTRIBUTES):
+        op.drop_index(f"ix_spans_{name}", "spans")
+        op.drop_column("spans", name)
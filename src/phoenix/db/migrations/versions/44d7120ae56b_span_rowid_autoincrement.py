@@ -0,0 +1,99 @@
+"""span rowid autoincrement
+
+Revision ID: 44d7120ae56b
+Revises: e2a6f5c1b9d7
+Create Date: 2024-07-19 09:12:05.417093
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "44d7120ae56b"
+down_revision: Union[str, None] = "e2a6f5c1b9d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The definition of the table is frozen here rather than reflected or compiled
+# from the models, because the reflection of SQLite doesn't recover the
+# generated columns and the expression-based indexes.
+_CREATE_TABLE = """CREATE TABLE {name} (
+    id INTEGER NOT NULL CONSTRAINT pk_spans PRIMARY KEY{autoincrement},
+    trace_rowid INTEGER NOT NULL,
+    span_id VARCHAR NOT NULL,
+    parent_id VARCHAR,
+    name VARCHAR NOT NULL,
+    span_kind VARCHAR NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    attributes JSONB NOT NULL,
+    events JSONB NOT NULL,
+    status_code VARCHAR DEFAULT 'UNSET' NOT NULL
+        CONSTRAINT "ck_spans_`valid_status`" CHECK (status_code IN ('OK', 'ERROR', 'UNSET')),
+    status_message VARCHAR NOT NULL,
+    cumulative_error_count INTEGER NOT NULL,
+    cumulative_llm_token_count_prompt INTEGER NOT NULL,
+    cumulative_llm_token_count_completion INTEGER NOT NULL,
+    llm_model_name VARCHAR GENERATED ALWAYS AS (JSON_EXTRACT(attributes, '$."llm"."model_name"')),
+    session_id VARCHAR GENERATED ALWAYS AS (JSON_EXTRACT(attributes, '$."session"."id"')),
+    user_id VARCHAR GENERATED ALWAYS AS (JSON_EXTRACT(attributes, '$."user"."id"')),
+    CONSTRAINT fk_spans_trace_rowid_traces FOREIGN KEY(trace_rowid)
+        REFERENCES traces (id) ON DELETE CASCADE,
+    CONSTRAINT uq_spans_span_id UNIQUE (span_id)
+)"""
+_COLUMNS = (
+    "id, trace_rowid, span_id, parent_id, name, span_kind, start_time, end_time, "
+    "attributes, events, status_code, status_message, cumulative_error_count, "
+    "cumulative_llm_token_count_prompt, cumulative_llm_token_count_completion"
+)
+_INDEXES = {
+    "ix_spans_start_time": "start_time",
+    "ix_spans_parent_id": "parent_id",
+    "ix_spans_trace_rowid": "trace_rowid",
+    "ix_latency": "(end_time - start_time)",
+    "ix_cumulative_llm_token_count_total": (
+        "(cumulative_llm_token_count_prompt + cumulative_llm_token_count_completion)"
+    ),
+    "ix_spans_llm_model_name": "llm_model_name",
+    "ix_spans_session_id": "session_id",
+    "ix_spans_user_id": "user_id",
+}
+
+
+def upgrade() -> None:
+    # Without AUTOINCREMENT, SQLite reuses the row ids of the newest spans
+    # after they are deleted, whereas the serial row ids on PostgreSQL are
+    # never reused.
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild_spans(autoincrement=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild_spans(autoincrement=False)
+
+
+def _rebuild_spans(autoincrement: bool) -> None:
+    """
+    Rebuilds the table because SQLite can't alter the primary key of a table.
+    The foreign keys of the other tables refer to the table by name, so they
+    refer to the new table once it's renamed. The triggers of the optional
+    full-text index are dropped along with the old table, so the index is
+    dropped too, and is rebuilt when the server starts if it's enabled.
+    """
+    op.execute("DROP TRIGGER IF EXISTS spans_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS spans_fts_insert")
+    op.execute("DROP TABLE IF EXISTS spans_fts")
+    op.execute(
+        _CREATE_TABLE.format(
+            name="_spans_new",
+            autoincrement=" AUTOINCREMENT" if autoincrement else "",
+        )
+    )
+    op.execute(f"INSERT INTO _spans_new ({_COLUMNS}) SELECT {_COLUMNS} FROM spans")
+    op.execute("DROP TABLE spans")
+    op.execute("ALTER TABLE _spans_new RENAME TO spans")
+    for name, expression in _INDEXES.items():
+        op.execute(f"CREATE INDEX {name} ON spans ({expression})")
@@ -0,0 +1,61 @@
+"""span ancestors
+
+Revision ID: 5d8c31e6f0a4
+Revises: c4e0a2b7d913
+Create Date: 2024-07-15 16:02:37.118264
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d8c31e6f0a4"
+down_revision: Union[str, None] = "c4e0a2b7d913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    span_ancestors = op.create_table(
+        "span_ancestors",
+        sa.Column("ancestor_id", sa.String, primary_key=True),
+        sa.Column(
+            "span_rowid",
+            sa.Integer,
+            sa.ForeignKey("spans.id", ondelete="CASCADE"),
+            primary_key=True,
+            index=True,
+        ),
+    )
+    assert span_ancestors is not None
+    spans = sa.table(
+        "spans",
+        sa.column("id", sa.Integer),
+        sa.column("span_id", sa.String),
+        sa.column("parent_id", sa.String),
+    )
+    ancestors = (
+        sa.select(spans.c.id.label("span_rowid"), spans.c.parent_id.label("ancestor_id"))
+        .where(spans.c.parent_id.isnot(None))
+        .cte(recursive=True)
+    )
+    descendant = ancestors.alias()
+    parent = spans.alias()
+    ancestors = ancestors.union_all(
+        sa.select(descendant.c.span_rowid, parent.c.parent_id)
+        .join(parent, parent.c.span_id == descendant.c.ancestor_id)
+        .where(parent.c.parent_id.isnot(None))
+    )
+    op.execute(
+        span_ancestors.insert().from_select(
+            ["ancestor_id", "span_rowid"],
+            sa.select(ancestors.c.ancestor_id, ancestors.c.span_rowid),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("span_ancestors")
@@ -0,0 +1,80 @@
+"""dataset example revision valid to
+
+Revision ID: 6ef005a9ed0b
+Revises: 10460e46d750
+Create Date: 2024-07-08 10:12:45.412903
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6ef005a9ed0b"
+down_revision: Union[str, None] = "10460e46d750"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SET_VALID_TO_VERSION_ID = """
+    UPDATE dataset_example_revisions
+    SET valid_to_version_id = NEW.dataset_version_id
+    WHERE dataset_example_id = NEW.dataset_example_id
+    AND dataset_version_id < NEW.dataset_version_id
+    AND (valid_to_version_id IS NULL OR valid_to_version_id > NEW.dataset_version_id);
+    UPDATE dataset_example_revisions
+    SET valid_to_version_id = (
+        SELECT MIN(dataset_version_id)
+        FROM dataset_example_revisions
+        WHERE dataset_example_id = NEW.dataset_example_id
+        AND dataset_version_id > NEW.dataset_version_id
+    )
+    WHERE id = NEW.id;
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "dataset_example_revisions",
+        sa.Column("valid_to_version_id", sa.Integer, nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE dataset_example_revisions
+        SET valid_to_version_id = (
+            SELECT MIN(later.dataset_version_id)
+            FROM dataset_example_revisions AS later
+            WHERE later.dataset_example_id = dataset_example_revisions.dataset_example_id
+            AND later.dataset_version_id > dataset_example_revisions.dataset_version_id
+        )
+        """
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "CREATE FUNCTION set_dataset_example_revisions_valid_to_version_id() "
+            "RETURNS TRIGGER AS $$ "
+            f"BEGIN {_SET_VALID_TO_VERSION_ID} RETURN NULL; END; "
+            "$$ LANGUAGE plpgsql;"
+        )
+        op.execute(
+            "CREATE TRIGGER dataset_example_revisions_valid_to_version_id "
+            "AFTER INSERT ON dataset_example_revisions "
+            "FOR EACH ROW EXECUTE FUNCTION set_dataset_example_revisions_valid_to_version_id();"
+        )
+    else:
+        op.execute(
+            "CREATE TRIGGER dataset_example_revisions_valid_to_version_id "
+            "AFTER INSERT ON dataset_example_revisions "
+            f"FOR EACH ROW BEGIN {_SET_VALID_TO_VERSION_ID} END;"
+        )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS dataset_example_revisions_valid_to_version_id"
+        + (" ON dataset_example_revisions" if op.get_bind().dialect.name == "postgresql" else "")
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP FUNCTION IF EXISTS set_dataset_example_revisions_valid_to_version_id()")
+    op.drop_column("dataset_example_revisions", "valid_to_version_id")
@@ -0,0 +1,34 @@
+"""project retention policies
+
+Revision ID: c4e0a2b7d913
+Revises: 3be8647b87d8
+Create Date: 2024-07-12 10:21:44.802517
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e0a2b7d913"
+down_revision: Union[str, None] = "3be8647b87d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("projects", sa.Column("retention_max_age_days", sa.Float, nullable=True))
+    op.add_column("projects", sa.Column("retention_max_span_count", sa.Integer, nullable=True))
+    op.create_index(
+        "ix_traces_project_rowid_start_time",
+        "traces",
+        ["project_rowid", "start_time"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_traces_project_rowid_start_time", "traces")
+    op.drop_column("projects", "retention_max_span_count")
+    op.drop_column("projects", "retention_max_age_days")
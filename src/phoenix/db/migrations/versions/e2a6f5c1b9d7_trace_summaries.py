@@ -0,0 +1,103 @@
+"""trace summaries
+
+Revision ID: e2a6f5c1b9d7
+Revises: 5d8c31e6f0a4
+Create Date: 2024-07-17 10:41:52.630517
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from phoenix.db.migrations.types import JSON_
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a6f5c1b9d7"
+down_revision: Union[str, None] = "5d8c31e6f0a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The expressions of the generated column are frozen here rather than compiled
+# from the models, so that later changes to the models don't change what this
+# migration does.
+_LATENCY_MS = {
+    "sqlite": "round((unixepoch(end_time, 'subsec') - unixepoch(start_time, 'subsec')) * 1000, 1)",
+    "postgresql": "round(CAST(EXTRACT(EPOCH FROM end_time - start_time) * 1000 AS NUMERIC), 1)",
+}
+_COUNTS = ("span_count", "error_count", "llm_token_count_prompt", "llm_token_count_completion")
+_ROOT_SPAN_COLUMNS = {
+    "root_span_id": "span_id",
+    "root_span_name": "name",
+    "root_span_kind": "span_kind",
+    "root_span_status_code": "status_code",
+}
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    op.add_column(
+        "traces",
+        sa.Column("latency_ms", sa.Float, sa.Computed(_LATENCY_MS[dialect]), nullable=False),
+    )
+    for name in _ROOT_SPAN_COLUMNS:
+        op.add_column("traces", sa.Column(name, sa.String, nullable=True))
+    for name in _COUNTS:
+        op.add_column("traces", sa.Column(name, sa.Integer, nullable=False, server_default="0"))
+    op.create_index(
+        "ix_traces_project_rowid_latency_ms",
+        "traces",
+        ["project_rowid", "latency_ms"],
+    )
+    traces = sa.table(
+        "traces",
+        sa.column("id", sa.Integer),
+        *(sa.column(name, sa.String) for name in _ROOT_SPAN_COLUMNS),
+        *(sa.column(name, sa.Integer) for name in _COUNTS),
+    )
+    spans = sa.table(
+        "spans",
+        sa.column("trace_rowid", sa.Integer),
+        sa.column("span_id", sa.String),
+        sa.column("parent_id", sa.String),
+        sa.column("name", sa.String),
+        sa.column("span_kind", sa.String),
+        sa.column("status_code", sa.String),
+        sa.column("attributes", JSON_),
+    )
+    trace_spans = sa.select().where(spans.c.trace_rowid == traces.c.id)
+    root_span = trace_spans.where(spans.c.parent_id.is_(None)).limit(1)
+    op.execute(
+        traces.update().values(
+            span_count=trace_spans.add_columns(sa.func.count()).scalar_subquery(),
+            error_count=trace_spans.add_columns(sa.func.count())
+            .where(spans.c.status_code == "ERROR")
+            .scalar_subquery(),
+            llm_token_count_prompt=trace_spans.add_columns(
+                sa.func.coalesce(
+                    sa.func.sum(spans.c.attributes[["llm", "token_count", "prompt"]].as_float()), 0
+                )
+            ).scalar_subquery(),
+            llm_token_count_completion=trace_spans.add_columns(
+                sa.func.coalesce(
+                    sa.func.sum(
+                        spans.c.attributes[["llm", "token_count", "completion"]].as_float()
+                    ),
+                    0,
+                )
+            ).scalar_subquery(),
+            **{
+                name: root_span.add_columns(spans.c[column_name]).scalar_subquery()
+                for name, column_name in _ROOT_SPAN_COLUMNS.items()
+            },
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_traces_project_rowid_latency_ms", "traces")
+    for name in reversed(_COUNTS):
+        op.drop_column("traces", name)
+    for name in reversed(_ROOT_SPAN_COLUMNS):
+        op.drop_column("traces", name)
+    op.drop_column("traces", "latency_ms")
@@ -1,24 +1,35 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, TypedDict
 
 from sqlalchemy import (
+    DDL,
     JSON,
     NUMERIC,
     TIMESTAMP,
     CheckConstraint,
+    Column,
     ColumnElement,
+    Computed,
+    Connection,
     Dialect,
     Float,
     ForeignKey,
     Index,
     MetaData,
     String,
+    Table,
     TypeDecorator,
     UniqueConstraint,
+    and_,
     case,
+    column,
+    event,
     func,
     insert,
+    literal,
+    literal_column,
     select,
+    table,
     text,
 )
 from sqlalchemy.dialects import postgresql
@@ -32,7 +43,7 @@ from sqlalchemy.orm import (
     mapped_column,
     relationship,
 )
-from sqlalchemy.sql import expression
+from sqlalchemy.sql import Select, expression
 
 from phoenix.datetime_utils import normalize_datetime
 
@@ -132,6 +143,10 @@ class Project(Base):
     updated_at: Mapped[datetime] = mapped_column(
         UtcTimeStamp, server_default=func.now(), onupdate=func.now()
     )
+    # Traces older than the maximum age, and the oldest traces in excess of the
+    # maximum span count, are deleted in the background. No limit if null.
+    retention_max_age_days: Mapped[Optional[float]]
+    retention_max_span_count: Mapped[Optional[int]]
 
     traces: WriteOnlyMapped[List["Trace"]] = relationship(
         "Trace",
@@ -147,6 +162,43 @@ class Project(Base):
     )
 
 
+class LatencyMs(expression.FunctionElement[float]):
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    inherit_cache = True
+    type = Float()
+    name = "latency_ms"
+
+
+@compiles(LatencyMs)  # type: ignore
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    start_time, end_time = list(element.clauses)
+    return compiler.process(
+        # The epoch is extracted from the interval rather than from each of the
+        # timestamps, because only the former is immutable, which is required
+        # by the generated column of trace latencies.
+        func.round(
+            func.cast(func.extract("EPOCH", end_time - start_time) * 1000, NUMERIC),
+            1,
+        ),
+        **kw,
+    )
+
+
+@compiles(LatencyMs, "sqlite")  # type: ignore
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    start_time, end_time = list(element.clauses)
+    return compiler.process(
+        # We don't know why sqlite returns a slightly different value.
+        # postgresql is correct because it matches the value computed by Python.
+        func.round(
+            (func.unixepoch(end_time, "subsec") - func.unixepoch(start_time, "subsec")) * 1000, 1
+        ),
+        **kw,
+    )
+
+
 class Trace(Base):
     __tablename__ = "traces"
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -157,17 +209,20 @@ class Trace(Base):
     trace_id: Mapped[str]
     start_time: Mapped[datetime] = mapped_column(UtcTimeStamp, index=True)
     end_time: Mapped[datetime] = mapped_column(UtcTimeStamp)
+    latency_ms: Mapped[float] = mapped_column(
+        Computed(LatencyMs(column("start_time", UtcTimeStamp), column("end_time", UtcTimeStamp))),
+    )
 
-    @hybrid_property
-    def latency_ms(self) -> float:
-        # See https://docs.sqlalchemy.org/en/20/orm/extensions/hybrid.html
-        return (self.end_time - self.start_time).total_seconds() * 1000
-
-    @latency_ms.inplace.expression
-    @classmethod
-    def _latency_ms_expression(cls) -> ColumnElement[float]:
-        # See https://docs.sqlalchemy.org/en/20/orm/extensions/hybrid.html
-        return LatencyMs(cls.start_time, cls.end_time)
+    # The summary of the trace's spans, maintained as each span is inserted,
+    # so that traces can be listed without aggregating over their spans.
+    root_span_id: Mapped[Optional[str]]
+    root_span_name: Mapped[Optional[str]]
+    root_span_kind: Mapped[Optional[str]]
+    root_span_status_code: Mapped[Optional[str]]
+    span_count: Mapped[int] = mapped_column(server_default="0")
+    error_count: Mapped[int] = mapped_column(server_default="0")
+    llm_token_count_prompt: Mapped[int] = mapped_column(server_default="0")
+    llm_token_count_completion: Mapped[int] = mapped_column(server_default="0")
 
     project: Mapped["Project"] = relationship(
         "Project",
@@ -187,9 +242,39 @@ class Trace(Base):
         UniqueConstraint(
             "trace_id",
         ),
+        Index("ix_traces_project_rowid_start_time", "project_rowid", "start_time"),
+        Index("ix_traces_project_rowid_latency_ms", "project_rowid", "latency_ms"),
     )
 
 
+# String attributes that are frequently filtered on, keyed by the name of the
+# indexed column generated from each one, because JSON path extraction can't
+# otherwise make use of an index. The set is fixed rather than configurable,
+# because each column is part of the schema and is added by a migration. The
+# columns hold text, so on SQLite a numeric value such as the session id 123
+# equals the string '123', as on PostgreSQL, unlike the JSON value extracted
+# from the attributes, which is a number.
+PROMOTED_SPAN_ATTRIBUTES: Mapping[str, Sequence[str]] = {
+    "llm_model_name": ("llm", "model_name"),
+    "session_id": ("session", "id"),
+    "user_id": ("user", "id"),
+}
+
+
+# Text attributes that are searched by substring, keyed by the name of their
+# column in the optional full-text index, i.e. the `spans_fts` table on SQLite
+# and the trigram indexes on PostgreSQL.
+SEARCHABLE_SPAN_ATTRIBUTES: Mapping[str, Sequence[str]] = {
+    "input_value": ("input", "value"),
+    "output_value": ("output", "value"),
+}
+
+
+def _promoted_span_attribute(name: str) -> Computed:
+    attributes = column("attributes", JsonDict)
+    return Computed(attributes[list(PROMOTED_SPAN_ATTRIBUTES[name])].as_string())
+
+
 class Span(Base):
     __tablename__ = "spans"
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -215,6 +300,19 @@ class Span(Base):
     cumulative_llm_token_count_prompt: Mapped[int]
     cumulative_llm_token_count_completion: Mapped[int]
 
+    llm_model_name: Mapped[Optional[str]] = mapped_column(
+        _promoted_span_attribute("llm_model_name"),
+        index=True,
+    )
+    session_id: Mapped[Optional[str]] = mapped_column(
+        _promoted_span_attribute("session_id"),
+        index=True,
+    )
+    user_id: Mapped[Optional[str]] = mapped_column(
+        _promoted_span_attribute("user_id"),
+        index=True,
+    )
+
     @hybrid_property
     def latency_ms(self) -> float:
         # See https://docs.sqlalchemy.org/en/20/orm/extensions/hybrid.html
@@ -244,43 +342,27 @@ class Span(Base):
             "ix_cumulative_llm_token_count_total",
             text("(cumulative_llm_token_count_prompt + cumulative_llm_token_count_completion)"),
         ),
+        # Row ids are never reused, even after the newest spans are deleted, so
+        # that they can serve as cursors for exporting spans incrementally.
+        {"sqlite_autoincrement": True},
     )
 
 
-class LatencyMs(expression.FunctionElement[float]):
-    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
-    inherit_cache = True
-    type = Float()
-    name = "latency_ms"
+class SpanAncestor(Base):
+    """
+    The closure of the span trees, with a row for each span and each of its
+    ancestors, so that the descendants or ancestors of a span can be found by
+    an index lookup instead of a recursive query. Ancestors are referenced by
+    span ID because the spans of a trace can arrive in any order, so a span's
+    ancestors may not have been inserted yet.
+    """
 
-
-@compiles(LatencyMs)  # type: ignore
-def _(element: Any, compiler: Any, **kw: Any) -> Any:
-    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
-    start_time, end_time = list(element.clauses)
-    return compiler.process(
-        func.round(
-            func.cast(
-                (func.extract("EPOCH", end_time) - func.extract("EPOCH", start_time)) * 1000,
-                NUMERIC,
-            ),
-            1,
-        ),
-        **kw,
-    )
-
-
-@compiles(LatencyMs, "sqlite")  # type: ignore
-def _(element: Any, compiler: Any, **kw: Any) -> Any:
-    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
-    start_time, end_time = list(element.clauses)
-    return compiler.process(
-        # We don't know why sqlite returns a slightly different value.
-        # postgresql is correct because it matches the value computed by Python.
-        func.round(
-            (func.unixepoch(end_time, "subsec") - func.unixepoch(start_time, "subsec")) * 1000, 1
-        ),
-        **kw,
+    __tablename__ = "span_ancestors"
+    ancestor_id: Mapped[str] = mapped_column(primary_key=True)
+    span_rowid: Mapped[int] = mapped_column(
+        ForeignKey("spans.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
     )
 
 
@@ -312,6 +394,159 @@ def _(element: Any, compiler: Any, **kw: Any) -> Any:
     return compiler.process(func.text_contains(string, substring) > 0, **kw)
 
 
+class SpanTextContains(expression.FunctionElement[bool]):
+    """
+    Same as `TextContains` applied to a searchable span attribute, but looks
+    up the spans in the full-text index. The substring must be at least three
+    characters long, i.e. a trigram, and because the result can be false
+    where `TextContains` is null, it should only be used where the two are
+    equivalent, e.g. as a term of the WHERE clause.
+    """
+
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    inherit_cache = True
+    name = "span_text_contains"
+
+    def __init__(self, name: str, substring: Any) -> None:
+        # The name is a literal so that it's part of the statement's cache key.
+        super().__init__(literal_column(name), substring)
+
+
+def _span_text_contains_clauses(element: SpanTextContains) -> Tuple[str, Any, Any]:
+    name, substring = list(element.clauses)
+    keys = list(SEARCHABLE_SPAN_ATTRIBUTES[name.name])
+    return name.name, Span.attributes[keys].as_string(), substring
+
+
+@compiles(SpanTextContains)  # type: ignore
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    _, string, substring = _span_text_contains_clauses(element)
+    return compiler.process(TextContains(string, substring), **kw)
+
+
+@compiles(SpanTextContains, "postgresql")  # type: ignore
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    _, string, substring = _span_text_contains_clauses(element)
+    # The JSON path has to be rendered as a literal to match the trigram index.
+    string = compiler.process(string, **{**kw, "literal_binds": True})
+    pattern = func.replace(
+        func.replace(func.replace(substring, "\\", "\\\\"), "%", "\\%"),
+        "_",
+        "\\_",
+        type_=String,
+    )
+    return f"({string} LIKE {compiler.process(literal('%') + pattern + '%', **kw)})"
+
+
+@compiles(SpanTextContains, "sqlite")  # type: ignore
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    name, string, substring = _span_text_contains_clauses(element)
+    phrase = literal('"') + func.replace(substring, '"', '""', type_=String) + '"'
+    span_rowids: Select[Any] = (
+        select(literal_column("spans_fts.rowid"))
+        .select_from(table("spans_fts"))
+        .where(literal_column(f"spans_fts.{name}").op("MATCH")(phrase))
+    )
+    return compiler.process(
+        and_(Span.id.in_(span_rowids), func.text_contains(string, substring) > 0).self_group(),
+        **kw,
+    )
+
+
+_SPANS_FTS_COLUMNS = ", ".join(SEARCHABLE_SPAN_ATTRIBUTES)
+_SPANS_FTS_VALUES = ", ".join(
+    f"json_extract({{row}}.attributes, '$.{'.'.join(keys)}')"
+    for keys in SEARCHABLE_SPAN_ATTRIBUTES.values()
+)
+
+# The trigram indexes are defined on a copy of the `spans` table so that
+# `create_all` doesn't create them unless the full-text index is enabled.
+_spans = Table("spans", MetaData(), Column("attributes", JsonDict))
+_TRIGRAM_INDEXES = tuple(
+    Index(
+        f"ix_spans_{name}_trigram",
+        _spans.c.attributes[list(keys)].as_string().label(name),
+        postgresql_using="gin",
+        postgresql_ops={name: "gin_trgm_ops"},
+    )
+    for name, keys in SEARCHABLE_SPAN_ATTRIBUTES.items()
+)
+
+
+def create_span_full_text_index(connection: Connection) -> None:
+    """
+    Creates the full-text index of the searchable span attributes, which
+    `SpanTextContains` looks up, if it doesn't exist, and indexes the existing
+    spans. On SQLite, triggers keep the index up to date as spans are inserted
+    and deleted.
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for index in _TRIGRAM_INDEXES:
+            index.create(connection, checkfirst=True)
+        return
+    if connection.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'spans_fts'")).first():
+        return
+    connection.execute(
+        text(
+            f"CREATE VIRTUAL TABLE spans_fts USING fts5({_SPANS_FTS_COLUMNS}, "
+            "content='', tokenize='trigram case_sensitive 1')"
+        )
+    )
+    connection.execute(
+        text(
+            f"INSERT INTO spans_fts(rowid, {_SPANS_FTS_COLUMNS}) "
+            f"SELECT spans.id, {_SPANS_FTS_VALUES.format(row='spans')} FROM spans"
+        )
+    )
+    connection.execute(
+        text(
+            "CREATE TRIGGER spans_fts_insert AFTER INSERT ON spans FOR EACH ROW BEGIN "
+            f"INSERT INTO spans_fts(rowid, {_SPANS_FTS_COLUMNS}) "
+            f"VALUES (NEW.id, {_SPANS_FTS_VALUES.format(row='NEW')}); END;"
+        )
+    )
+    connection.execute(
+        text(
+            # Rows of a contentless FTS5 table are deleted by re-inserting their values.
+            "CREATE TRIGGER spans_fts_delete AFTER DELETE ON spans FOR EACH ROW BEGIN "
+            f"INSERT INTO spans_fts(spans_fts, rowid, {_SPANS_FTS_COLUMNS}) "
+            f"VALUES ('delete', OLD.id, {_SPANS_FTS_VALUES.format(row='OLD')}); END;"
+        )
+    )
+
+
+def drop_span_full_text_index(connection: Connection) -> None:
+    """
+    Drops the full-text index of the searchable span attributes, if it exists.
+    """
+    if connection.dialect.name == "postgresql":
+        for index in _TRIGRAM_INDEXES:
+            index.drop(connection, checkfirst=True)
+        return
+    connection.execute(text("DROP TRIGGER IF EXISTS spans_fts_delete"))
+    connection.execute(text("DROP TRIGGER IF EXISTS spans_fts_insert"))
+    connection.execute(text("DROP TABLE IF EXISTS spans_fts"))
+
+
+def has_span_full_text_index(connection: Connection) -> bool:
+    """
+    Returns whether the full-text index of the searchable span attributes
+    exists, so that filters only search it if it does.
+    """
+    if connection.dialect.name == "postgresql":
+        index_names = connection.scalars(
+            text("SELECT indexname FROM pg_indexes WHERE tablename = 'spans'")
+        ).all()
+        return all(index.name in index_names for index in _TRIGRAM_INDEXES)
+    return bool(
+        connection.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'spans_fts'")).first()
+    )
+
+
 async def init_models(engine: AsyncEngine) -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -517,6 +752,12 @@ class DatasetExampleRevision(Base):
         ),
     )
     created_at: Mapped[datetime] = mapped_column(UtcTimeStamp, server_default=func.now())
+    # The version at which the revision is superseded by the next revision of
+    # the same example, or null if the revision is the latest. A revision is
+    # the latest one as of version V when `dataset_version_id <= V <
+    # valid_to_version_id`. This column is maintained by a database trigger on
+    # insertion, so it never needs to be set explicitly.
+    valid_to_version_id: Mapped[Optional[int]] = mapped_column(nullable=True)
 
     __table_args__ = (
         UniqueConstraint(
@@ -526,6 +767,52 @@ class DatasetExampleRevision(Base):
     )
 
 
+_SET_VALID_TO_VERSION_ID = """
+    UPDATE dataset_example_revisions
+    SET valid_to_version_id = NEW.dataset_version_id
+    WHERE dataset_example_id = NEW.dataset_example_id
+    AND dataset_version_id < NEW.dataset_version_id
+    AND (valid_to_version_id IS NULL OR valid_to_version_id > NEW.dataset_version_id);
+    UPDATE dataset_example_revisions
+    SET valid_to_version_id = (
+        SELECT MIN(dataset_version_id)
+        FROM dataset_example_revisions
+        WHERE dataset_example_id = NEW.dataset_example_id
+        AND dataset_version_id > NEW.dataset_version_id
+    )
+    WHERE id = NEW.id;
+"""
+
+event.listen(
+    DatasetExampleRevision.__table__,
+    "after_create",
+    DDL(  # type: ignore[no-untyped-call]
+        "CREATE TRIGGER dataset_example_revisions_valid_to_version_id "
+        "AFTER INSERT ON dataset_example_revisions "
+        f"FOR EACH ROW BEGIN {_SET_VALID_TO_VERSION_ID} END;"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    DatasetExampleRevision.__table__,
+    "after_create",
+    DDL(  # type: ignore[no-untyped-call]
+        "CREATE FUNCTION set_dataset_example_revisions_valid_to_version_id() "
+        "RETURNS TRIGGER AS $$ "
+        f"BEGIN {_SET_VALID_TO_VERSION_ID} RETURN NULL; END; "
+        "$$ LANGUAGE plpgsql;"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    DatasetExampleRevision.__table__,
+    "after_create",
+    DDL(  # type: ignore[no-untyped-call]
+        "CREATE TRIGGER dataset_example_revisions_valid_to_version_id "
+        "AFTER INSERT ON dataset_example_revisions "
+        "FOR EACH ROW EXECUTE FUNCTION set_dataset_example_revisions_valid_to_version_id();"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class Experiment(Base):
     __tablename__ = "experiments"
     id: Mapped[int] = mapped_column(primary_key=True)
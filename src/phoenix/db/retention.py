@@ -0,0 +1,234 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from time import monotonic
+from typing import Any, AsyncContextManager, Callable, List, Optional
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from phoenix.db import models
+from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.insertion.span import ClearProjectSpansEvent
+from phoenix.server.api.dataloaders import CacheForDataLoaders
+from phoenix.server.span_query_cache import SpanQueryCache
+from phoenix.utilities.span_store import SpanStore
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionEnforcer:
+    """
+    Deletes the traces of each project that fall outside of the project's
+    retention policy, i.e. traces older than its maximum age and the oldest
+    traces in excess of its maximum span count. Spans and annotations are
+    deleted along with their traces by the cascading foreign keys.
+
+    Traces are deleted oldest first in small batches, each in its own
+    transaction with a pause in between, so that the deletions never hold the
+    database for long and the bulk inserter can keep up with ingestion.
+    """
+
+    def __init__(
+        self,
+        db: Callable[[], AsyncContextManager[AsyncSession]],
+        dialect: SupportedSQLDialect,
+        *,
+        cache_for_dataloaders: Optional[CacheForDataLoaders] = None,
+        span_query_cache: Optional[SpanQueryCache] = None,
+        span_store: Optional[SpanStore] = None,
+        batch_size: int = 500,
+        sleep: float = 0.1,
+        interval: float = 60,
+        maintenance_interval: float = 3600,
+        vacuum_pages: int = 4096,
+        disabled: bool = False,
+    ) -> None:
+        """
+        :param db: A function to initiate a new database session.
+        :param dialect: The SQL dialect of the database.
+        :param batch_size: The maximum number of traces to delete per transaction.
+        :param sleep: The time to sleep between batches of deletions.
+        :param interval: The time to sleep once all projects are within their policies.
+        :param maintenance_interval: The minimum time between runs of database
+        maintenance after deletions, i.e. reclaiming free pages and updating the
+        query planner statistics on SQLite.
+        :param vacuum_pages: The maximum number of free pages to reclaim per
+        transaction on SQLite.
+        :param disabled: Whether to skip the enforcement, e.g. for a read-only server.
+        """
+        self._db = db
+        self._dialect = dialect
+        self._cache_for_dataloaders = cache_for_dataloaders
+        self._span_query_cache = span_query_cache
+        self._span_store = span_store
+        self._batch_size = batch_size
+        self._sleep = sleep
+        self._interval = interval
+        self._maintenance_interval = maintenance_interval
+        self._vacuum_pages = vacuum_pages
+        self._disabled = disabled
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self) -> None:
+        if self._disabled:
+            return
+        self._task = asyncio.create_task(self._enforce())
+
+    async def __aexit__(self, *args: Any) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _enforce(self) -> None:
+        needs_maintenance, last_maintained_at = False, monotonic()
+        while True:
+            try:
+                num_deleted = await self.delete_batch()
+            except Exception:
+                logger.exception("Failed to enforce retention policies")
+                num_deleted = 0
+            if num_deleted:
+                needs_maintenance = True
+                await asyncio.sleep(self._sleep)
+                continue
+            if needs_maintenance and monotonic() - last_maintained_at > self._maintenance_interval:
+                try:
+                    await self._maintain()
+                except Exception:
+                    logger.exception("Failed to run database maintenance")
+                needs_maintenance, last_maintained_at = False, monotonic()
+            await asyncio.sleep(self._interval)
+
+    async def delete_batch(self) -> int:
+        """
+        Deletes up to one batch of traces from each project outside of its
+        retention policy, and returns the total number of traces deleted.
+        """
+        async with self._db() as session:
+            projects = (
+                await session.execute(
+                    select(
+                        models.Project.id,
+                        models.Project.retention_max_age_days,
+                        models.Project.retention_max_span_count,
+                    ).where(
+                        models.Project.retention_max_age_days.isnot(None)
+                        | models.Project.retention_max_span_count.isnot(None)
+                    )
+                )
+            ).all()
+        num_deleted = 0
+        now = datetime.now(timezone.utc)
+        for project_rowid, max_age_days, max_span_count in projects:
+            async with self._db() as session:
+                trace_rowids: List[int] = []
+                if max_age_days is not None:
+                    trace_rowids = await _get_traces_older_than(
+                        session,
+                        project_rowid,
+                        now - timedelta(days=max_age_days),
+                        self._batch_size,
+                    )
+                if not trace_rowids and max_span_count is not None:
+                    trace_rowids = await _get_traces_in_excess_of(
+                        session,
+                        project_rowid,
+                        max_span_count,
+                        self._batch_size,
+                    )
+                if not trace_rowids:
+                    continue
+                await session.execute(delete(models.Trace).where(models.Trace.id.in_(trace_rowids)))
+            num_deleted += len(trace_rowids)
+            if (cache := self._cache_for_dataloaders) is not None:
+                cache.invalidate(ClearProjectSpansEvent(project_rowid=project_rowid))
+            if (span_query_cache := self._span_query_cache) is not None:
+                span_query_cache.invalidate(project_rowid)
+            if (span_store := self._span_store) is not None:
+                span_store.discard_traces(trace_rowids)
+        return num_deleted
+
+    async def _maintain(self) -> None:
+        # PostgreSQL reclaims the space of deleted rows with autovacuum, which
+        # keeps up because the rows are deleted in small batches.
+        if self._dialect is not SupportedSQLDialect.SQLITE:
+            return
+        # Free pages are only returned to the file system by databases created
+        # with `auto_vacuum = INCREMENTAL`, and the free list is otherwise left
+        # for reuse by later insertions.
+        while True:
+            async with self._db() as session:
+                if not await session.scalar(text("PRAGMA freelist_count")):
+                    break
+                if await session.scalar(text("PRAGMA auto_vacuum")) != _INCREMENTAL:
+                    break
+                await _execute_script(session, f"PRAGMA incremental_vacuum({self._vacuum_pages});")
+            await asyncio.sleep(self._sleep)
+        async with self._db() as session:
+            await _execute_script(session, "PRAGMA optimize;")
+
+
+_INCREMENTAL = 2
+
+
+async def _execute_script(session: AsyncSession, script: str) -> None:
+    # The sqlite3 module steps through a pragma statement only once when it's
+    # executed, which frees a single page in the case of `incremental_vacuum`.
+    connection = await (await session.connection()).get_raw_connection()
+    driver_connection = connection.driver_connection
+    assert driver_connection is not None
+    await driver_connection.executescript(script)
+
+
+async def _get_traces_older_than(
+    session: AsyncSession,
+    project_rowid: int,
+    cutoff: datetime,
+    limit: int,
+) -> List[int]:
+    return list(
+        await session.scalars(
+            select(models.Trace.id)
+            .where(models.Trace.project_rowid == project_rowid)
+            .where(models.Trace.start_time < cutoff)
+            .order_by(models.Trace.start_time)
+            .limit(limit)
+        )
+    )
+
+
+async def _get_traces_in_excess_of(
+    session: AsyncSession,
+    project_rowid: int,
+    max_span_count: int,
+    limit: int,
+) -> List[int]:
+    """
+    Returns the oldest traces of the project whose spans need to be deleted
+    for the project to have no more than the maximum number of spans.
+    """
+    # The span counts of the traces are summed rather than counting the spans,
+    # so that neither query has to read the spans of the project.
+    span_count = await session.scalar(
+        select(func.sum(models.Trace.span_count)).where(models.Trace.project_rowid == project_rowid)
+    )
+    if not span_count or (excess := span_count - max_span_count) <= 0:
+        return []
+    oldest_traces = (
+        await session.execute(
+            select(models.Trace.id, models.Trace.span_count)
+            .where(models.Trace.project_rowid == project_rowid)
+            .order_by(models.Trace.start_time)
+            .limit(limit)
+        )
+    ).all()
+    trace_rowids = []
+    for (trace_rowid, _), cumulative_span_count in zip(
+        oldest_traces, accumulate(span_count for _, span_count in oldest_traces)
+    ):
+        trace_rowids.append(trace_rowid)
+        if cumulative_span_count >= excess:
+            break
+    return trace_rowids
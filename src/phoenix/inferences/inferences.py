@@ -9,10 +9,12 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from pandas import DataFrame, Series, Timestamp, read_parquet
+import pyarrow as pa
+from pandas import DataFrame, Series, Timestamp
 from pandas.api.types import (
     is_numeric_dtype,
 )
+from pyarrow import feather
 from typing_extensions import TypeAlias
 
 from phoenix.config import GENERATED_INFERENCES_NAME_PREFIX, INFERENCES_DIR
@@ -67,7 +69,7 @@ class Inferences:
     >>> )
     """
 
-    _data_file_name: str = "data.parquet"
+    _data_file_name: str = "data.arrow"
     _schema_file_name: str = "schema.json"
     _is_persisted: bool = False
     _is_empty: bool = False
@@ -119,7 +121,9 @@ class Inferences:
     def from_name(cls, name: str) -> "Inferences":
         """Retrieves a dataset by name from the file system"""
         directory = INFERENCES_DIR / name
-        df = read_parquet(directory / cls._data_file_name)
+        # The data is stored uncompressed in the Arrow IPC file format, so it
+        # can be memory-mapped instead of being read and decoded.
+        df = feather.read_table(directory / cls._data_file_name, memory_map=True).to_pandas()
         with open(directory / cls._schema_file_name) as schema_file:
             schema_json = schema_file.read()
         schema = Schema.from_json(schema_json)
@@ -129,10 +133,10 @@ class Inferences:
         """writes the data and schema to disc"""
         directory = INFERENCES_DIR / self.name
         directory.mkdir(parents=True, exist_ok=True)
-        self.dataframe.to_parquet(
+        feather.write_feather(
+            pa.Table.from_pandas(self.dataframe),
             directory / self._data_file_name,
-            allow_truncated_timestamps=True,
-            coerce_timestamps="ms",
+            compression="uncompressed",
         )
         schema_json_data = self.schema.to_json()
         with open(directory / self._schema_file_name, "w+") as schema_file:
@@ -2,9 +2,10 @@ import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Iterable, Optional, Sequence, cast
+from typing import Any, Iterable, Optional, Sequence, Tuple, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
@@ -27,6 +28,15 @@ class BinningMethod(ABC):
     @abstractmethod
     def histogram(self, data: "pd.Series[Any]") -> Histogram: ...
 
+    def codes(self, data: "pd.Series[Any]") -> Tuple[npt.NDArray[np.intp], "pd.Index[Any]"]:
+        """Assigns each value to a bin, returning the bin position of each
+        value (or -1 if the value is dropped) along with the bins, such that
+        the counts of the positions make up the same histogram as
+        `histogram(data)`, except that unobserved bins may be included. This
+        is only possible when the bins don't depend on the data being binned.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support bin codes")
+
     @abstractmethod
     def segmented_summary(
         self,
@@ -92,6 +102,21 @@ class IntervalBinning(BinningMethod):
         cut = pd.cut(numeric_data, bins)
         return cut.value_counts(dropna=self.dropna)
 
+    def codes(self, data: "pd.Series[Any]") -> Tuple[npt.NDArray[np.intp], "pd.Index[Any]"]:
+        numeric_data = pd.to_numeric(data, errors="coerce")
+        bins = self.numeric_bins(numeric_data)
+        cut = pd.cut(numeric_data, bins)
+        codes = cut.cat.codes.to_numpy().astype(np.intp)
+        bin_codes = list(range(len(cut.cat.categories)))
+        if not self.dropna:
+            # Missing values (including values outside the intervals) are
+            # assigned to a bin of their own, which is placed last.
+            codes[codes < 0] = len(bin_codes)
+            bin_codes.append(-1)
+        return codes, pd.CategoricalIndex(
+            pd.Categorical.from_codes(bin_codes, cut.cat.categories),
+        )
+
     def segmented_summary(
         self,
         segment_column: Column,
@@ -214,6 +239,11 @@ class QuantileBinning(IntervalBinning):
             closed="left",
         )
 
+    def codes(self, data: "pd.Series[Any]") -> Tuple[npt.NDArray[np.intp], "pd.Index[Any]"]:
+        if self.bins is None:
+            raise NotImplementedError("quantile bins depend on the data being binned")
+        return super().codes(data)
+
     def __init__(
         self,
         reference_series: "pd.Series[Any]" = pd.Series(dtype=float),
@@ -267,6 +297,15 @@ class CategoricalBinning(BinningMethod):
             dropna=self.dropna,
         )
 
+    def codes(self, data: "pd.Series[Any]") -> Tuple[npt.NDArray[np.intp], "pd.Index[Any]"]:
+        codes, uniques = pd.factorize(data)
+        codes = codes.astype(np.intp)
+        bins = pd.Index(uniques)
+        if not self.dropna and (missing := codes < 0).any():
+            codes[missing] = len(bins)
+            bins = bins.insert(len(bins), np.nan)
+        return codes, bins
+
     def segmented_summary(
         self,
         segment_column: Column,
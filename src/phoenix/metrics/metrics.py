@@ -2,52 +2,102 @@ import math
 import warnings
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Callable, Union, cast
+from typing import Any, Callable, ClassVar, Tuple, Union, cast
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
-from scipy.spatial.distance import euclidean, jensenshannon
-from scipy.stats import entropy
 from typing_extensions import TypeAlias
 
 from phoenix.metrics import Metric
 
+from . import sketches
 from .mixins import (
+    Decomposable,
     DiscreteDivergence,
     DriftOperator,
+    Finalizer,
     NullaryOperator,
+    Partials,
     UnaryOperator,
     VectorOperator,
     ZeroInitialValue,
+    bucket_sums,
 )
 
 
 @dataclass(frozen=True)
-class Count(NullaryOperator, ZeroInitialValue, Metric):
+class Count(NullaryOperator, ZeroInitialValue, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> int:
         return len(dataframe)
 
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        counts = np.bincount(bucket_ids, minlength=n_buckets)
+        return counts[:, np.newaxis], lambda partials: int(partials[0])
+
 
 @dataclass(frozen=True)
-class CountNotNull(UnaryOperator, ZeroInitialValue, Metric):
+class CountNotNull(UnaryOperator, ZeroInitialValue, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> int:
         return self.operand(dataframe).count()
 
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        not_null = self.operand(dataframe).notna().to_numpy()
+        counts = np.bincount(bucket_ids[not_null], minlength=n_buckets)
+        return counts[:, np.newaxis], lambda partials: int(partials[0])
+
 
 @dataclass(frozen=True)
-class Sum(UnaryOperator, Metric):
+class Sum(UnaryOperator, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         numeric_data = pd.to_numeric(data, errors="coerce")
         return cast(float, numeric_data.sum())
 
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        data = self.operand(dataframe)
+        numeric_data = pd.to_numeric(data, errors="coerce").fillna(0)
+        sums = bucket_sums(numeric_data.to_numpy()[:, np.newaxis], bucket_ids, n_buckets)
+        return sums, lambda partials: float(partials[0])
+
 
 Vector: TypeAlias = Union[float, npt.NDArray[np.float64]]
 
 
+def _vector_sums_and_counts(
+    data: "pd.Series[Any]",
+    bucket_ids: npt.NDArray[np.intp],
+    n_buckets: int,
+    shape: int,
+) -> Partials:
+    """
+    Returns the sum of the non-null vectors in each bucket followed by their
+    count, i.e. an array of shape (n_buckets, vector_length + 1).
+    """
+    not_null = data.notna().to_numpy()
+    vectors = data.to_numpy()[not_null]
+    vectors = np.stack(vectors) if len(vectors) else np.zeros((0, shape))
+    ones = np.ones((len(vectors), 1))
+    return bucket_sums(np.hstack((vectors, ones)), bucket_ids[not_null], n_buckets)
+
+
 @dataclass(frozen=True)
-class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Metric):
+class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> Vector:
         data = self.operand(dataframe)
         return cast(
@@ -58,23 +108,66 @@ class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Metric):
             ),
         )
 
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        data = self.operand(dataframe)
+        partials = _vector_sums_and_counts(data, bucket_ids, n_buckets, self.shape)
+        return partials, lambda partials: partials[:-1]
+
 
 @dataclass(frozen=True)
-class Mean(UnaryOperator, Metric):
+class Mean(UnaryOperator, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         numeric_data = pd.to_numeric(data, errors="coerce")
         return numeric_data.mean()
 
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        data = self.operand(dataframe)
+        numeric_data = pd.to_numeric(data, errors="coerce")
+        partials = bucket_sums(
+            np.column_stack((numeric_data.fillna(0), numeric_data.notna())),
+            bucket_ids,
+            n_buckets,
+        )
+        return partials, lambda partials: partials[0] / partials[1] if partials[1] else np.nan
+
+
+def _vector_mean(partials: npt.NDArray[np.float64]) -> Vector:
+    """
+    Divides the vector sum by the count, which is the last element.
+    """
+    count = partials[-1]
+    return cast(Vector, partials[:-1] / count if count else np.nan)
+
 
 @dataclass(frozen=True)
-class VectorMean(UnaryOperator, VectorOperator, Metric):
+class VectorMean(UnaryOperator, VectorOperator, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> Vector:
         data = self.operand(dataframe)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=RuntimeWarning)
             return cast(Vector, np.mean(data.dropna()))
 
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        data = self.operand(dataframe)
+        partials = _vector_sums_and_counts(data, bucket_ids, n_buckets, self.shape)
+        return partials, _vector_mean
+
 
 @dataclass(frozen=True)
 class Min(UnaryOperator, Metric):
@@ -140,14 +233,124 @@ class Quantile(UnaryOperator, Metric):
             )
 
 
+def _calc_from_partials(metric: Decomposable, dataframe: pd.DataFrame) -> Any:
+    """
+    Computes a decomposable metric by treating all rows as a single bucket.
+    """
+    partials, finalize = metric.decompose(
+        dataframe,
+        np.zeros(len(dataframe), dtype=np.intp),
+        1,
+    )
+    return finalize(partials[0])
+
+
 @dataclass(frozen=True)
-class EuclideanDistance(DriftOperator, VectorOperator):
+class ApproximateQuantile(UnaryOperator, Decomposable, Metric):
+    """
+    Approximates a quantile with a DDSketch, i.e. a histogram with
+    logarithmically sized bins. For any value (other than zero) at the
+    specified rank, the approximation is within the relative accuracy of
+    that value, e.g. 1% by default. Unlike Quantile, no interpolation is
+    made between the two values closest to the rank, and non-finite values
+    are ignored.
+
+    See https://arxiv.org/abs/1908.10693
+    """
+
+    probability: float = field(default=0.5)
+    relative_accuracy: float = field(default=0.01)
+
+    def __post_init__(self) -> None:
+        if not (0 <= self.probability <= 1):
+            raise ValueError(
+                "invalid quantile probability; "
+                "must be between 0 and 1 inclusive; "
+                f"got: {self.probability}"
+            )
+        if not (0 < self.relative_accuracy < 1):
+            raise ValueError(
+                "invalid relative accuracy; "
+                "must be between 0 and 1 exclusive; "
+                f"got: {self.relative_accuracy}"
+            )
+
+    def calc(self, dataframe: pd.DataFrame) -> float:
+        return cast(float, _calc_from_partials(self, dataframe))
+
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        data = self.operand(dataframe)
+        codes, bin_values = sketches.relative_error_bins(data, self.relative_accuracy)
+        n_bins = len(bin_values)
+        binned = codes >= 0
+        counts = np.bincount(
+            bucket_ids[binned] * n_bins + codes[binned],
+            minlength=n_buckets * n_bins,
+        ).reshape(n_buckets, n_bins)
+        return counts, lambda partials: sketches.quantile_from_counts(
+            partials,
+            bin_values,
+            self.probability,
+        )
+
+
+@dataclass(frozen=True)
+class ApproximateCardinality(UnaryOperator, Decomposable, Metric):
+    """
+    Approximates the number of distinct values with HyperLogLog, using 2 to
+    the power of `precision` registers. The relative standard error is about
+    1.04 divided by the square root of the number of registers, e.g. 1.6% for
+    the default precision of 12. Like Cardinality, floating-point data are
+    not counted and return NaN.
+
+    See https://en.wikipedia.org/wiki/HyperLogLog
+    """
+
+    precision: int = field(default=12)
+    merge: ClassVar[np.ufunc] = np.maximum
+
+    def __post_init__(self) -> None:
+        if not (4 <= self.precision <= 16):
+            raise ValueError(
+                "invalid precision; "
+                "must be between 4 and 16 inclusive; "
+                f"got: {self.precision}"
+            )
+
+    def calc(self, dataframe: pd.DataFrame) -> float:
+        return cast(float, _calc_from_partials(self, dataframe))
+
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        data = self.operand(dataframe)
+        if data.dtype.kind == "f":
+            return np.zeros((n_buckets, 0)), lambda _: np.nan
+        positions, ranks = sketches.hyperloglog_registers(data, self.precision)
+        hashed = positions >= 0
+        registers = np.zeros((n_buckets, 1 << self.precision), dtype=np.uint8)
+        np.maximum.at(registers, (bucket_ids[hashed], positions[hashed]), ranks[hashed])
+        return registers, sketches.hyperloglog_estimate
+
+
+@dataclass(frozen=True)
+class EuclideanDistance(DriftOperator, VectorOperator, Decomposable):
     @cached_property
     def reference_value(self) -> Vector:
         data = self.operand(self.reference_data)
         return cast(Vector, np.mean(data.dropna()))
 
     def calc(self, dataframe: pd.DataFrame) -> float:
+        from scipy.spatial.distance import euclidean
+
         if dataframe.empty or (
             isinstance(self.reference_value, float) and not math.isfinite(self.reference_value)
         ):
@@ -161,6 +364,26 @@ class EuclideanDistance(DriftOperator, VectorOperator):
             ),
         )
 
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        data = self.operand(dataframe)
+        partials = _vector_sums_and_counts(data, bucket_ids, n_buckets, self.shape)
+        return partials, self._distance_from_reference
+
+    def _distance_from_reference(self, partials: npt.NDArray[np.float64]) -> float:
+        from scipy.spatial.distance import euclidean
+
+        mean = _vector_mean(partials)
+        if isinstance(mean, float) or (
+            isinstance(self.reference_value, float) and not math.isfinite(self.reference_value)
+        ):
+            return np.nan
+        return cast(float, euclidean(mean, self.reference_value))
+
 
 Distribution: TypeAlias = "pd.Series[float]"
 Divergence: TypeAlias = Callable[[Distribution, Distribution], float]
@@ -204,6 +427,8 @@ class PSI(DiscreteDivergence):
         divergence: float
             Population stability index (PSI) between pk and qk
         """
+        from scipy.stats import entropy
+
         return 2 * symmetrized(entropy)(pk, qk)
 
 
@@ -229,6 +454,8 @@ class KLDivergence(DiscreteDivergence):
         divergence: float
             Kullback-Leibler divergence of pk over qk
         """
+        from scipy.stats import entropy
+
         return cast(float, entropy(pk, qk))
 
 
@@ -265,4 +492,6 @@ class JSDistance(DiscreteDivergence):
         divergence: float
             Jensen-Shannon distance between pk and qk
         """
+        from scipy.spatial.distance import jensenshannon
+
         return cast(float, jensenshannon(pk, qk))
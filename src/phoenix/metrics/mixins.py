@@ -8,11 +8,23 @@ import collections
 import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, fields, replace
-from functools import cached_property
+from functools import cached_property, partial
 from itertools import repeat
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
@@ -59,6 +71,69 @@ class UnaryOperator(Metric, ABC):
         return [self.operand]
 
 
+Partials: TypeAlias = npt.NDArray[Any]
+Finalizer: TypeAlias = Callable[[npt.NDArray[Any]], Any]
+
+
+@dataclass(frozen=True)
+class Decomposable(Metric, ABC):
+    """
+    A decomposable metric can be computed from partial aggregates that are
+    merged by an associative operation, e.g. the mean is computed from the
+    sum and the count, which are merged by addition. When the rows are
+    partitioned into buckets, the partial aggregates of each bucket are
+    computed only once, and the metric value for any contiguous run of buckets
+    can be derived by merging the partial aggregates (or, in the case of
+    addition, from the prefix sums of the partial aggregates).
+    """
+
+    merge: ClassVar[np.ufunc] = np.add
+    """The operation merging the partial aggregates of two sets of rows."""
+
+    @abstractmethod
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        """
+        Parameters
+        ----------
+        dataframe: pandas DataFrame
+            The input rows.
+        bucket_ids: numpy array, shape = (n_rows,)
+            The bucket to which each row belongs.
+        n_buckets: int
+            The total number of buckets.
+
+        Returns
+        -------
+        partials: numpy array, shape = (n_buckets, n_partials)
+            The additive partial aggregates of each bucket.
+        finalizer: callable
+            A function that takes partial aggregates merged over a set of
+            buckets, i.e. an array of shape (n_partials,), and returns the
+            metric value for the rows in those buckets.
+        """
+        ...
+
+
+def bucket_sums(
+    values: npt.ArrayLike,
+    bucket_ids: npt.NDArray[np.intp],
+    n_buckets: int,
+) -> Partials:
+    """
+    Sums the rows of a 2-D array by bucket, returning an array of shape
+    (n_buckets, n_columns).
+    """
+    values = np.asarray(values, dtype=float)
+    sums = np.zeros((n_buckets, values.shape[1]))
+    np.add.at(sums, bucket_ids, values)
+    return sums
+
+
 Actual: TypeAlias = "pd.Series[Any]"
 Predicted: TypeAlias = "pd.Series[Any]"
 
@@ -179,7 +254,7 @@ class Discretizer(ABC):
 
 
 @dataclass(frozen=True)
-class DiscreteDivergence(Discretizer, DriftOperator, ABC):
+class DiscreteDivergence(Discretizer, DriftOperator, Decomposable, ABC):
     """See https://en.wikipedia.org/wiki/Divergence_(statistics%29"""
 
     normalize: Normalizer = AdditiveSmoothing(pseudocount=1)
@@ -209,9 +284,31 @@ class DiscreteDivergence(Discretizer, DriftOperator, ABC):
 
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
+        return self._divergence_from_reference(self.histogram(data))
+
+    def decompose(
+        self,
+        dataframe: pd.DataFrame,
+        bucket_ids: npt.NDArray[np.intp],
+        n_buckets: int,
+    ) -> Tuple[Partials, Finalizer]:
+        data = self.operand(dataframe)
+        codes, bins = self.binning_method.codes(data)
+        n_bins = len(bins)
+        binned = codes >= 0
+        counts = np.bincount(
+            bucket_ids[binned] * n_bins + codes[binned],
+            minlength=n_buckets * n_bins,
+        ).reshape(n_buckets, n_bins)
+        return counts, partial(self._divergence_from_counts, bins)
+
+    def _divergence_from_counts(self, bins: "pd.Index[Any]", counts: npt.NDArray[Any]) -> float:
+        return self._divergence_from_reference(pd.Series(counts, index=bins))
+
+    def _divergence_from_reference(self, histogram: Histogram) -> float:
         # outer-join histograms and fill in zeros for missing categories
         merged_counts = pd.merge(
-            self.histogram(data).rename("primary_histogram"),
+            histogram.rename("primary_histogram"),
             self.reference_histogram,
             left_index=True,
             right_index=True,
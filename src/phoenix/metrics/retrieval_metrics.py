@@ -3,7 +3,6 @@ from typing import Iterable, Optional, cast
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import ndcg_score
 
 
 @dataclass(frozen=True)
@@ -50,6 +49,8 @@ class RetrievalMetrics:
         discounting. If `k` is None, it's set to the length of the scores. If
         `k` < 1, return 0.0.
         """
+        from sklearn.metrics import ndcg_score
+
         if self.has_nan:
             return np.nan
         if k is None:
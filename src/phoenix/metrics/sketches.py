@@ -0,0 +1,124 @@
+"""
+Sketches are compact summaries of data that answer approximate queries with
+bounded errors. The summaries of disjoint sets of rows can be merged without
+revisiting the rows, so a time series can summarize each time bucket once,
+and then merge the summaries for each evaluation window.
+"""
+
+import math
+from typing import Any, Tuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+
+def relative_error_bins(
+    data: "pd.Series[Any]",
+    relative_accuracy: float,
+) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+    """
+    Assigns each value to a logarithmically sized bin, such that any value in
+    a bin is within the relative accuracy of the bin's representative value.
+    This is the bin mapping of the DDSketch, and the counts of the bins make up
+    the sketch. Missing and non-finite values are assigned -1.
+
+    See https://arxiv.org/abs/1908.10693
+
+    Returns
+    -------
+    codes: numpy array, shape = (n_values,)
+        The bin position of each value.
+    bin_values: numpy array, shape = (n_bins,)
+        The representative value of each bin, in ascending order.
+
+    Example
+    -------
+    >>> import pandas as pd
+    >>> codes, bin_values = relative_error_bins(pd.Series([-1, 0, 100, 101, None]), 0.01)
+    >>> codes
+    array([ 0,  1,  2,  2, -1])
+    >>> bin_values.round(2)
+    array([ -0.99,   0.  , 100.49])
+    """
+    values = pd.to_numeric(data, errors="coerce").to_numpy(dtype=float)
+    finite = np.isfinite(values)
+    gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+    magnitudes = np.abs(values[finite])
+    nonzero = magnitudes > 0
+    keys = np.zeros(len(magnitudes))
+    keys[nonzero] = np.ceil(np.log(magnitudes[nonzero]) / math.log(gamma))
+    representatives = np.sign(values[finite]) * 2 * np.power(gamma, keys) / (gamma + 1)
+    bin_values, inverse = np.unique(representatives, return_inverse=True)
+    codes = np.full(len(values), -1, dtype=np.intp)
+    codes[finite] = inverse.ravel()
+    return codes, bin_values
+
+
+def quantile_from_counts(
+    counts: npt.NDArray[Any],
+    bin_values: npt.NDArray[np.float64],
+    probability: float,
+) -> float:
+    """
+    Returns the representative value of the bin containing the value at rank
+    `probability * (n - 1)`, where n is the total count.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> quantile_from_counts(np.array([1, 2, 1]), np.array([1.0, 2.0, 3.0]), 0.5)
+    2.0
+    """
+    total = counts.sum()
+    if not total:
+        return np.nan
+    rank = probability * (total - 1)
+    return float(bin_values[np.searchsorted(np.cumsum(counts), rank, side="right")])
+
+
+def hyperloglog_registers(
+    data: "pd.Series[Any]",
+    precision: int,
+) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.uint8]]:
+    """
+    Hashes each non-missing value to a HyperLogLog register, returning the
+    register position of each value along with the number of leading zeros
+    plus one of the remaining hash bits. The maximum of these by register
+    makes up the sketch. Missing values are assigned to register -1.
+
+    See https://en.wikipedia.org/wiki/HyperLogLog
+    """
+    not_null = data.notna().to_numpy()
+    hashes = pd.util.hash_pandas_object(data[not_null], index=False).to_numpy()
+    n_bits = 64 - precision
+    remainders = hashes & np.uint64((1 << n_bits) - 1)
+    # The bit lengths are found via floating-point exponents, but float64 can
+    # only represent 53 bits exactly, so the high and low bits are separated.
+    high = (remainders >> np.uint64(11)).astype(float)
+    low = (remainders & np.uint64(0x7FF)).astype(float)
+    bit_lengths = np.where(high > 0, np.frexp(high)[1] + 11, np.frexp(low)[1])
+    positions = np.full(len(not_null), -1, dtype=np.intp)
+    positions[not_null] = (hashes >> np.uint64(n_bits)).astype(np.intp)
+    ranks = np.zeros(len(not_null), dtype=np.uint8)
+    ranks[not_null] = n_bits - bit_lengths + 1
+    return positions, ranks
+
+
+def hyperloglog_estimate(registers: npt.NDArray[Any]) -> float:
+    """
+    Estimates the number of distinct values from HyperLogLog registers, with
+    linear counting as the correction for small cardinalities.
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> hyperloglog_estimate(np.zeros(16))
+    0.0
+    """
+    m = len(registers)
+    alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+    estimate = alpha * m * m / np.sum(np.power(2.0, -registers.astype(float)))
+    if estimate <= 2.5 * m and (n_zeros := np.count_nonzero(registers == 0)):
+        estimate = m * math.log(m / n_zeros)
+    return float(round(estimate))
@@ -1,12 +1,19 @@
+import logging
+import warnings
 from datetime import datetime, timedelta, timezone
 from functools import partial
-from itertools import accumulate, repeat
-from typing import Callable, Iterable, Iterator, Tuple, cast
+from itertools import accumulate, repeat, takewhile
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, cast
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
 from phoenix.metrics import Metric, multi_calculate
+from phoenix.metrics.mixins import Decomposable
+
+logger = logging.getLogger(__name__)
 
 
 def timeseries(
@@ -62,8 +69,22 @@ def _aggregator(
 ) -> pd.DataFrame:
     """
     Calls groupby on the dataframe and apply metric calculations on each group.
+    When all metrics are decomposable, the time series is instead derived from
+    prefix sums of partial aggregates, so that each row is aggregated only once.
     """
     calcs = tuple(metrics)
+    if calcs and all(isinstance(calc, Decomposable) for calc in calcs):
+        try:
+            return _decomposed_results(
+                calcs=cast(Tuple[Decomposable, ...], calcs),
+                dataframe=dataframe,
+                start_time=start_time,
+                end_time=end_time,
+                evaluation_window=evaluation_window,
+                sampling_interval=sampling_interval,
+            )
+        except (TypeError, ValueError, NotImplementedError) as exc:
+            logger.warning(exc, exc_info=True)
     return pd.concat(
         _results(
             calcs=calcs,
@@ -194,3 +215,172 @@ def _results(
             )
 
         yield res.loc[result_slice, :]
+
+
+def _decomposed_results(
+    calcs: Iterable[Decomposable],
+    dataframe: pd.DataFrame,
+    start_time: datetime,
+    end_time: datetime,
+    evaluation_window: timedelta,
+    sampling_interval: timedelta,
+) -> pd.DataFrame:
+    """
+    Returns metric results for each data point in time series, where each data
+    point is labeled by the end instant of its evaluation window, and the
+    points are enumerated backward from the end time by the sampling interval.
+    The output has the same points as the grouper-based calculation, i.e.
+    evaluation windows without any rows are omitted, unless they lie between
+    non-empty windows of the same grouper.
+
+    The start and end instants of all evaluation windows are collected as the
+    edges partitioning the time range into buckets, so each evaluation window
+    is a contiguous run of buckets. Each metric computes its partial aggregates
+    for each bucket, which are then merged for each evaluation window.
+    """
+    if not sampling_interval:
+        return pd.DataFrame()
+    timestamps: List[datetime] = list(
+        takewhile(
+            lambda t: start_time <= t,  # type: ignore
+            accumulate(repeat(-sampling_interval), initial=end_time),  # type: ignore
+        )
+    )
+    if not timestamps:
+        return pd.DataFrame()
+    edges = pd.DatetimeIndex(
+        sorted({t for stop in timestamps for t in (stop - evaluation_window, stop)})
+    )
+    window_starts = edges.searchsorted([t - evaluation_window for t in timestamps])
+    window_stops = edges.searchsorted(timestamps)
+    row_edges = cast(pd.DatetimeIndex, dataframe.index).searchsorted(edges)
+    n_buckets = len(edges) - 1
+    bucket_ids = np.repeat(np.arange(n_buckets), np.diff(row_edges))
+    rows = dataframe.iloc[row_edges[0] : row_edges[-1], :]
+    row_counts = row_edges[window_stops] - row_edges[window_starts]
+    is_included = _is_included(
+        timestamps,
+        row_counts,
+        cast(pd.DatetimeIndex, dataframe.index),
+        start_time,
+        end_time,
+        evaluation_window,
+        sampling_interval,
+    )
+    windows = [
+        (timestamp, start, stop)
+        for timestamp, start, stop, included in zip(
+            timestamps, window_starts, window_stops, is_included
+        )
+        if included
+    ]
+    if not windows:
+        return pd.DataFrame()
+    results = {}
+    for calc in calcs:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            partials, finalize = calc.decompose(rows, bucket_ids, n_buckets)
+            totals = _merge_windows(
+                calc.merge,
+                partials,
+                np.array([start for _, start, _ in windows]),
+                np.array([stop for *_, stop in windows]),
+            )
+            results[calc.id()] = pd.Series(
+                [_finalize(calc, finalize, total) for total in totals],
+            )
+    return pd.DataFrame(results).set_axis(
+        pd.DatetimeIndex([timestamp for timestamp, *_ in windows]),
+        axis=0,
+    )
+
+
+def _is_included(
+    timestamps: List[datetime],
+    row_counts: npt.NDArray[np.intp],
+    time_index: pd.DatetimeIndex,
+    start_time: datetime,
+    end_time: datetime,
+    evaluation_window: timedelta,
+    sampling_interval: timedelta,
+) -> npt.NDArray[np.bool_]:
+    """
+    Returns whether each data point, enumerated backward from the end time, is
+    part of the output of the grouper-based calculation, so that both paths
+    return the same points. Each grouper (see `_groupers`) yields the windows
+    from its first non-empty window to its last, including the empty windows
+    in between. When the evaluation window is divisible by the sampling
+    interval, the grouper starting at the k-th point covers every n-th point
+    after it, where n is the ratio of the two, and its rows begin one
+    evaluation window before the start time, so a non-empty window below the
+    start time includes the empty ones above it. Otherwise, each grouper
+    covers only the one window ending at its own point.
+    """
+    n_points = len(timestamps)
+    total_time_span = end_time - start_time
+    divisible = evaluation_window % sampling_interval == timedelta()
+    if divisible:
+        period = evaluation_window // sampling_interval
+        max_offset = min(evaluation_window, total_time_span)
+    else:
+        period = n_points
+        max_offset = total_time_span
+    is_included = np.zeros(n_points, dtype=bool)
+    for offset in range(min(period, n_points)):
+        if offset * sampling_interval >= max_offset:
+            break
+        ids = np.arange(offset, n_points, period)
+        (non_empty,) = np.nonzero(row_counts[ids])
+        if not len(non_empty):
+            continue
+        first, last = non_empty[0], non_empty[-1]
+        if divisible:
+            # The rows before the earliest window of the grouper.
+            row_start, row_stop = row_interval_from_sorted_time_index(
+                time_index=time_index,
+                time_start=start_time - evaluation_window,
+                time_stop=timestamps[ids[-1]] - evaluation_window,
+            )
+            if row_start < row_stop:
+                last = len(ids) - 1
+        is_included[ids[first : last + 1]] = True
+    return is_included
+
+
+def _merge_windows(
+    merge: np.ufunc,
+    partials: npt.NDArray[Any],
+    starts: npt.NDArray[np.intp],
+    stops: npt.NDArray[np.intp],
+) -> npt.NDArray[Any]:
+    """
+    Merges the partial aggregates of the buckets in each (non-empty) window,
+    i.e. from the start bucket to the stop bucket, exclusive. For addition,
+    the totals are the differences between two prefix sums. Otherwise, the
+    buckets are merged by `reduceat` at the start and stop of each window,
+    and the results at the stops (which span the gaps between windows) are
+    discarded.
+    """
+    if merge is np.add:
+        prefix_sums = np.concatenate(
+            (np.zeros((1, *partials.shape[1:])), np.cumsum(partials, axis=0)),
+        )
+        return cast(npt.NDArray[Any], prefix_sums[stops] - prefix_sums[starts])
+    # `reduceat` requires the indices to be less than the length, so a filler
+    # row is appended to accommodate the stop of the last bucket.
+    padded = np.concatenate((partials, np.zeros_like(partials[:1])))
+    indices = np.column_stack((starts, stops)).ravel()
+    return cast(npt.NDArray[Any], merge.reduceat(padded, indices, axis=0)[::2])
+
+
+def _finalize(
+    calc: Metric,
+    finalize: Callable[[Any], Any],
+    partials: Any,
+) -> Any:
+    try:
+        return finalize(partials)
+    except (TypeError, ValueError, NotImplementedError) as exc:
+        logger.warning(exc, exc_info=True)
+        return calc.initial_value
@@ -1,15 +1,25 @@
-from dataclasses import asdict, dataclass
-from typing import List, Set
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
+from typing import Hashable, List
 
 import numpy as np
 import numpy.typing as npt
-from hdbscan import HDBSCAN
+from cachetools import LRUCache
 from typing_extensions import TypeAlias
 
 RowIndex: TypeAlias = int
-RawCluster: TypeAlias = Set[RowIndex]
+RawCluster: TypeAlias = npt.NDArray[np.intp]
 Matrix: TypeAlias = npt.NDArray[np.float64]
 
+_SingleLinkageTree: TypeAlias = npt.NDArray[np.float64]
+
+# The single linkage tree depends only on the coordinates and `min_samples`,
+# so re-clustering the same projections with a different `min_cluster_size`
+# or `cluster_selection_epsilon` only has to re-condense the cached tree.
+_single_linkage_trees: "LRUCache[Hashable, _SingleLinkageTree]" = LRUCache(maxsize=16)
+_single_linkage_trees_lock = Lock()
+
 
 @dataclass(frozen=True)
 class Hdbscan:
@@ -18,9 +28,49 @@ class Hdbscan:
     cluster_selection_epsilon: float = 0.0
 
     def find_clusters(self, mat: Matrix) -> List[RawCluster]:
-        cluster_ids: npt.NDArray[np.int_] = HDBSCAN(**asdict(self)).fit_predict(mat)
-        ans: List[RawCluster] = [set() for _ in range(np.max(cluster_ids) + 1)]
-        for row_idx, cluster_id in enumerate(cluster_ids):
-            if cluster_id > -1:
-                ans[cluster_id].add(row_idx)
-        return ans
+        """
+        Returns the row indices of the members of each cluster, in ascending
+        order. Rows that are noise are excluded from all clusters.
+        """
+        cluster_ids = self._cluster_ids(np.ascontiguousarray(mat, dtype=np.float64))
+        row_indices = np.argsort(cluster_ids, kind="stable")
+        boundaries = np.searchsorted(
+            cluster_ids[row_indices],
+            np.arange(np.max(cluster_ids, initial=-1) + 2),
+        )
+        return np.split(row_indices, boundaries[:-1])[1:]
+
+    def _cluster_ids(self, mat: Matrix) -> npt.NDArray[np.intp]:
+        min_samples = int(self.min_samples)
+        try:
+            # Caching the tree relies on the private API of hdbscan.
+            from hdbscan.hdbscan_ import _tree_to_labels, hdbscan
+        except ImportError:
+            from hdbscan import HDBSCAN
+
+            clusterer = HDBSCAN(
+                min_cluster_size=self.min_cluster_size,
+                min_samples=min_samples,
+                cluster_selection_epsilon=self.cluster_selection_epsilon,
+            )
+            return np.asarray(clusterer.fit(mat).labels_, dtype=np.intp)
+        key = (min_samples, mat.shape, sha256(mat.data).digest())
+        with _single_linkage_trees_lock:
+            tree = _single_linkage_trees.get(key)
+        if tree is None:
+            labels, *_, tree, _ = hdbscan(
+                mat,
+                min_cluster_size=self.min_cluster_size,
+                min_samples=min_samples,
+                cluster_selection_epsilon=self.cluster_selection_epsilon,
+            )
+            with _single_linkage_trees_lock:
+                _single_linkage_trees[key] = tree
+            return np.asarray(labels, dtype=np.intp)
+        labels, *_ = _tree_to_labels(
+            mat,
+            tree,
+            min_cluster_size=self.min_cluster_size,
+            cluster_selection_epsilon=self.cluster_selection_epsilon,
+        )
+        return np.asarray(labels, dtype=np.intp)
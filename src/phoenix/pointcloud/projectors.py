@@ -1,17 +1,10 @@
-import warnings
 from dataclasses import asdict, dataclass
-from typing import cast
+from typing import Any, cast
 
 import numpy as np
 import numpy.typing as npt
 from typing_extensions import TypeAlias
 
-with warnings.catch_warnings():
-    from numba.core.errors import NumbaWarning
-
-    warnings.simplefilter("ignore", category=NumbaWarning)
-    from umap import UMAP
-
 Matrix: TypeAlias = npt.NDArray[np.float64]
 
 
@@ -32,4 +25,17 @@ class Umap:
             # is greater or equal to the number of samples.
             # see https://github.com/lmcinnes/umap/issues/201#issuecomment-462097103
             config["init"] = "random"
-        return _center(UMAP(**config).fit_transform(mat))
+        return _center(_umap()(**config).fit_transform(mat))
+
+
+def _umap() -> Any:
+    # UMAP is imported on first use, because importing it also compiles
+    # numba functions, which takes seconds.
+    import warnings
+
+    with warnings.catch_warnings():
+        from numba.core.errors import NumbaWarning
+
+        warnings.simplefilter("ignore", category=NumbaWarning)
+        from umap import UMAP
+    return UMAP
@@ -33,7 +33,11 @@ from phoenix.server.api.dataloaders import (
     TokenCountDataLoader,
     TraceEvaluationsDataLoader,
     TraceRowIdsDataLoader,
+    TraceSummariesDataLoader,
 )
+from phoenix.server.project_updates import ProjectUpdateBroker
+from phoenix.server.span_query_cache import SpanQueryCache
+from phoenix.utilities.span_store import SpanStore
 
 
 @dataclass
@@ -58,6 +62,7 @@ class DataLoaders:
     token_counts: TokenCountDataLoader
     trace_evaluations: TraceEvaluationsDataLoader
     trace_row_ids: TraceRowIdsDataLoader
+    trace_summaries: TraceSummariesDataLoader
     project_by_name: ProjectByNameDataLoader
 
 
@@ -69,6 +74,7 @@ class Context:
     request: Union[Request, WebSocket]
     response: Optional[Response]
     db: Callable[[], AsyncContextManager[AsyncSession]]
+    read_db: Callable[[], AsyncContextManager[AsyncSession]]
     data_loaders: DataLoaders
     cache_for_dataloaders: Optional[CacheForDataLoaders]
     model: Model
@@ -76,3 +82,7 @@ class Context:
     corpus: Optional[Model] = None
     streaming_last_updated_at: Callable[[ProjectRowId], Optional[datetime]] = lambda _: None
     read_only: bool = False
+    span_query_cache: Optional[SpanQueryCache] = None
+    project_update_broker: Optional[ProjectUpdateBroker] = None
+    span_store: Optional[SpanStore] = None
+    has_span_full_text_index: bool = False
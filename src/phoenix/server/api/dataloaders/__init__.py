@@ -32,6 +32,7 @@ from .span_projects import SpanProjectsDataLoader
 from .token_counts import TokenCountCache, TokenCountDataLoader
 from .trace_evaluations import TraceEvaluationsDataLoader
 from .trace_row_ids import TraceRowIdsDataLoader
+from .trace_summaries import TraceSummariesDataLoader
 
 __all__ = [
     "CacheForDataLoaders",
@@ -55,6 +56,7 @@ __all__ = [
     "TokenCountDataLoader",
     "TraceEvaluationsDataLoader",
     "TraceRowIdsDataLoader",
+    "TraceSummariesDataLoader",
     "ProjectByNameDataLoader",
 ]
 
@@ -7,12 +7,13 @@ from typing import (
     Union,
 )
 
-from sqlalchemy import Integer, case, func, literal, or_, select, union
+from sqlalchemy import Integer, and_, case, literal, or_, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.dataloader import DataLoader
 from typing_extensions import TypeAlias
 
 from phoenix.db import models
+from phoenix.db.helpers import is_latest_revision
 from phoenix.server.api.types.DatasetExampleRevision import DatasetExampleRevision
 
 ExampleID: TypeAlias = int
@@ -38,34 +39,14 @@ class DatasetExampleRevisionsDataLoader(DataLoader[Key, Result]):
                 for example_id, version_id in keys
             )
         ).subquery()
-        revision_ids = (
+        query = (
             select(
                 keys_subquery.c.example_id,
                 keys_subquery.c.version_id,
-                func.max(models.DatasetExampleRevision.id).label("revision_id"),
-            )
-            .select_from(keys_subquery)
-            .join(
-                models.DatasetExampleRevision,
-                onclause=keys_subquery.c.example_id
-                == models.DatasetExampleRevision.dataset_example_id,
-            )
-            .where(
-                or_(
-                    keys_subquery.c.version_id.is_(None),
-                    models.DatasetExampleRevision.dataset_version_id <= keys_subquery.c.version_id,
-                )
-            )
-            .group_by(keys_subquery.c.example_id, keys_subquery.c.version_id)
-        ).subquery()
-        query = (
-            select(
-                revision_ids.c.example_id,
-                revision_ids.c.version_id,
                 case(
                     (
                         or_(
-                            revision_ids.c.version_id.is_(None),
+                            keys_subquery.c.version_id.is_(None),
                             models.DatasetVersion.id.is_not(None),
                         ),
                         True,
@@ -74,16 +55,23 @@ class DatasetExampleRevisionsDataLoader(DataLoader[Key, Result]):
                 ).label("is_valid_version"),  # check that non-null versions exist
                 models.DatasetExampleRevision,
             )
-            .select_from(revision_ids)
+            .select_from(keys_subquery)
             .join(
                 models.DatasetExampleRevision,
-                onclause=revision_ids.c.revision_id == models.DatasetExampleRevision.id,
+                onclause=keys_subquery.c.example_id
+                == models.DatasetExampleRevision.dataset_example_id,
             )
             .join(
                 models.DatasetVersion,
-                onclause=revision_ids.c.version_id == models.DatasetVersion.id,
+                onclause=keys_subquery.c.version_id == models.DatasetVersion.id,
                 isouter=True,  # keep rows where the version id is null
             )
+            .where(
+                or_(
+                    and_(keys_subquery.c.version_id.is_(None), is_latest_revision()),
+                    is_latest_revision(keys_subquery.c.version_id),
+                )
+            )
             .where(models.DatasetExampleRevision.revision_kind != "DELETE")
         )
         async with self._db() as session:
@@ -79,6 +79,7 @@ class DocumentEvaluationSummaryDataLoader(DataLoader[Key, Result]):
         self,
         db: Callable[[], AsyncContextManager[AsyncSession]],
         cache_map: Optional[AbstractCache[Key, Result]] = None,
+        search_text_index: bool = False,
     ) -> None:
         super().__init__(
             load_fn=self._load_fn,
@@ -86,6 +87,7 @@ class DocumentEvaluationSummaryDataLoader(DataLoader[Key, Result]):
             cache_map=cache_map,
         )
         self._db = db
+        self._search_text_index = search_text_index
 
     async def _load_fn(self, keys: List[Key]) -> List[Result]:
         results: List[Result] = [DEFAULT_VALUE] * len(keys)
@@ -99,7 +101,9 @@ class DocumentEvaluationSummaryDataLoader(DataLoader[Key, Result]):
         for segment, params in arguments.items():
             async with self._db() as session:
                 dialect = SupportedSQLDialect(session.bind.dialect.name)
-                stmt = _get_stmt(dialect, segment, *params.keys())
+                stmt = _get_stmt(
+                    dialect, segment, *params.keys(), search_text_index=self._search_text_index
+                )
                 data = await session.stream(stmt)
                 async for eval_name, group in groupby(data, lambda d: d.name):
                     metrics_collection = []
@@ -123,6 +127,7 @@ def _get_stmt(
     dialect: SupportedSQLDialect,
     segment: Segment,
     *eval_names: Param,
+    search_text_index: bool = False,
 ) -> Select[Any]:
     project_rowid, (start_time, end_time), filter_condition = segment
     mda = models.DocumentAnnotation
@@ -147,6 +152,6 @@ def _get_stmt(
     if end_time:
         stmt = stmt.where(models.Span.start_time < end_time)
     if filter_condition:
-        span_filter = SpanFilter(condition=filter_condition)
+        span_filter = SpanFilter(condition=filter_condition, search_text_index=search_text_index)
         stmt = span_filter(stmt)
     return stmt
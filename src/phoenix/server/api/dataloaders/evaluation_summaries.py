@@ -79,6 +79,7 @@ class EvaluationSummaryDataLoader(DataLoader[Key, Result]):
         self,
         db: Callable[[], AsyncContextManager[AsyncSession]],
         cache_map: Optional[AbstractCache[Key, Result]] = None,
+        search_text_index: bool = False,
     ) -> None:
         super().__init__(
             load_fn=self._load_fn,
@@ -86,6 +87,7 @@ class EvaluationSummaryDataLoader(DataLoader[Key, Result]):
             cache_map=cache_map,
         )
         self._db = db
+        self._search_text_index = search_text_index
 
     async def _load_fn(self, keys: List[Key]) -> List[Result]:
         results: List[Result] = [DEFAULT_VALUE] * len(keys)
@@ -97,7 +99,7 @@ class EvaluationSummaryDataLoader(DataLoader[Key, Result]):
             segment, param = _cache_key_fn(key)
             arguments[segment][param].append(position)
         for segment, params in arguments.items():
-            stmt = _get_stmt(segment, *params.keys())
+            stmt = _get_stmt(segment, *params.keys(), search_text_index=self._search_text_index)
             async with self._db() as session:
                 data = await session.stream(stmt)
                 async for eval_name, group in groupby(data, lambda row: row.name):
@@ -110,6 +112,7 @@ class EvaluationSummaryDataLoader(DataLoader[Key, Result]):
 def _get_stmt(
     segment: Segment,
     *eval_names: Param,
+    search_text_index: bool = False,
 ) -> Select[Any]:
     kind, project_rowid, (start_time, end_time), filter_condition = segment
     stmt = select()
@@ -120,7 +123,7 @@ def _get_stmt(
         time_column = models.Span.start_time
         stmt = stmt.join(models.Span).join_from(models.Span, models.Trace)
         if filter_condition:
-            sf = SpanFilter(filter_condition)
+            sf = SpanFilter(filter_condition, search_text_index=search_text_index)
             stmt = sf(stmt)
     elif kind == "trace":
         mta = models.TraceAnnotation
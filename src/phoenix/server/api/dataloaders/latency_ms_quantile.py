@@ -37,6 +37,7 @@ from phoenix.db.helpers import SupportedSQLDialect
 from phoenix.server.api.dataloaders.cache import TwoTierCache
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.trace.dsl import SpanFilter
+from phoenix.utilities.span_store import SpanStore
 
 Kind: TypeAlias = Literal["span", "trace"]
 ProjectRowId: TypeAlias = int
@@ -90,6 +91,8 @@ class LatencyMsQuantileDataLoader(DataLoader[Key, Result]):
         self,
         db: Callable[[], AsyncContextManager[AsyncSession]],
         cache_map: Optional[AbstractCache[Key, Result]] = None,
+        span_store: Optional[SpanStore] = None,
+        search_text_index: bool = False,
     ) -> None:
         super().__init__(
             load_fn=self._load_fn,
@@ -97,6 +100,8 @@ class LatencyMsQuantileDataLoader(DataLoader[Key, Result]):
             cache_map=cache_map,
         )
         self._db = db
+        self._span_store = span_store
+        self._search_text_index = search_text_index
 
     async def _load_fn(self, keys: List[Key]) -> List[Result]:
         results: List[Result] = [DEFAULT_VALUE] * len(keys)
@@ -106,22 +111,52 @@ class LatencyMsQuantileDataLoader(DataLoader[Key, Result]):
         ] = defaultdict(lambda: defaultdict(list))
         for position, key in enumerate(keys):
             segment, param = _cache_key_fn(key)
+            if (latencies := self._get_latencies_in_span_store(segment, param)) is not None:
+                results[position] = _percentile(latencies, param[1])
+                continue
             arguments[segment][param].append(position)
+        if not arguments:
+            return results
         async with self._db() as session:
             dialect = SupportedSQLDialect(session.bind.dialect.name)
             for segment, params in arguments.items():
                 async for position, quantile_value in _get_results(
-                    dialect, session, segment, params
+                    dialect, session, segment, params, self._search_text_index
                 ):
                     results[position] = quantile_value
         return results
 
+    def _get_latencies_in_span_store(self, segment: Segment, param: Param) -> Optional[List[float]]:
+        if (span_store := self._span_store) is None:
+            return None
+        kind, (start_time, end_time), filter_condition = segment
+        if filter_condition:
+            return None
+        project_rowid, _ = param
+        return span_store.get_latencies(kind, project_rowid, start_time, end_time)
+
+
+def _percentile(values: List[float], probability: Probability) -> Result:
+    """
+    Interpolates linearly between the closest ranks, like `percentile_cont` on
+    PostgreSQL and `percentile` on SQLite.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = probability * (len(values) - 1)
+    lower = int(rank)
+    if lower + 1 == len(values):
+        return values[lower]
+    return values[lower] + (values[lower + 1] - values[lower]) * (rank - lower)
+
 
 async def _get_results(
     dialect: SupportedSQLDialect,
     session: AsyncSession,
     segment: Segment,
     params: Mapping[Param, List[ResultPosition]],
+    search_text_index: bool = False,
 ) -> AsyncIterator[Tuple[ResultPosition, QuantileValue]]:
     kind, (start_time, end_time), filter_condition = segment
     stmt = select(models.Trace.project_rowid)
@@ -133,7 +168,7 @@ async def _get_results(
         time_column = models.Span.start_time
         stmt = stmt.join(models.Span)
         if filter_condition:
-            sf = SpanFilter(filter_condition)
+            sf = SpanFilter(filter_condition, search_text_index=search_text_index)
             stmt = sf(stmt)
     else:
         assert_never(kind)
@@ -21,6 +21,7 @@ from phoenix.db import models
 from phoenix.server.api.dataloaders.cache import TwoTierCache
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.trace.dsl import SpanFilter
+from phoenix.utilities.span_store import SpanStore
 
 Kind: TypeAlias = Literal["span", "trace"]
 ProjectRowId: TypeAlias = int
@@ -71,6 +72,8 @@ class RecordCountDataLoader(DataLoader[Key, Result]):
         self,
         db: Callable[[], AsyncContextManager[AsyncSession]],
         cache_map: Optional[AbstractCache[Key, Result]] = None,
+        span_store: Optional[SpanStore] = None,
+        search_text_index: bool = False,
     ) -> None:
         super().__init__(
             load_fn=self._load_fn,
@@ -78,6 +81,8 @@ class RecordCountDataLoader(DataLoader[Key, Result]):
             cache_map=cache_map,
         )
         self._db = db
+        self._span_store = span_store
+        self._search_text_index = search_text_index
 
     async def _load_fn(self, keys: List[Key]) -> List[Result]:
         results: List[Result] = [DEFAULT_VALUE] * len(keys)
@@ -87,20 +92,34 @@ class RecordCountDataLoader(DataLoader[Key, Result]):
         ] = defaultdict(lambda: defaultdict(list))
         for position, key in enumerate(keys):
             segment, param = _cache_key_fn(key)
+            if (count_in_store := self._count_in_span_store(segment, param)) is not None:
+                results[position] = count_in_store
+                continue
             arguments[segment][param].append(position)
+        if not arguments:
+            return results
         async with self._db() as session:
             for segment, params in arguments.items():
-                stmt = _get_stmt(segment, *params.keys())
+                stmt = _get_stmt(segment, *params.keys(), search_text_index=self._search_text_index)
                 data = await session.stream(stmt)
                 async for project_rowid, count in data:
                     for position in params[project_rowid]:
                         results[position] = count
         return results
 
+    def _count_in_span_store(self, segment: Segment, project_rowid: Param) -> Optional[Result]:
+        if (span_store := self._span_store) is None:
+            return None
+        kind, (start_time, end_time), filter_condition = segment
+        if filter_condition:
+            return None
+        return span_store.count(kind, project_rowid, start_time, end_time)
+
 
 def _get_stmt(
     segment: Segment,
     *project_rowids: Param,
+    search_text_index: bool = False,
 ) -> Select[Any]:
     kind, (start_time, end_time), filter_condition = segment
     pid = models.Trace.project_rowid
@@ -109,7 +128,7 @@ def _get_stmt(
         time_column = models.Span.start_time
         stmt = stmt.join(models.Span)
         if filter_condition:
-            sf = SpanFilter(filter_condition)
+            sf = SpanFilter(filter_condition, search_text_index=search_text_index)
             stmt = sf(stmt)
     elif kind == "trace":
         time_column = models.Trace.start_time
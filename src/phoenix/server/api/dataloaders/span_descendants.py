@@ -1,4 +1,3 @@
-from random import randint
 from typing import (
     AsyncContextManager,
     Callable,
@@ -27,33 +26,12 @@ class SpanDescendantsDataLoader(DataLoader[Key, Result]):
         self._db = db
 
     async def _load_fn(self, keys: List[Key]) -> List[Result]:
-        root_ids = set(keys)
-        root_id_label = f"root_id_{randint(0, 10**6):06}"
-        descendant_ids = (
-            select(
-                models.Span.id,
-                models.Span.span_id,
-                models.Span.parent_id.label(root_id_label),
-            )
-            .where(models.Span.parent_id.in_(root_ids))
-            .cte(recursive=True)
-        )
-        parent_ids = descendant_ids.alias()
-        descendant_ids = descendant_ids.union_all(
-            select(
-                models.Span.id,
-                models.Span.span_id,
-                parent_ids.c[root_id_label],
-            ).join(
-                parent_ids,
-                models.Span.parent_id == parent_ids.c.span_id,
-            )
-        )
         stmt = (
-            select(descendant_ids.c[root_id_label], models.Span)
-            .join(descendant_ids, models.Span.id == descendant_ids.c.id)
+            select(models.SpanAncestor.ancestor_id, models.Span)
+            .join(models.SpanAncestor, models.Span.id == models.SpanAncestor.span_rowid)
+            .where(models.SpanAncestor.ancestor_id.in_(set(keys)))
             .options(joinedload(models.Span.trace, innerjoin=True).load_only(models.Trace.trace_id))
-            .order_by(descendant_ids.c[root_id_label])
+            .order_by(models.SpanAncestor.ancestor_id)
         )
         results: Dict[SpanId, Result] = {key: [] for key in keys}
         async with self._db() as session:
@@ -73,6 +73,7 @@ class TokenCountDataLoader(DataLoader[Key, Result]):
         self,
         db: Callable[[], AsyncContextManager[AsyncSession]],
         cache_map: Optional[AbstractCache[Key, Result]] = None,
+        search_text_index: bool = False,
     ) -> None:
         super().__init__(
             load_fn=self._load_fn,
@@ -80,6 +81,7 @@ class TokenCountDataLoader(DataLoader[Key, Result]):
             cache_map=cache_map,
         )
         self._db = db
+        self._search_text_index = search_text_index
 
     async def _load_fn(self, keys: List[Key]) -> List[Result]:
         results: List[Result] = [DEFAULT_VALUE] * len(keys)
@@ -92,7 +94,7 @@ class TokenCountDataLoader(DataLoader[Key, Result]):
             arguments[segment][param].append(position)
         async with self._db() as session:
             for segment, params in arguments.items():
-                stmt = _get_stmt(segment, *params.keys())
+                stmt = _get_stmt(segment, *params.keys(), search_text_index=self._search_text_index)
                 data = await session.stream(stmt)
                 async for project_rowid, prompt, completion, total in data:
                     for position in params[(project_rowid, "prompt")]:
@@ -107,6 +109,7 @@ class TokenCountDataLoader(DataLoader[Key, Result]):
 def _get_stmt(
     segment: Segment,
     *params: Param,
+    search_text_index: bool = False,
 ) -> Select[Any]:
     (start_time, end_time), filter_condition = segment
     prompt = func.sum(models.Span.attributes[_LLM_TOKEN_COUNT_PROMPT].as_float())
@@ -128,7 +131,7 @@ def _get_stmt(
     if end_time:
         stmt = stmt.where(models.Span.start_time < end_time)
     if filter_condition:
-        sf = SpanFilter(filter_condition)
+        sf = SpanFilter(filter_condition, search_text_index=search_text_index)
         stmt = sf(stmt)
     stmt = stmt.where(pid.in_([rowid for rowid, _ in params]))
     return stmt
@@ -0,0 +1,33 @@
+from typing import AsyncContextManager, Callable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+from typing_extensions import TypeAlias
+
+from phoenix.db import models
+
+TraceRowId: TypeAlias = int
+Key: TypeAlias = TraceRowId
+Result: TypeAlias = Optional[models.Trace]
+
+
+class TraceSummariesDataLoader(DataLoader[Key, Result]):
+    """
+    Loads the traces by row ID along with the summaries of their spans, which
+    are maintained on the trace as the spans are inserted.
+    """
+
+    def __init__(self, db: Callable[[], AsyncContextManager[AsyncSession]]) -> None:
+        super().__init__(load_fn=self._load_fn)
+        self._db = db
+
+    async def _load_fn(self, keys: List[Key]) -> List[Result]:
+        async with self._db() as session:
+            traces = {
+                trace.id: trace
+                async for trace in await session.stream_scalars(
+                    select(models.Trace).where(models.Trace.id.in_(set(keys)))
+                )
+            }
+        return [traces.get(key) for key in keys]
@@ -0,0 +1,18 @@
+from typing import Optional
+
+import strawberry
+from strawberry.relay import GlobalID
+
+
+@strawberry.input
+class SetProjectRetentionPolicyInput:
+    id: GlobalID
+    max_age_days: Optional[float] = strawberry.field(
+        default=None,
+        description="The age in days after which traces are deleted. No limit if null.",
+    )
+    max_span_count: Optional[int] = strawberry.field(
+        default=None,
+        description="The number of spans in excess of which the oldest traces are deleted. "
+        "No limit if null.",
+    )
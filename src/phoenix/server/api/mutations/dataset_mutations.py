@@ -6,12 +6,16 @@ import strawberry
 from openinference.semconv.trace import (
     SpanAttributes,
 )
-from sqlalchemy import and_, delete, distinct, func, insert, select, update
+from sqlalchemy import and_, delete, distinct, insert, select, update
 from strawberry import UNSET
 from strawberry.types import Info
 
 from phoenix.db import models
-from phoenix.db.helpers import get_eval_trace_ids_for_datasets, get_project_names_for_datasets
+from phoenix.db.helpers import (
+    get_eval_trace_ids_for_datasets,
+    get_project_names_for_datasets,
+    is_latest_revision,
+)
 from phoenix.server.api.context import Context
 from phoenix.server.api.helpers.dataset_helpers import (
     get_dataset_example_input,
@@ -295,8 +299,18 @@ class DatasetMutationMixin:
             if not (dataset := await session.scalar(stmt)):
                 raise ValueError(f"Unknown dataset: {input.dataset_id}")
         await asyncio.gather(
-            delete_projects(info.context.db, *project_names),
-            delete_traces(info.context.db, *eval_trace_ids),
+            delete_projects(
+                info.context.db,
+                *project_names,
+                span_store=info.context.span_store,
+                span_query_cache=info.context.span_query_cache,
+            ),
+            delete_traces(
+                info.context.db,
+                *eval_trace_ids,
+                span_store=info.context.span_store,
+                span_query_cache=info.context.span_query_cache,
+            ),
             return_exceptions=True,
         )
         return DatasetMutationPayload(dataset=to_gql_dataset(dataset))
@@ -344,18 +358,13 @@ class DatasetMutationMixin:
                 raise ValueError("Examples must come from the same dataset.")
             dataset = datasets[0]
 
-            revision_ids = (
-                select(func.max(models.DatasetExampleRevision.id))
-                .where(models.DatasetExampleRevision.dataset_example_id.in_(example_ids))
-                .group_by(models.DatasetExampleRevision.dataset_example_id)
-                .scalar_subquery()
-            )
             revisions = (
                 await session.scalars(
                     select(models.DatasetExampleRevision)
                     .where(
                         and_(
-                            models.DatasetExampleRevision.id.in_(revision_ids),
+                            models.DatasetExampleRevision.dataset_example_id.in_(example_ids),
+                            is_latest_revision(),
                             models.DatasetExampleRevision.revision_kind != "DELETE",
                         )
                     )
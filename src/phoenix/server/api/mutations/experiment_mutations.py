@@ -62,8 +62,18 @@ class ExperimentMutationMixin:
                     )
                 )
         await asyncio.gather(
-            delete_projects(info.context.db, *project_names),
-            delete_traces(info.context.db, *eval_trace_ids),
+            delete_projects(
+                info.context.db,
+                *project_names,
+                span_store=info.context.span_store,
+                span_query_cache=info.context.span_query_cache,
+            ),
+            delete_traces(
+                info.context.db,
+                *eval_trace_ids,
+                span_store=info.context.span_store,
+                span_query_cache=info.context.span_query_cache,
+            ),
             return_exceptions=True,
         )
         return ExperimentMutationPayload(
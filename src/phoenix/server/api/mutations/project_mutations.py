@@ -1,5 +1,5 @@
 import strawberry
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import load_only
 from strawberry.relay import GlobalID
 from strawberry.types import Info
@@ -9,6 +9,9 @@ from phoenix.db import models
 from phoenix.db.insertion.span import ClearProjectSpansEvent
 from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.ClearProjectInput import ClearProjectInput
+from phoenix.server.api.input_types.SetProjectRetentionPolicyInput import (
+    SetProjectRetentionPolicyInput,
+)
 from phoenix.server.api.mutations.auth import IsAuthenticated
 from phoenix.server.api.queries import Query
 from phoenix.server.api.types.node import from_global_id_with_expected_type
@@ -30,6 +33,10 @@ class ProjectMutationMixin:
             if project.name == DEFAULT_PROJECT_NAME:
                 raise ValueError(f"Cannot delete the {DEFAULT_PROJECT_NAME} project")
             await session.delete(project)
+        if span_query_cache := info.context.span_query_cache:
+            span_query_cache.invalidate(node_id)
+        if span_store := info.context.span_store:
+            span_store.clear(node_id)
         return Query()
 
     @strawberry.mutation(permission_classes=[IsAuthenticated])  # type: ignore
@@ -44,4 +51,33 @@ class ProjectMutationMixin:
             await session.execute(delete_statement)
         if cache := info.context.cache_for_dataloaders:
             cache.invalidate(ClearProjectSpansEvent(project_rowid=project_id))
+        if span_query_cache := info.context.span_query_cache:
+            span_query_cache.invalidate(project_id)
+        if span_store := info.context.span_store:
+            span_store.clear(project_id)
+        return Query()
+
+    @strawberry.mutation(permission_classes=[IsAuthenticated])  # type: ignore
+    async def set_project_retention_policy(
+        self, info: Info[Context, None], input: SetProjectRetentionPolicyInput
+    ) -> Query:
+        project_id = from_global_id_with_expected_type(
+            global_id=input.id, expected_type_name="Project"
+        )
+        if input.max_age_days is not None and not input.max_age_days > 0:
+            raise ValueError("The maximum age must be positive")
+        if input.max_span_count is not None and input.max_span_count < 0:
+            raise ValueError("The maximum span count must not be negative")
+        async with info.context.db() as session:
+            project_rowid = await session.scalar(
+                update(models.Project)
+                .where(models.Project.id == project_id)
+                .values(
+                    retention_max_age_days=input.max_age_days,
+                    retention_max_span_count=input.max_span_count,
+                )
+                .returning(models.Project.id)
+            )
+        if project_rowid is None:
+            raise ValueError(f"Unknown project: {input.id}")
         return Query()
@@ -12,6 +12,7 @@ from strawberry.types import Info
 from typing_extensions import Annotated, TypeAlias
 
 from phoenix.db import models
+from phoenix.db.helpers import is_latest_revision
 from phoenix.db.models import (
     DatasetExample as OrmExample,
 )
@@ -62,7 +63,7 @@ from phoenix.server.api.types.pagination import (
     CursorString,
     connection_from_list,
 )
-from phoenix.server.api.types.Project import Project
+from phoenix.server.api.types.Project import Project, to_gql_project
 from phoenix.server.api.types.SortDir import SortDir
 from phoenix.server.api.types.Span import Span, to_gql_span
 from phoenix.server.api.types.Trace import Trace
@@ -95,15 +96,7 @@ class Query:
         )
         async with info.context.db() as session:
             projects = await session.stream_scalars(stmt)
-            data = [
-                Project(
-                    id_attr=project.id,
-                    name=project.name,
-                    gradient_start_color=project.gradient_start_color,
-                    gradient_end_color=project.gradient_end_color,
-                )
-                async for project in projects
-            ]
+            data = [to_gql_project(project) async for project in projects]
         return connection_from_list(data=data, args=args)
 
     @strawberry.field
@@ -173,25 +166,14 @@ class Query:
             if num_resolved_experiment_ids != len(experiment_ids_):
                 raise ValueError("Unable to resolve one or more experiment IDs.")
 
-            revision_ids = (
-                select(func.max(OrmRevision.id))
-                .join(OrmExample, OrmExample.id == OrmRevision.dataset_example_id)
-                .where(
-                    and_(
-                        OrmRevision.dataset_version_id <= version_id,
-                        OrmExample.dataset_id == dataset_id,
-                    )
-                )
-                .group_by(OrmRevision.dataset_example_id)
-                .scalar_subquery()
-            )
             examples = (
                 await session.scalars(
                     select(OrmExample)
                     .join(OrmRevision, OrmExample.id == OrmRevision.dataset_example_id)
                     .where(
                         and_(
-                            OrmRevision.id.in_(revision_ids),
+                            OrmExample.dataset_id == dataset_id,
+                            is_latest_revision(version_id),
                             OrmRevision.revision_kind != "DELETE",
                         )
                     )
@@ -272,6 +254,8 @@ class Query:
                 models.Project.name,
                 models.Project.gradient_start_color,
                 models.Project.gradient_end_color,
+                models.Project.retention_max_age_days,
+                models.Project.retention_max_span_count,
             ).where(models.Project.id == node_id)
             async with info.context.db() as session:
                 project = (await session.execute(project_stmt)).first()
@@ -282,6 +266,8 @@ class Query:
                 name=project.name,
                 gradient_start_color=project.gradient_start_color,
                 gradient_end_color=project.gradient_end_color,
+                retention_max_age_days=project.retention_max_age_days,
+                retention_max_span_count=project.retention_max_span_count,
             )
         elif type_name == "Trace":
             trace_stmt = select(
@@ -316,11 +302,6 @@ class Query:
             return to_gql_dataset(dataset)
         elif type_name == DatasetExample.__name__:
             example_id = node_id
-            latest_revision_id = (
-                select(func.max(models.DatasetExampleRevision.id))
-                .where(models.DatasetExampleRevision.dataset_example_id == example_id)
-                .scalar_subquery()
-            )
             async with info.context.db() as session:
                 example = await session.scalar(
                     select(models.DatasetExample)
@@ -332,7 +313,7 @@ class Query:
                     .where(
                         and_(
                             models.DatasetExample.id == example_id,
-                            models.DatasetExampleRevision.id == latest_revision_id,
+                            is_latest_revision(),
                             models.DatasetExampleRevision.revision_kind != "DELETE",
                         )
                     )
@@ -4,6 +4,7 @@ from starlette.responses import JSONResponse, Response
 from starlette.status import HTTP_404_NOT_FOUND
 from strawberry.relay import GlobalID
 
+from phoenix.db.helpers import is_latest_revision
 from phoenix.db.models import Dataset, DatasetExample, DatasetExampleRevision, DatasetVersion
 
 
@@ -92,7 +93,7 @@ async def list_dataset_examples(request: Request) -> Response:
             content=f"ID {version_id} refers to a {version_type}", status_code=HTTP_404_NOT_FOUND
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.read_db() as session:
         if (
             resolved_dataset_id := await session.scalar(
                 select(Dataset.id).where(Dataset.id == int(dataset_id.node_id))
@@ -103,12 +104,6 @@ async def list_dataset_examples(request: Request) -> Response:
                 status_code=HTTP_404_NOT_FOUND,
             )
 
-        # Subquery to find the maximum created_at for each dataset_example_id
-        # timestamp tiebreaks are resolved by the largest id
-        partial_subquery = select(
-            func.max(DatasetExampleRevision.id).label("max_id"),
-        ).group_by(DatasetExampleRevision.dataset_example_id)
-
         if version_id:
             if (
                 resolved_version_id := await session.scalar(
@@ -124,10 +119,6 @@ async def list_dataset_examples(request: Request) -> Response:
                     content=f"No dataset version with id {version_id} can be found.",
                     status_code=HTTP_404_NOT_FOUND,
                 )
-            # if a version_id is provided, filter the subquery to only include revisions from that
-            partial_subquery = partial_subquery.filter(
-                DatasetExampleRevision.dataset_version_id <= resolved_version_id
-            )
         else:
             if (
                 resolved_version_id := await session.scalar(
@@ -141,7 +132,6 @@ async def list_dataset_examples(request: Request) -> Response:
                     status_code=HTTP_404_NOT_FOUND,
                 )
 
-        subquery = partial_subquery.subquery()
         # Query for the most recent example revisions that are not deleted
         query = (
             select(DatasetExample, DatasetExampleRevision)
@@ -149,11 +139,8 @@ async def list_dataset_examples(request: Request) -> Response:
                 DatasetExampleRevision,
                 DatasetExample.id == DatasetExampleRevision.dataset_example_id,
             )
-            .join(
-                subquery,
-                (subquery.c.max_id == DatasetExampleRevision.id),
-            )
             .filter(DatasetExample.dataset_id == resolved_dataset_id)
+            .filter(is_latest_revision(resolved_version_id))
             .filter(DatasetExampleRevision.revision_kind != "DELETE")
             .order_by(DatasetExample.id.asc())
         )
@@ -10,9 +10,12 @@ from enum import Enum
 from functools import partial
 from typing import (
     Any,
+    AsyncContextManager,
+    AsyncIterator,
     Awaitable,
     Callable,
     Coroutine,
+    Dict,
     FrozenSet,
     Iterator,
     List,
@@ -24,15 +27,14 @@ from typing import (
     cast,
 )
 
-import pandas as pd
 import pyarrow as pa
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import Select, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTasks
 from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import FormData, UploadFile
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.status import (
     HTTP_204_NO_CONTENT,
     HTTP_404_NOT_FOUND,
@@ -44,7 +46,11 @@ from strawberry.relay import GlobalID
 from typing_extensions import TypeAlias, assert_never
 
 from phoenix.db import models
-from phoenix.db.helpers import get_eval_trace_ids_for_datasets, get_project_names_for_datasets
+from phoenix.db.helpers import (
+    get_eval_trace_ids_for_datasets,
+    get_project_names_for_datasets,
+    is_latest_revision,
+)
 from phoenix.db.insertion.dataset import (
     DatasetAction,
     DatasetExampleAdditionEvent,
@@ -124,7 +130,7 @@ async def list_datasets(request: Request) -> Response:
     name = request.query_params.get("name")
     cursor = request.query_params.get("cursor")
     limit = int(request.query_params.get("limit", 10))
-    async with request.app.state.db() as session:
+    async with request.app.state.read_db() as session:
         query = select(models.Dataset).order_by(models.Dataset.id.desc())
 
         if cursor:
@@ -216,8 +222,22 @@ async def delete_dataset_by_id(request: Request) -> Response:
         if (await session.scalar(stmt)) is None:
             return Response(content="Dataset does not exist", status_code=HTTP_404_NOT_FOUND)
     tasks = BackgroundTasks()
-    tasks.add_task(delete_projects, request.app.state.db, *project_names)
-    tasks.add_task(delete_traces, request.app.state.db, *eval_trace_ids)
+    span_store = request.app.state.span_store
+    span_query_cache = request.app.state.span_query_cache
+    tasks.add_task(
+        delete_projects,
+        request.app.state.db,
+        *project_names,
+        span_store=span_store,
+        span_query_cache=span_query_cache,
+    )
+    tasks.add_task(
+        delete_traces,
+        request.app.state.db,
+        *eval_trace_ids,
+        span_store=span_store,
+        span_query_cache=span_query_cache,
+    )
     return Response(status_code=HTTP_204_NO_CONTENT, background=tasks)
 
 
@@ -268,7 +288,7 @@ async def get_dataset_by_id(request: Request) -> Response:
         return Response(
             content=f"ID {dataset_id} refers to a f{type_name}", status_code=HTTP_404_NOT_FOUND
         )
-    async with request.app.state.db() as session:
+    async with request.app.state.read_db() as session:
         result = await session.execute(
             select(models.Dataset, models.Dataset.example_count).filter(
                 models.Dataset.id == int(dataset_id.node_id)
@@ -394,7 +414,7 @@ async def get_dataset_versions(request: Request) -> Response:
             .where(models.DatasetVersion.dataset_id == dataset_id)
         ).scalar_subquery()
         stmt = stmt.filter(models.DatasetVersion.id <= max_dataset_version_id)
-    async with request.app.state.db() as session:
+    async with request.app.state.read_db() as session:
         data = [
             {
                 "version_id": str(GlobalID(DatasetVersion.__name__, str(version.id))),
@@ -634,16 +654,16 @@ def _process_json(
             raise ValueError(
                 f"{k} should be a list of same length as input containing only dictionary objects"
             )
-    examples: List[ExampleContent] = []
-    for i, obj in enumerate(inputs):
-        example = ExampleContent(
+    examples = (
+        ExampleContent(
             input=obj,
             output=outputs[i] if outputs else {},
             metadata=metadata[i] if metadata else {},
         )
-        examples.append(example)
+        for i, obj in enumerate(inputs)
+    )
     action = DatasetAction(cast(Optional[str], data.get("action")) or "create")
-    return iter(examples), action, name, description
+    return examples, action, name, description
 
 
 async def _process_csv(
@@ -691,12 +711,13 @@ async def _process_pyarrow(
     _check_keys_exist(column_headers, input_keys, output_keys, metadata_keys)
 
     def get_examples() -> Iterator[ExampleContent]:
-        for row in reader.read_pandas().to_dict(orient="records"):
-            yield ExampleContent(
-                input={k: row.get(k) for k in input_keys},
-                output={k: row.get(k) for k in output_keys},
-                metadata={k: row.get(k) for k in metadata_keys},
-            )
+        for batch in reader:
+            for row in batch.to_pandas().to_dict(orient="records"):
+                yield ExampleContent(
+                    input={k: row.get(k) for k in input_keys},
+                    output={k: row.get(k) for k in output_keys},
+                    metadata={k: row.get(k) for k in metadata_keys},
+                )
 
     return run_in_threadpool(get_examples)
 
@@ -795,9 +816,8 @@ async def get_dataset_csv(request: Request) -> Response:
         dataset_name, examples = await _get_db_examples(request)
     except ValueError as e:
         return Response(content=str(e), status_code=HTTP_422_UNPROCESSABLE_ENTITY)
-    content = await run_in_threadpool(_get_content_csv, examples)
-    return Response(
-        content=content,
+    return StreamingResponse(
+        content=_gzip(_get_content_csv(request.app.state.read_db, examples)),
         headers={
             "content-disposition": f'attachment; filename="{dataset_name}.csv"',
             "content-type": "text/csv",
@@ -844,9 +864,8 @@ async def get_dataset_jsonl_openai_ft(request: Request) -> Response:
         dataset_name, examples = await _get_db_examples(request)
     except ValueError as e:
         return Response(content=str(e), status_code=HTTP_422_UNPROCESSABLE_ENTITY)
-    content = await run_in_threadpool(_get_content_jsonl_openai_ft, examples)
-    return Response(
-        content=content,
+    return StreamingResponse(
+        content=_gzip(_get_content_jsonl_openai_ft(request.app.state.read_db, examples)),
         headers={
             "content-disposition": f'attachment; filename="{dataset_name}.jsonl"',
             "content-type": "text/plain",
@@ -893,9 +912,8 @@ async def get_dataset_jsonl_openai_evals(request: Request) -> Response:
         dataset_name, examples = await _get_db_examples(request)
     except ValueError as e:
         return Response(content=str(e), status_code=HTTP_422_UNPROCESSABLE_ENTITY)
-    content = await run_in_threadpool(_get_content_jsonl_openai_evals, examples)
-    return Response(
-        content=content,
+    return StreamingResponse(
+        content=_gzip(_get_content_jsonl_openai_evals(request.app.state.read_db, examples)),
         headers={
             "content-disposition": f'attachment; filename="{dataset_name}.jsonl"',
             "content-type": "text/plain",
@@ -904,27 +922,55 @@ async def get_dataset_jsonl_openai_evals(request: Request) -> Response:
     )
 
 
-def _get_content_csv(examples: List[models.DatasetExampleRevision]) -> bytes:
-    records = [
-        {
-            "example_id": GlobalID(
-                type_name=DatasetExample.__name__,
-                node_id=str(ex.dataset_example_id),
-            ),
-            **{f"input_{k}": v for k, v in ex.input.items()},
-            **{f"output_{k}": v for k, v in ex.output.items()},
-            **{f"metadata_{k}": v for k, v in ex.metadata_.items()},
-        }
-        for ex in examples
-    ]
-    return gzip.compress(pd.DataFrame.from_records(records).to_csv(index=False).encode())
+async def _get_content_csv(
+    db: Callable[[], AsyncContextManager[AsyncSession]],
+    examples: Select[Tuple[models.DatasetExampleRevision]],
+) -> AsyncIterator[str]:
+    """
+    Yields the CSV text one row at a time. The column headers are the union
+    of the keys of all examples, so the examples are read twice: once for the
+    headers and once for the rows.
+    """
+    async with db() as session:
+        fieldnames: Dict[str, None] = {}
+        async for ex in await session.stream_scalars(examples):
+            fieldnames.update(dict.fromkeys(_get_csv_record(ex)))
+        if not fieldnames:
+            return
+        buffer = io.StringIO()
+        writer = csv.DictWriter(
+            buffer,
+            fieldnames=list(fieldnames),
+            extrasaction="ignore",
+            lineterminator="\n",
+        )
+        writer.writeheader()
+        async for ex in await session.stream_scalars(examples):
+            writer.writerow(_get_csv_record(ex))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
 
 
-def _get_content_jsonl_openai_ft(examples: List[models.DatasetExampleRevision]) -> bytes:
-    records = io.BytesIO()
-    for ex in examples:
-        records.write(
-            (
+def _get_csv_record(ex: models.DatasetExampleRevision) -> Dict[str, Any]:
+    return {
+        "example_id": GlobalID(
+            type_name=DatasetExample.__name__,
+            node_id=str(ex.dataset_example_id),
+        ),
+        **{f"input_{k}": v for k, v in ex.input.items()},
+        **{f"output_{k}": v for k, v in ex.output.items()},
+        **{f"metadata_{k}": v for k, v in ex.metadata_.items()},
+    }
+
+
+async def _get_content_jsonl_openai_ft(
+    db: Callable[[], AsyncContextManager[AsyncSession]],
+    examples: Select[Tuple[models.DatasetExampleRevision]],
+) -> AsyncIterator[str]:
+    async with db() as session:
+        async for ex in await session.stream_scalars(examples):
+            yield (
                 json.dumps(
                     {
                         "messages": (
@@ -935,17 +981,16 @@ def _get_content_jsonl_openai_ft(examples: List[models.DatasetExampleRevision])
                     ensure_ascii=False,
                 )
                 + "\n"
-            ).encode()
-        )
-    records.seek(0)
-    return gzip.compress(records.read())
+            )
 
 
-def _get_content_jsonl_openai_evals(examples: List[models.DatasetExampleRevision]) -> bytes:
-    records = io.BytesIO()
-    for ex in examples:
-        records.write(
-            (
+async def _get_content_jsonl_openai_evals(
+    db: Callable[[], AsyncContextManager[AsyncSession]],
+    examples: Select[Tuple[models.DatasetExampleRevision]],
+) -> AsyncIterator[str]:
+    async with db() as session:
+        async for ex in await session.stream_scalars(examples):
+            yield (
                 json.dumps(
                     {
                         "messages": ims
@@ -962,13 +1007,27 @@ def _get_content_jsonl_openai_evals(examples: List[models.DatasetExampleRevision
                     ensure_ascii=False,
                 )
                 + "\n"
-            ).encode()
-        )
-    records.seek(0)
-    return gzip.compress(records.read())
+            )
 
 
-async def _get_db_examples(request: Request) -> Tuple[str, List[models.DatasetExampleRevision]]:
+async def _gzip(content: AsyncIterator[str]) -> AsyncIterator[bytes]:
+    """
+    Compresses the text incrementally into the gzip format.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for text in content:
+        if data := compressor.compress(text.encode()):
+            yield data
+    yield compressor.flush()
+
+
+async def _get_db_examples(
+    request: Request,
+) -> Tuple[str, Select[Tuple[models.DatasetExampleRevision]]]:
+    """
+    Returns the dataset name along with the statement selecting the examples
+    to download, so that the examples can be streamed from the database.
+    """
     if not (id_ := request.path_params.get("id")):
         raise ValueError("Missing Dataset ID")
     dataset_id = from_global_id_with_expected_type(GlobalID.from_id(id_), Dataset.__name__)
@@ -978,45 +1037,28 @@ async def _get_db_examples(request: Request) -> Tuple[str, List[models.DatasetEx
             GlobalID.from_id(version_id),
             DatasetVersion.__name__,
         )
-    latest_version = (
-        select(
-            models.DatasetExampleRevision.dataset_example_id,
-            func.max(models.DatasetExampleRevision.dataset_version_id).label("dataset_version_id"),
-        )
-        .group_by(models.DatasetExampleRevision.dataset_example_id)
-        .join(models.DatasetExample)
-        .where(models.DatasetExample.dataset_id == dataset_id)
-    )
+    max_dataset_version_id = None
     if dataset_version_id is not None:
         max_dataset_version_id = (
             select(models.DatasetVersion.id)
             .where(models.DatasetVersion.id == dataset_version_id)
             .where(models.DatasetVersion.dataset_id == dataset_id)
         ).scalar_subquery()
-        latest_version = latest_version.where(
-            models.DatasetExampleRevision.dataset_version_id <= max_dataset_version_id
-        )
-    subq = latest_version.subquery("latest_version")
     stmt = (
         select(models.DatasetExampleRevision)
-        .join(
-            subq,
-            onclause=and_(
-                models.DatasetExampleRevision.dataset_example_id == subq.c.dataset_example_id,
-                models.DatasetExampleRevision.dataset_version_id == subq.c.dataset_version_id,
-            ),
-        )
+        .join(models.DatasetExample)
+        .where(models.DatasetExample.dataset_id == dataset_id)
+        .where(is_latest_revision(max_dataset_version_id))
         .where(models.DatasetExampleRevision.revision_kind != "DELETE")
         .order_by(models.DatasetExampleRevision.dataset_example_id)
     )
-    async with request.app.state.db() as session:
+    async with request.app.state.read_db() as session:
         dataset_name: Optional[str] = await session.scalar(
             select(models.Dataset.name).where(models.Dataset.id == dataset_id)
         )
         if not dataset_name:
             raise ValueError("Dataset does not exist.")
-        examples = [r async for r in await session.stream_scalars(stmt)]
-    return dataset_name, examples
+    return dataset_name, stmt
 
 
 def _is_all_dict(seq: Sequence[Any]) -> bool:
@@ -28,7 +28,6 @@ from phoenix.config import DEFAULT_PROJECT_NAME
 from phoenix.db import models
 from phoenix.exceptions import PhoenixEvaluationNameIsMissing
 from phoenix.server.api.routers.utils import table_to_bytes
-from phoenix.session.evaluation import encode_evaluations
 from phoenix.trace.span_evaluations import (
     DocumentEvaluations,
     Evaluations,
@@ -121,7 +120,7 @@ async def get_evaluations(request: Request) -> Response:
         or DEFAULT_PROJECT_NAME
     )
 
-    db: Callable[[], AsyncContextManager[AsyncSession]] = request.app.state.db
+    db: Callable[[], AsyncContextManager[AsyncSession]] = request.app.state.read_db
     async with db() as session:
         connection = await session.connection()
         trace_evals_dataframe = await connection.run_sync(
@@ -189,8 +188,8 @@ async def _process_pyarrow(request: Request) -> Response:
 
 
 async def _add_evaluations(state: State, evaluations: Evaluations) -> None:
-    for evaluation in encode_evaluations(evaluations):
-        await state.queue_evaluation_for_bulk_insert(evaluation)
+    # The evaluations are inserted as a table, rather than row by row.
+    await state.queue_evaluation_for_bulk_insert(evaluations)
 
 
 def _read_sql_trace_evaluations_into_dataframe(
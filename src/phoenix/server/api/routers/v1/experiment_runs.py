@@ -188,7 +188,7 @@ async def list_experiment_runs(request: Request) -> Response:
             status_code=HTTP_404_NOT_FOUND,
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.read_db() as session:
         experiment_runs = await session.execute(
             select(models.ExperimentRun)
             .where(models.ExperimentRun.experiment_id == experiment_id)
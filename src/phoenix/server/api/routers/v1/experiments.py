@@ -276,7 +276,7 @@ async def read_experiment(request: Request) -> Response:
             status_code=HTTP_404_NOT_FOUND,
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.read_db() as session:
         experiment = await session.execute(
             select(models.Experiment).where(models.Experiment.id == experiment_id)
         )
@@ -1,16 +1,25 @@
 from datetime import timezone
-from typing import AsyncIterator
+from typing import AsyncIterator, Dict, List, Optional
 
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 from starlette.responses import Response, StreamingResponse
-from starlette.status import HTTP_404_NOT_FOUND, HTTP_422_UNPROCESSABLE_ENTITY
+from starlette.status import (
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
 
 from phoenix.config import DEFAULT_PROJECT_NAME
 from phoenix.datetime_utils import normalize_datetime
+from phoenix.db import models
 from phoenix.server.api.routers.utils import df_to_bytes, from_iso_format
+from phoenix.server.span_query_cache import SpanQueryCache
 from phoenix.trace.dsl import SpanQuery
 
 DEFAULT_SPAN_LIMIT = 1000
+NEXT_CURSOR_HEADER = "X-Phoenix-Next-Cursor"
 
 
 # TODO: Add property details to SpanQuery schema
@@ -65,9 +74,19 @@ async def query_spans_handler(request: Request) -> Response:
               root_spans_only:
                 type: boolean
                 nullable: true
+              after_cursor:
+                type: string
+                nullable: true
+                description: >-
+                  Only return spans inserted after the cursor, which is returned
+                  in the X-Phoenix-Next-Cursor header. An empty string starts
+                  from the beginning. If given, the limit applies to the number
+                  of spans inserted after the cursor that are considered.
     responses:
       200:
         description: Success
+      304:
+        description: Not modified since the entity tag in If-None-Match
       403:
         description: Forbidden
       404:
@@ -88,13 +107,61 @@ async def query_spans_handler(request: Request) -> Response:
     )
     end_time = payload.get("end_time") or payload.get("stop_time")
     try:
-        span_queries = [SpanQuery.from_dict(query) for query in queries]
+        span_queries = [
+            SpanQuery.from_dict(
+                query,
+                search_text_index=request.app.state.has_span_full_text_index,
+            )
+            for query in queries
+        ]
     except Exception as e:
         return Response(
             status_code=HTTP_422_UNPROCESSABLE_ENTITY,
             content=f"Invalid query: {e}",
         )
-    async with request.app.state.db() as session:
+    limit = payload.get("limit", DEFAULT_SPAN_LIMIT)
+    after_span_rowid: Optional[int] = None
+    if (after_cursor := payload.get("after_cursor")) is not None:
+        try:
+            after_span_rowid = _decode_cursor(after_cursor)
+        except ValueError:
+            return Response(
+                status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+                content=f"Invalid cursor: {after_cursor}",
+            )
+    cache: Optional[SpanQueryCache] = request.app.state.span_query_cache
+    etag: Optional[str] = None
+    async with request.app.state.read_db() as session:
+        if cache is not None and (
+            project_rowid := await session.scalar(
+                select(models.Project.id).where(models.Project.name == project_name)
+            )
+        ):
+            # The entity tag is determined before the queries are executed, so
+            # that data inserted in the meantime advances the data version and
+            # invalidates whatever the queries return.
+            etag = cache.etag(
+                project_rowid,
+                {"project_name": project_name, "queries": queries, **payload},
+            )
+            if etag in _parse_if_none_match(request.headers.get("if-none-match")):
+                return Response(status_code=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            if (cached := cache.get(etag)) is not None:
+                cached_content, cached_headers = cached
+                return Response(
+                    content=cached_content,
+                    media_type="application/x-pandas-arrow",
+                    headers=cached_headers,
+                )
+        headers: Dict[str, str] = {"ETag": etag} if etag is not None else {}
+        until_span_rowid: Optional[int] = None
+        if after_span_rowid is not None:
+            until_span_rowid = await _get_until_span_rowid(
+                session, project_name, after_span_rowid, limit
+            )
+            headers[NEXT_CURSOR_HEADER] = _encode_cursor(until_span_rowid)
+            # The spans are already limited by their row ids.
+            limit = None
         results = []
         for query in span_queries:
             results.append(
@@ -109,22 +176,81 @@ async def query_spans_handler(request: Request) -> Response:
                         from_iso_format(end_time),
                         timezone.utc,
                     ),
-                    limit=payload.get("limit", DEFAULT_SPAN_LIMIT),
+                    limit=limit,
                     root_spans_only=payload.get("root_spans_only"),
+                    after_span_rowid=after_span_rowid,
+                    until_span_rowid=until_span_rowid,
                 )
             )
     if not results:
         return Response(status_code=HTTP_404_NOT_FOUND)
 
-    async def content() -> AsyncIterator[bytes]:
+    if cache is not None and etag is not None:
+        content = b"".join(df_to_bytes(result) for result in results)
+        cache.set(etag, content, headers)
+        return Response(
+            content=content,
+            media_type="application/x-pandas-arrow",
+            headers=headers,
+        )
+
+    async def content_stream() -> AsyncIterator[bytes]:
         for result in results:
             yield df_to_bytes(result)
 
     return StreamingResponse(
-        content=content(),
+        content=content_stream(),
         media_type="application/x-pandas-arrow",
+        headers=headers,
     )
 
 
+async def _get_until_span_rowid(
+    session: AsyncSession,
+    project_name: str,
+    after_span_rowid: int,
+    limit: Optional[int],
+) -> int:
+    """
+    Returns the largest row id of the spans to export after the cursor, such
+    that at most `limit` spans of the project are considered. Spans are only
+    ever inserted with larger row ids than those already visible, because
+    the bulk inserter commits its transactions one at a time and row ids are
+    never reused, even after the newest spans are deleted (with AUTOINCREMENT
+    on SQLite). So no span is inserted at or below the returned row id later.
+    """
+    if limit is not None and limit > 0:
+        until_span_rowid = await session.scalar(
+            select(models.Span.id)
+            .join(models.Trace)
+            .join(models.Project)
+            .where(models.Project.name == project_name)
+            .where(after_span_rowid < models.Span.id)
+            .order_by(models.Span.id)
+            .offset(limit - 1)
+            .limit(1)
+        )
+        if until_span_rowid is not None:
+            return until_span_rowid
+    max_span_rowid = await session.scalar(select(func.max(models.Span.id)))
+    return max(after_span_rowid, max_span_rowid or 0)
+
+
+def _encode_cursor(span_rowid: int) -> str:
+    return str(span_rowid)
+
+
+def _decode_cursor(cursor: str) -> int:
+    if not cursor:
+        return 0
+    if not cursor.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return int(cursor)
+
+
+def _parse_if_none_match(value: Optional[str]) -> List[str]:
+    return [etag.strip() for etag in value.split(",")] if value else []
+
+
 async def get_spans_handler(request: Request) -> Response:
     return await query_spans_handler(request)
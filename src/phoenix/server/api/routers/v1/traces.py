@@ -1,5 +1,6 @@
 import gzip
 import zlib
+from typing import List, Tuple
 
 from google.protobuf.message import DecodeError
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
@@ -16,6 +17,7 @@ from starlette.status import (
 )
 
 from phoenix.trace.otel import decode_otlp_span
+from phoenix.trace.schemas import Span
 from phoenix.utilities.project import get_project_name
 
 
@@ -55,6 +57,15 @@ async def post_traces(request: Request) -> Response:
             status_code=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
         )
     body = await request.body()
+    if (otlp_decoder := request.app.state.otlp_decoder) is not None:
+        try:
+            spans = await otlp_decoder.decode(body, content_encoding)
+        except DecodeError:
+            return Response(
+                content="Request body is invalid ExportTraceServiceRequest",
+                status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        return Response(background=BackgroundTask(_add_decoded_spans, spans, request.state))
     if content_encoding == "gzip":
         body = await run_in_threadpool(gzip.decompress, body)
     elif content_encoding == "deflate":
@@ -77,3 +88,8 @@ async def _add_spans(req: ExportTraceServiceRequest, state: State) -> None:
             for otlp_span in scope_span.spans:
                 span = await run_in_threadpool(decode_otlp_span, otlp_span)
                 await state.queue_span_for_bulk_insert(span, project_name)
+
+
+async def _add_decoded_spans(spans: List[Tuple[Span, str]], state: State) -> None:
+    for span, project_name in spans:
+        await state.queue_span_for_bulk_insert(span, project_name)
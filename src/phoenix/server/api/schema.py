@@ -2,6 +2,7 @@ import strawberry
 
 from phoenix.server.api.mutations import Mutation
 from phoenix.server.api.queries import Query
+from phoenix.server.api.subscriptions import Subscription
 
 # This is the schema for generating `schema.graphql`.
 # See https://strawberry.rocks/docs/guides/schema-export
@@ -10,4 +11,5 @@ from phoenix.server.api.queries import Query
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    subscription=Subscription,
 )
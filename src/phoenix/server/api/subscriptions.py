@@ -0,0 +1,33 @@
+from typing import AsyncIterator
+
+import strawberry
+from strawberry.relay import GlobalID
+from strawberry.types import Info
+
+from phoenix.server.api.context import Context
+from phoenix.server.api.types.node import from_global_id_with_expected_type
+from phoenix.server.api.types.ProjectUpdate import ProjectUpdate, to_gql_project_update
+
+
+@strawberry.type
+class Subscription:
+    @strawberry.subscription(
+        description="Pushes the spans and the summary deltas of the project as they "
+        "are committed, in lieu of polling `streamingLastUpdatedAt`."
+    )  # type: ignore
+    async def project_updates(
+        self,
+        info: Info[Context, None],
+        project_id: GlobalID,
+    ) -> AsyncIterator[ProjectUpdate]:
+        project_rowid = from_global_id_with_expected_type(
+            global_id=project_id, expected_type_name="Project"
+        )
+        if (broker := info.context.project_update_broker) is None:
+            return
+        updates = broker.subscribe(project_rowid)
+        try:
+            async for update in updates:
+                yield to_gql_project_update(update)
+        finally:
+            await updates.aclose()
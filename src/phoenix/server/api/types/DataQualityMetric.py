@@ -3,7 +3,23 @@ from functools import partial
 
 import strawberry
 
-from phoenix.metrics.metrics import Cardinality, Count, Max, Mean, Min, PercentEmpty, Quantile, Sum
+from phoenix.metrics.metrics import (
+    ApproximateCardinality,
+    ApproximateQuantile,
+    Cardinality,
+    Count,
+    Max,
+    Mean,
+    Min,
+    PercentEmpty,
+    Quantile,
+    Sum,
+)
+
+_APPROXIMATE_QUANTILE_DESCRIPTION = (
+    "Approximate quantile from a sketch merged across time buckets. The value is within 1% of"
+    " the exact value at the nearest rank."
+)
 
 
 @strawberry.enum
@@ -20,3 +36,30 @@ class DataQualityMetric(Enum):
     p50 = partial(Quantile, probability=0.50)
     p75 = partial(Quantile, probability=0.75)
     p99 = partial(Quantile, probability=0.99)
+    approximateCardinality = strawberry.enum_value(
+        ApproximateCardinality,
+        description=(
+            "Approximate number of distinct values from a HyperLogLog sketch merged across time"
+            " buckets. The relative standard error is about 1.6%."
+        ),
+    )
+    approximateP01 = strawberry.enum_value(
+        partial(ApproximateQuantile, probability=0.01),
+        description=_APPROXIMATE_QUANTILE_DESCRIPTION,
+    )
+    approximateP25 = strawberry.enum_value(
+        partial(ApproximateQuantile, probability=0.25),
+        description=_APPROXIMATE_QUANTILE_DESCRIPTION,
+    )
+    approximateP50 = strawberry.enum_value(
+        partial(ApproximateQuantile, probability=0.50),
+        description=_APPROXIMATE_QUANTILE_DESCRIPTION,
+    )
+    approximateP75 = strawberry.enum_value(
+        partial(ApproximateQuantile, probability=0.75),
+        description=_APPROXIMATE_QUANTILE_DESCRIPTION,
+    )
+    approximateP99 = strawberry.enum_value(
+        partial(ApproximateQuantile, probability=0.99),
+        description=_APPROXIMATE_QUANTILE_DESCRIPTION,
+    )
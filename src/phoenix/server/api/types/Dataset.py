@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import AsyncIterable, List, Optional, Tuple, cast
 
 import strawberry
-from sqlalchemy import and_, func, select
+from sqlalchemy import ScalarSelect, and_, func, select
 from sqlalchemy.sql.functions import count
 from strawberry import UNSET
 from strawberry.relay import Connection, GlobalID, Node, NodeID
@@ -10,6 +10,7 @@ from strawberry.scalars import JSON
 from strawberry.types import Info
 
 from phoenix.db import models
+from phoenix.db.helpers import is_latest_revision
 from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.DatasetVersionSort import DatasetVersionSort
 from phoenix.server.api.types.DatasetExample import DatasetExample
@@ -91,25 +92,11 @@ class Dataset(Node):
             if dataset_version_id
             else None
         )
-        revision_ids = (
-            select(func.max(models.DatasetExampleRevision.id))
-            .join(models.DatasetExample)
-            .where(models.DatasetExample.dataset_id == dataset_id)
-            .group_by(models.DatasetExampleRevision.dataset_example_id)
-        )
-        if version_id:
-            version_id_subquery = (
-                select(models.DatasetVersion.id)
-                .where(models.DatasetVersion.dataset_id == dataset_id)
-                .where(models.DatasetVersion.id == version_id)
-                .scalar_subquery()
-            )
-            revision_ids = revision_ids.where(
-                models.DatasetExampleRevision.dataset_version_id <= version_id_subquery
-            )
         stmt = (
             select(count(models.DatasetExampleRevision.id))
-            .where(models.DatasetExampleRevision.id.in_(revision_ids))
+            .join(models.DatasetExample)
+            .where(models.DatasetExample.dataset_id == dataset_id)
+            .where(is_latest_revision(_version_id_subquery(dataset_id, version_id)))
             .where(models.DatasetExampleRevision.revision_kind != "DELETE")
         )
         async with info.context.db() as session:
@@ -139,22 +126,6 @@ class Dataset(Node):
             if dataset_version_id
             else None
         )
-        revision_ids = (
-            select(func.max(models.DatasetExampleRevision.id))
-            .join(models.DatasetExample)
-            .where(models.DatasetExample.dataset_id == dataset_id)
-            .group_by(models.DatasetExampleRevision.dataset_example_id)
-        )
-        if version_id:
-            version_id_subquery = (
-                select(models.DatasetVersion.id)
-                .where(models.DatasetVersion.dataset_id == dataset_id)
-                .where(models.DatasetVersion.id == version_id)
-                .scalar_subquery()
-            )
-            revision_ids = revision_ids.where(
-                models.DatasetExampleRevision.dataset_version_id <= version_id_subquery
-            )
         query = (
             select(models.DatasetExample)
             .join(
@@ -164,7 +135,8 @@ class Dataset(Node):
             )
             .where(
                 and_(
-                    models.DatasetExampleRevision.id.in_(revision_ids),
+                    models.DatasetExample.dataset_id == dataset_id,
+                    is_latest_revision(_version_id_subquery(dataset_id, version_id)),
                     models.DatasetExampleRevision.revision_kind != "DELETE",
                 )
             )
@@ -297,3 +269,21 @@ def to_gql_dataset(dataset: models.Dataset) -> Dataset:
         created_at=dataset.created_at,
         updated_at=dataset.updated_at,
     )
+
+
+def _version_id_subquery(
+    dataset_id: int,
+    version_id: Optional[int],
+) -> Optional[ScalarSelect[int]]:
+    """
+    Returns the version id as a subquery that is null unless the version
+    belongs to the dataset, or None when no version is specified.
+    """
+    if not version_id:
+        return None
+    return (
+        select(models.DatasetVersion.id)
+        .where(models.DatasetVersion.dataset_id == dataset_id)
+        .where(models.DatasetVersion.id == version_id)
+        .scalar_subquery()
+    )
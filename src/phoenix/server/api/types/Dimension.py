@@ -34,7 +34,8 @@ from .TimeSeries import (
     DriftTimeSeries,
     ensure_timeseries_parameters,
     get_data_quality_timeseries_data,
-    get_drift_timeseries_data,
+    get_reference_drift_timeseries_data,
+    get_reference_quantile_binning,
 )
 
 
@@ -75,15 +76,12 @@ class Dimension(Node):
             inferences,
             time_range,
         )
-        data = get_drift_timeseries_data(
+        data = get_reference_drift_timeseries_data(
+            model,
             self.dimension,
             metric,
             time_range,
             granularity,
-            pd.DataFrame(
-                {self.dimension.name: self.dimension[REFERENCE]},
-                copy=False,
-            ),
         )
         return data[0].value if len(data) else None
 
@@ -190,15 +188,12 @@ class Dimension(Node):
             granularity,
         )
         return DriftTimeSeries(
-            data=get_drift_timeseries_data(
+            data=get_reference_drift_timeseries_data(
+                model,
                 self.dimension,
                 metric,
                 time_range,
                 granularity,
-                pd.DataFrame(
-                    {self.dimension.name: self.dimension[REFERENCE]},
-                    copy=False,
-                ),
             )
         )
 
@@ -216,9 +211,7 @@ class Dimension(Node):
         count = Count()
         summaries = defaultdict(pd.DataFrame)
         binning_method = (
-            binning.QuantileBinning(
-                reference_series=self.dimension[REFERENCE],
-            )
+            get_reference_quantile_binning(model, self.dimension)
             if self.dimension.data_type is CONTINUOUS
             else binning.CategoricalBinning()
         )
@@ -47,6 +47,7 @@ from .TimeSeries import (
     ensure_timeseries_parameters,
     get_data_quality_timeseries_data,
     get_drift_timeseries_data,
+    get_reference_drift_timeseries_data,
 )
 from .UMAPPoints import UMAPPoint, UMAPPoints, to_gql_coordinates
 
@@ -96,15 +97,12 @@ class EmbeddingDimension(Node):
             dataset,
             time_range,
         )
-        data = get_drift_timeseries_data(
+        data = get_reference_drift_timeseries_data(
+            model,
             self.dimension,
             metric,
             time_range,
             granularity,
-            pd.DataFrame(
-                {self.dimension.name: self.dimension[REFERENCE]},
-                copy=False,
-            ),
         )
         return data[0].value if len(data) else None
 
@@ -208,15 +206,12 @@ class EmbeddingDimension(Node):
             granularity,
         )
         return DriftTimeSeries(
-            data=get_drift_timeseries_data(
+            data=get_reference_drift_timeseries_data(
+                model,
                 self.dimension,
                 metric,
                 time_range,
                 granularity,
-                pd.DataFrame(
-                    {self.dimension.name: self.dimension[REFERENCE]},
-                    copy=False,
-                ),
             )
         )
 
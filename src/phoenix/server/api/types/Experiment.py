@@ -18,7 +18,7 @@ from phoenix.server.api.types.pagination import (
     CursorString,
     connection_from_list,
 )
-from phoenix.server.api.types.Project import Project
+from phoenix.server.api.types.Project import Project, to_gql_project
 
 
 @strawberry.type
@@ -120,12 +120,7 @@ class Experiment(Node):
         if db_project is None:
             return None
 
-        return Project(
-            id_attr=db_project.id,
-            name=db_project.name,
-            gradient_start_color=db_project.gradient_start_color,
-            gradient_end_color=db_project.gradient_end_color,
-        )
+        return to_gql_project(db_project)
 
 
 def to_gql_experiment(
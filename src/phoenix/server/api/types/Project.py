@@ -4,6 +4,7 @@ from typing import (
     Any,
     List,
     Optional,
+    Tuple,
 )
 
 import strawberry
@@ -18,7 +19,7 @@ from strawberry.types import Info
 from phoenix.datetime_utils import right_open_time_range
 from phoenix.db import models
 from phoenix.server.api.context import Context
-from phoenix.server.api.input_types.SpanSort import SpanSort, SpanSortConfig
+from phoenix.server.api.input_types.SpanSort import SpanColumn, SpanSort, SpanSortConfig
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.server.api.types.DocumentEvaluationSummary import DocumentEvaluationSummary
 from phoenix.server.api.types.EvaluationSummary import EvaluationSummary
@@ -41,6 +42,8 @@ class Project(Node):
     name: str
     gradient_start_color: str
     gradient_end_color: str
+    retention_max_age_days: Optional[float]
+    retention_max_span_count: Optional[int]
 
     @strawberry.field
     async def start_time(
@@ -166,6 +169,21 @@ class Project(Node):
         root_spans_only: Optional[bool] = UNSET,
         filter_condition: Optional[str] = UNSET,
     ) -> Connection[Span]:
+        if (
+            (span_store := info.context.span_store) is not None
+            and not filter_condition
+            and (not sort or sort.col in _SPAN_STORE_SORT_ATTRIBUTES and not sort.eval_result_key)
+            and (
+                spans_in_store := span_store.get_spans(
+                    self.id_attr,
+                    time_range.start if time_range else None,
+                    time_range.end if time_range else None,
+                    root_spans_only=bool(root_spans_only),
+                )
+            )
+            is not None
+        ):
+            return _connection_from_spans_in_store(spans_in_store, first, after, sort)
         stmt = (
             select(models.Span)
             .join(models.Trace)
@@ -188,7 +206,10 @@ class Project(Node):
                 models.Span.parent_id == parent.c.span_id,
             ).where(parent.c.span_id.is_(None))
         if filter_condition:
-            span_filter = SpanFilter(condition=filter_condition)
+            span_filter = SpanFilter(
+                condition=filter_condition,
+                search_text_index=info.context.has_span_full_text_index,
+            )
             stmt = span_filter(stmt)
         sort_config: Optional[SpanSortConfig] = None
         cursor_rowid_column: Any = models.Span.id
@@ -368,4 +389,61 @@ def to_gql_project(project: models.Project) -> Project:
         name=project.name,
         gradient_start_color=project.gradient_start_color,
         gradient_end_color=project.gradient_end_color,
+        retention_max_age_days=project.retention_max_age_days,
+        retention_max_span_count=project.retention_max_span_count,
+    )
+
+
+_SPAN_STORE_SORT_ATTRIBUTES = {
+    SpanColumn.startTime: "start_time",
+    SpanColumn.endTime: "end_time",
+}
+
+
+def _connection_from_spans_in_store(
+    spans: List[models.Span],
+    first: Optional[int],
+    after: Optional[CursorString],
+    sort: Optional[SpanSort],
+) -> Connection[Span]:
+    """
+    Sorts and paginates the spans from the span store in the same way as the
+    query of `Project.spans` does.
+    """
+    sort_column = sort.col if sort else None
+
+    def sort_key(span: models.Span) -> Tuple[Any, int]:
+        assert sort_column
+        return getattr(span, _SPAN_STORE_SORT_ATTRIBUTES[sort_column]), span.id
+
+    is_descending = sort is not None and sort.dir is SortDir.desc
+    if sort_column:
+        spans = sorted(spans, key=sort_key, reverse=is_descending)
+    if after:
+        cursor = Cursor.from_string(after)
+        if sort_column and cursor.sort_column:
+            compare = operator.lt if is_descending else operator.gt
+            after_key = (cursor.sort_column.value, cursor.rowid)
+            spans = [span for span in spans if compare(sort_key(span), after_key)]
+        else:
+            spans = [span for span in spans if span.id > cursor.rowid]
+    page = spans[:first]
+    cursors_and_nodes = [
+        (
+            Cursor(
+                rowid=span.id,
+                sort_column=(
+                    CursorSortColumn(type=sort_column.data_type, value=sort_key(span)[0])
+                    if sort_column
+                    else None
+                ),
+            ),
+            to_gql_span(span),
+        )
+        for span in page
+    ]
+    return connection_from_cursors_and_nodes(
+        cursors_and_nodes,
+        has_previous_page=False,
+        has_next_page=len(spans) > len(page),
     )
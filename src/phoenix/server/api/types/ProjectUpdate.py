@@ -0,0 +1,44 @@
+from typing import List
+
+import strawberry
+from strawberry.relay import GlobalID
+
+from phoenix.server.project_updates import ProjectUpdate as ProjectUpdateData
+
+
+@strawberry.type
+class ProjectUpdate:
+    project_id: GlobalID
+    span_ids: List[GlobalID] = strawberry.field(
+        description="The spans inserted since the previous update, unless truncated."
+    )
+    is_truncated: bool = strawberry.field(
+        description="Whether there were too many new spans to list, in which case "
+        "the spans of the project should be refetched."
+    )
+    record_count_delta: int
+    trace_count_delta: int
+    token_count_total_delta: int
+    token_count_prompt_delta: int
+    token_count_completion_delta: int
+    has_new_evaluations: bool = strawberry.field(
+        description="Whether evaluations were inserted, in which case the evaluation "
+        "summaries of the project should be refetched."
+    )
+
+
+def to_gql_project_update(update: ProjectUpdateData) -> ProjectUpdate:
+    return ProjectUpdate(
+        project_id=GlobalID(type_name="Project", node_id=str(update.project_rowid)),
+        span_ids=[
+            GlobalID(type_name="Span", node_id=str(span_rowid)) for span_rowid in update.span_rowids
+        ],
+        is_truncated=update.is_truncated,
+        record_count_delta=update.record_count_delta,
+        trace_count_delta=update.trace_count_delta,
+        token_count_total_delta=update.token_count_prompt_delta
+        + update.token_count_completion_delta,
+        token_count_prompt_delta=update.token_count_prompt_delta,
+        token_count_completion_delta=update.token_count_completion_delta,
+        has_new_evaluations=update.has_new_evaluations,
+    )
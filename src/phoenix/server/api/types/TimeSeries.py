@@ -1,13 +1,21 @@
 from dataclasses import replace
 from datetime import datetime, timedelta
 from functools import total_ordering
-from typing import Iterable, List, Optional, Tuple, Union, cast
+from typing import Callable, Iterable, List, Optional, Tuple, Union, cast
 
 import pandas as pd
 import strawberry
 from strawberry import UNSET
 
-from phoenix.core.model_schema import CONTINUOUS, PRIMARY, REFERENCE, Column, Dimension, Inferences
+from phoenix.core.model_schema import (
+    CONTINUOUS,
+    PRIMARY,
+    REFERENCE,
+    Column,
+    Dimension,
+    Inferences,
+    Model,
+)
 from phoenix.metrics import Metric, binning
 from phoenix.metrics.mixins import UnaryOperator
 from phoenix.metrics.timeseries import timeseries
@@ -129,6 +137,73 @@ def get_drift_timeseries_data(
     granularity: Granularity,
     reference_data: pd.DataFrame,
 ) -> List[TimeSeriesDataPoint]:
+    metric_instance = _get_drift_metric_instance(
+        dimension,
+        metric,
+        reference_data,
+        lambda: binning.QuantileBinning(reference_series=dimension(reference_data)),
+    )
+    return _get_primary_timeseries_data(
+        dimension,
+        metric_instance,
+        time_range,
+        granularity,
+    )
+
+
+def get_reference_drift_timeseries_data(
+    model: Model,
+    dimension: Dimension,
+    metric: Union[ScalarDriftMetric, VectorDriftMetric],
+    time_range: TimeRange,
+    granularity: Granularity,
+) -> List[TimeSeriesDataPoint]:
+    """
+    Same as `get_drift_timeseries_data` with the model's reference inferences
+    as the reference data. The metric instance, which holds the summary of the
+    reference data (i.e. the bins and histogram, or the centroid), is cached on
+    the model, so only the primary data are processed on each call.
+    """
+    metric_instance = model.reference_summary(
+        (dimension.name, metric),
+        lambda: _get_drift_metric_instance(
+            dimension,
+            metric,
+            pd.DataFrame(
+                {dimension.name: dimension[REFERENCE]},
+                copy=False,
+            ),
+            lambda: get_reference_quantile_binning(model, dimension),
+        ),
+    )
+    return _get_primary_timeseries_data(
+        dimension,
+        metric_instance,
+        time_range,
+        granularity,
+    )
+
+
+def get_reference_quantile_binning(
+    model: Model,
+    dimension: Dimension,
+) -> binning.QuantileBinning:
+    """
+    Returns the quantile binning of the dimension using the model's reference
+    inferences, cached on the model.
+    """
+    return model.reference_summary(
+        (dimension.name, binning.QuantileBinning),
+        lambda: binning.QuantileBinning(reference_series=dimension[REFERENCE]),
+    )
+
+
+def _get_drift_metric_instance(
+    dimension: Dimension,
+    metric: Union[ScalarDriftMetric, VectorDriftMetric],
+    reference_data: pd.DataFrame,
+    quantile_binning: Callable[[], binning.QuantileBinning],
+) -> Metric:
     metric_instance = metric.value()
     metric_instance = replace(
         metric_instance,
@@ -138,17 +213,24 @@ def get_drift_timeseries_data(
     if isinstance(metric, ScalarDriftMetric) and dimension.data_type is CONTINUOUS:
         metric_instance = replace(
             metric_instance,
-            binning_method=binning.QuantileBinning(
-                reference_series=dimension[REFERENCE],
-            ),
+            binning_method=quantile_binning(),
         )
+    return cast(Metric, metric_instance)
+
+
+def _get_primary_timeseries_data(
+    dimension: Dimension,
+    metric: Metric,
+    time_range: TimeRange,
+    granularity: Granularity,
+) -> List[TimeSeriesDataPoint]:
     df = pd.DataFrame(
         {dimension.name: dimension[PRIMARY]},
         copy=False,
     )
     return get_timeseries_data(
         df,
-        metric_instance,
+        metric,
         time_range,
         granularity,
     )
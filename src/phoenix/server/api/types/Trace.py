@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional
 
 import strawberry
@@ -17,7 +18,7 @@ from phoenix.server.api.types.pagination import (
     CursorString,
     connection_from_list,
 )
-from phoenix.server.api.types.Span import Span, to_gql_span
+from phoenix.server.api.types.Span import Span, SpanKind, SpanStatusCode, to_gql_span
 
 
 @strawberry.type
@@ -32,6 +33,59 @@ class Trace(Node):
 
         return GlobalID(type_name=Project.__name__, node_id=str(self.project_rowid))
 
+    @strawberry.field
+    async def start_time(self, info: Info[Context, None]) -> datetime:
+        return (await self._summary(info)).start_time
+
+    @strawberry.field
+    async def end_time(self, info: Info[Context, None]) -> datetime:
+        return (await self._summary(info)).end_time
+
+    @strawberry.field
+    async def latency_ms(self, info: Info[Context, None]) -> float:
+        return (await self._summary(info)).latency_ms
+
+    @strawberry.field(description="The name of the root span, if it has arrived")  # type: ignore
+    async def root_span_name(self, info: Info[Context, None]) -> Optional[str]:
+        return (await self._summary(info)).root_span_name
+
+    @strawberry.field
+    async def root_span_kind(self, info: Info[Context, None]) -> Optional[SpanKind]:
+        root_span_kind = (await self._summary(info)).root_span_kind
+        return None if root_span_kind is None else SpanKind(root_span_kind)
+
+    @strawberry.field
+    async def root_span_status_code(self, info: Info[Context, None]) -> Optional[SpanStatusCode]:
+        root_span_status_code = (await self._summary(info)).root_span_status_code
+        return None if root_span_status_code is None else SpanStatusCode(root_span_status_code)
+
+    @strawberry.field
+    async def span_count(self, info: Info[Context, None]) -> int:
+        return (await self._summary(info)).span_count
+
+    @strawberry.field
+    async def error_count(self, info: Info[Context, None]) -> int:
+        return (await self._summary(info)).error_count
+
+    @strawberry.field
+    async def token_count_total(self, info: Info[Context, None]) -> int:
+        summary = await self._summary(info)
+        return summary.llm_token_count_prompt + summary.llm_token_count_completion
+
+    @strawberry.field
+    async def token_count_prompt(self, info: Info[Context, None]) -> int:
+        return (await self._summary(info)).llm_token_count_prompt
+
+    @strawberry.field
+    async def token_count_completion(self, info: Info[Context, None]) -> int:
+        return (await self._summary(info)).llm_token_count_completion
+
+    async def _summary(self, info: Info[Context, None]) -> models.Trace:
+        trace = await info.context.data_loaders.trace_summaries.load(self.id_attr)
+        if trace is None:
+            raise ValueError(f"Unknown trace: {self.id_attr}")
+        return trace
+
     @strawberry.field
     async def spans(
         self,
@@ -47,6 +101,11 @@ class Trace(Node):
             last=last,
             before=before if isinstance(before, CursorString) else None,
         )
+        if (span_store := info.context.span_store) is not None and (
+            spans_in_store := span_store.get_trace_spans(self.id_attr)
+        ) is not None:
+            data = [to_gql_span(span) for span in reversed(spans_in_store)][:first]
+            return connection_from_list(data=data, args=args)
         stmt = (
             select(models.Span)
             .join(models.Trace)
@@ -1,14 +1,18 @@
-from typing import AsyncContextManager, Callable, List
+from typing import AsyncContextManager, Callable, List, Optional
 
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from phoenix.db import models
+from phoenix.server.span_query_cache import SpanQueryCache
+from phoenix.utilities.span_store import SpanStore
 
 
 async def delete_projects(
     db: Callable[[], AsyncContextManager[AsyncSession]],
     *project_names: str,
+    span_store: Optional[SpanStore] = None,
+    span_query_cache: Optional[SpanQueryCache] = None,
 ) -> List[int]:
     if not project_names:
         return []
@@ -18,19 +22,34 @@ async def delete_projects(
         .returning(models.Project.id)
     )
     async with db() as session:
-        return list(await session.scalars(stmt))
+        project_rowids = list(await session.scalars(stmt))
+    for project_rowid in project_rowids:
+        if span_query_cache is not None:
+            span_query_cache.invalidate(project_rowid)
+        if span_store is not None:
+            span_store.clear(project_rowid)
+    return project_rowids
 
 
 async def delete_traces(
     db: Callable[[], AsyncContextManager[AsyncSession]],
     *trace_ids: str,
+    span_store: Optional[SpanStore] = None,
+    span_query_cache: Optional[SpanQueryCache] = None,
 ) -> List[int]:
     if not trace_ids:
         return []
     stmt = (
         delete(models.Trace)
         .where(models.Trace.trace_id.in_(set(trace_ids)))
-        .returning(models.Trace.id)
+        .returning(models.Trace.id, models.Trace.project_rowid)
     )
     async with db() as session:
-        return list(await session.scalars(stmt))
+        rows = (await session.execute(stmt)).all()
+    trace_rowids = [trace_rowid for trace_rowid, _ in rows]
+    if span_query_cache is not None:
+        for project_rowid in {project_rowid for _, project_rowid in rows}:
+            span_query_cache.invalidate(project_rowid)
+    if span_store is not None:
+        span_store.discard_traces(trace_rowids)
+    return trace_rowids
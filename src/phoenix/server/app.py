@@ -10,6 +10,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -32,13 +33,15 @@ from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import FileResponse, PlainTextResponse, Response
-from starlette.routing import Mount, Route
+from starlette.routing import Mount, Route, WebSocketRoute
 from starlette.staticfiles import StaticFiles
 from starlette.templating import Jinja2Templates
 from starlette.types import Scope, StatefulLifespan
 from starlette.websockets import WebSocket
 from strawberry.asgi import GraphQL
+from strawberry.extensions import SchemaExtension
 from strawberry.schema import BaseSchema
+from strawberry.types.graphql import OperationType
 from typing_extensions import TypeAlias
 
 import phoenix
@@ -46,12 +49,19 @@ import phoenix.trace.v1 as pb
 from phoenix.config import (
     DEFAULT_PROJECT_NAME,
     SERVER_DIR,
+    get_env_enable_span_full_text_index,
     server_instrumentation_is_enabled,
 )
 from phoenix.core.model_schema import Model
 from phoenix.db.bulk_inserter import BulkInserter
 from phoenix.db.engines import create_engine
 from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.models import (
+    create_span_full_text_index,
+    drop_span_full_text_index,
+    has_span_full_text_index,
+)
+from phoenix.db.retention import RetentionEnforcer
 from phoenix.exceptions import PhoenixMigrationError
 from phoenix.pointcloud.umap_parameters import UMAPParameters
 from phoenix.server.api.context import Context, DataLoaders
@@ -78,14 +88,19 @@ from phoenix.server.api.dataloaders import (
     TokenCountDataLoader,
     TraceEvaluationsDataLoader,
     TraceRowIdsDataLoader,
+    TraceSummariesDataLoader,
 )
 from phoenix.server.api.openapi.schema import OPENAPI_SCHEMA_GENERATOR
 from phoenix.server.api.routers.v1 import V1_ROUTES
 from phoenix.server.api.schema import schema
 from phoenix.server.grpc_server import GrpcServer
 from phoenix.server.openapi.docs import get_swagger_ui_html
+from phoenix.server.otlp_decoder import OtlpDecoder
+from phoenix.server.project_updates import ProjectUpdateBroker
+from phoenix.server.span_query_cache import SpanQueryCache
 from phoenix.server.telemetry import initialize_opentelemetry_tracer_provider
 from phoenix.trace.schemas import Span
+from phoenix.utilities.span_store import SpanStore
 
 if TYPE_CHECKING:
     from opentelemetry.trace import TracerProvider
@@ -161,6 +176,7 @@ class GraphQLWithContext(GraphQL):  # type: ignore
         self,
         schema: BaseSchema,
         db: Callable[[], AsyncContextManager[AsyncSession]],
+        read_db: Callable[[], AsyncContextManager[AsyncSession]],
         model: Model,
         export_path: Path,
         graphiql: bool = False,
@@ -168,14 +184,21 @@ class GraphQLWithContext(GraphQL):  # type: ignore
         streaming_last_updated_at: Callable[[ProjectRowId], Optional[datetime]] = lambda _: None,
         cache_for_dataloaders: Optional[CacheForDataLoaders] = None,
         read_only: bool = False,
+        span_query_cache: Optional[SpanQueryCache] = None,
+        project_update_broker: Optional[ProjectUpdateBroker] = None,
+        span_store: Optional[SpanStore] = None,
     ) -> None:
         self.db = db
+        self.read_db = read_db
         self.model = model
         self.corpus = corpus
         self.export_path = export_path
         self.streaming_last_updated_at = streaming_last_updated_at
         self.cache_for_dataloaders = cache_for_dataloaders
         self.read_only = read_only
+        self.span_query_cache = span_query_cache
+        self.project_update_broker = project_update_broker
+        self.span_store = span_store
         super().__init__(schema, graphiql=graphiql)
 
     async def get_context(
@@ -183,72 +206,100 @@ class GraphQLWithContext(GraphQL):  # type: ignore
         request: Union[Request, WebSocket],
         response: Optional[Response] = None,
     ) -> Context:
+        # Whether the full-text index exists is only known once the app starts.
+        search_text_index: bool = request.app.state.has_span_full_text_index
         return Context(
             request=request,
             response=response,
             db=self.db,
+            read_db=self.read_db,
             model=self.model,
             corpus=self.corpus,
             export_path=self.export_path,
             streaming_last_updated_at=self.streaming_last_updated_at,
             data_loaders=DataLoaders(
-                average_experiment_run_latency=AverageExperimentRunLatencyDataLoader(self.db),
-                dataset_example_revisions=DatasetExampleRevisionsDataLoader(self.db),
-                dataset_example_spans=DatasetExampleSpansDataLoader(self.db),
+                average_experiment_run_latency=AverageExperimentRunLatencyDataLoader(self.read_db),
+                dataset_example_revisions=DatasetExampleRevisionsDataLoader(self.read_db),
+                dataset_example_spans=DatasetExampleSpansDataLoader(self.read_db),
                 document_evaluation_summaries=DocumentEvaluationSummaryDataLoader(
-                    self.db,
+                    self.read_db,
                     cache_map=self.cache_for_dataloaders.document_evaluation_summary
                     if self.cache_for_dataloaders
                     else None,
+                    search_text_index=search_text_index,
                 ),
-                document_evaluations=DocumentEvaluationsDataLoader(self.db),
-                document_retrieval_metrics=DocumentRetrievalMetricsDataLoader(self.db),
+                document_evaluations=DocumentEvaluationsDataLoader(self.read_db),
+                document_retrieval_metrics=DocumentRetrievalMetricsDataLoader(self.read_db),
                 evaluation_summaries=EvaluationSummaryDataLoader(
-                    self.db,
+                    self.read_db,
                     cache_map=self.cache_for_dataloaders.evaluation_summary
                     if self.cache_for_dataloaders
                     else None,
+                    search_text_index=search_text_index,
                 ),
-                experiment_annotation_summaries=ExperimentAnnotationSummaryDataLoader(self.db),
-                experiment_error_rates=ExperimentErrorRatesDataLoader(self.db),
-                experiment_run_counts=ExperimentRunCountsDataLoader(self.db),
-                experiment_sequence_number=ExperimentSequenceNumberDataLoader(self.db),
+                experiment_annotation_summaries=ExperimentAnnotationSummaryDataLoader(self.read_db),
+                experiment_error_rates=ExperimentErrorRatesDataLoader(self.read_db),
+                experiment_run_counts=ExperimentRunCountsDataLoader(self.read_db),
+                experiment_sequence_number=ExperimentSequenceNumberDataLoader(self.read_db),
                 latency_ms_quantile=LatencyMsQuantileDataLoader(
-                    self.db,
+                    self.read_db,
                     cache_map=self.cache_for_dataloaders.latency_ms_quantile
                     if self.cache_for_dataloaders
                     else None,
+                    span_store=self.span_store,
+                    search_text_index=search_text_index,
                 ),
                 min_start_or_max_end_times=MinStartOrMaxEndTimeDataLoader(
-                    self.db,
+                    self.read_db,
                     cache_map=self.cache_for_dataloaders.min_start_or_max_end_time
                     if self.cache_for_dataloaders
                     else None,
                 ),
                 record_counts=RecordCountDataLoader(
-                    self.db,
+                    self.read_db,
                     cache_map=self.cache_for_dataloaders.record_count
                     if self.cache_for_dataloaders
                     else None,
+                    span_store=self.span_store,
+                    search_text_index=search_text_index,
                 ),
-                span_descendants=SpanDescendantsDataLoader(self.db),
-                span_evaluations=SpanEvaluationsDataLoader(self.db),
-                span_projects=SpanProjectsDataLoader(self.db),
+                span_descendants=SpanDescendantsDataLoader(self.read_db),
+                span_evaluations=SpanEvaluationsDataLoader(self.read_db),
+                span_projects=SpanProjectsDataLoader(self.read_db),
                 token_counts=TokenCountDataLoader(
-                    self.db,
+                    self.read_db,
                     cache_map=self.cache_for_dataloaders.token_count
                     if self.cache_for_dataloaders
                     else None,
+                    search_text_index=search_text_index,
                 ),
-                trace_evaluations=TraceEvaluationsDataLoader(self.db),
-                trace_row_ids=TraceRowIdsDataLoader(self.db),
-                project_by_name=ProjectByNameDataLoader(self.db),
+                trace_evaluations=TraceEvaluationsDataLoader(self.read_db),
+                trace_row_ids=TraceRowIdsDataLoader(self.read_db),
+                trace_summaries=TraceSummariesDataLoader(self.read_db),
+                project_by_name=ProjectByNameDataLoader(self.read_db),
             ),
             cache_for_dataloaders=self.cache_for_dataloaders,
             read_only=self.read_only,
+            span_query_cache=self.span_query_cache,
+            project_update_broker=self.project_update_broker,
+            span_store=self.span_store,
+            has_span_full_text_index=search_text_index,
         )
 
 
+class _ReadQueriesFromReader(SchemaExtension):
+    """
+    Points the sessions of queries at the database engine for reads, leaving
+    mutations on the engine for writes.
+    """
+
+    def on_execute(self) -> Iterator[None]:
+        if self.execution_context.operation_type is OperationType.QUERY:
+            context = cast(Context, self.execution_context.context)
+            context.db = context.read_db
+        yield
+
+
 class Download(HTTPEndpoint):
     path: Path
 
@@ -281,14 +332,29 @@ def _db(engine: AsyncEngine) -> Callable[[], AsyncContextManager[AsyncSession]]:
 
 def _lifespan(
     *,
+    db: Callable[[], AsyncContextManager[AsyncSession]],
     bulk_inserter: BulkInserter,
+    retention_enforcer: RetentionEnforcer,
+    otlp_decoder: Optional[OtlpDecoder] = None,
     tracer_provider: Optional["TracerProvider"] = None,
     enable_prometheus: bool = False,
     clean_ups: Iterable[Callable[[], None]] = (),
     read_only: bool = False,
+    enable_span_full_text_index: bool = False,
 ) -> StatefulLifespan[Starlette]:
     @contextlib.asynccontextmanager
-    async def lifespan(_: Starlette) -> AsyncIterator[Dict[str, Any]]:
+    async def lifespan(app: Starlette) -> AsyncIterator[Dict[str, Any]]:
+        async with db() as session:
+            connection = await session.connection()
+            if not read_only:
+                await connection.run_sync(
+                    create_span_full_text_index
+                    if enable_span_full_text_index
+                    else drop_span_full_text_index
+                )
+            # Filters search the index only if it exists, which is not implied
+            # by the setting, e.g. for a read-only server.
+            app.state.has_span_full_text_index = await connection.run_sync(has_span_full_text_index)
         async with bulk_inserter as (
             queue_span,
             queue_evaluation,
@@ -296,9 +362,10 @@ def _lifespan(
         ), GrpcServer(
             queue_span,
             disabled=read_only,
+            otlp_decoder=otlp_decoder,
             tracer_provider=tracer_provider,
             enable_prometheus=enable_prometheus,
-        ):
+        ), retention_enforcer:
             yield {
                 "queue_span_for_bulk_insert": queue_span,
                 "queue_evaluation_for_bulk_insert": queue_evaluation,
@@ -327,13 +394,22 @@ class SessionFactory:
         self,
         session_factory: Callable[[], AsyncContextManager[AsyncSession]],
         dialect: str,
+        reader_session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]] = None,
     ):
         self.session_factory = session_factory
+        self.reader_session_factory = reader_session_factory or session_factory
         self.dialect = SupportedSQLDialect(dialect)
 
     def __call__(self) -> AsyncContextManager[AsyncSession]:
         return self.session_factory()
 
+    def reader(self) -> AsyncContextManager[AsyncSession]:
+        """
+        Returns a session for reads, which uses the engine for reads if there
+        is one, and otherwise falls back to the engine for writes.
+        """
+        return self.reader_session_factory()
+
 
 def create_engine_and_run_migrations(
     database_url: str,
@@ -356,14 +432,14 @@ def create_engine_and_run_migrations(
         raise PhoenixMigrationError(msg) from e
 
 
-def instrument_engine_if_enabled(engine: AsyncEngine) -> List[Callable[[], None]]:
+def instrument_engine_if_enabled(*engines: AsyncEngine) -> List[Callable[[], None]]:
     instrumentation_cleanups = []
     if server_instrumentation_is_enabled():
         from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
 
         tracer_provider = initialize_opentelemetry_tracer_provider()
         SQLAlchemyInstrumentor().instrument(
-            engine=engine.sync_engine,
+            engines=[engine.sync_engine for engine in engines],
             tracer_provider=tracer_provider,
         )
         instrumentation_cleanups.append(SQLAlchemyInstrumentor().uninstrument)
@@ -382,6 +458,9 @@ def create_app(
     initial_spans: Optional[Iterable[Union[Span, Tuple[Span, str]]]] = None,
     initial_evaluations: Optional[Iterable[pb.Evaluation]] = None,
     serve_ui: bool = True,
+    span_query_cache_size_mb: int = 0,
+    span_store_size: int = 0,
+    ingestion_workers: int = 0,
     clean_up_callbacks: List[Callable[[], None]] = [],
 ) -> Starlette:
     clean_ups: List[Callable[[], None]] = clean_up_callbacks  # To be called at app shutdown.
@@ -397,16 +476,41 @@ def create_app(
     cache_for_dataloaders = (
         CacheForDataLoaders() if db.dialect is SupportedSQLDialect.SQLITE else None
     )
+    span_query_cache = (
+        SpanQueryCache(max_bytes=span_query_cache_size_mb * 1024 * 1024)
+        if span_query_cache_size_mb > 0
+        else None
+    )
+    span_store = (
+        SpanStore(max_spans_per_project=span_store_size, dialect=db.dialect)
+        if span_store_size > 0
+        else None
+    )
+    project_update_broker = ProjectUpdateBroker()
+    otlp_decoder = OtlpDecoder(num_workers=ingestion_workers) if ingestion_workers > 0 else None
+    if otlp_decoder is not None:
+        clean_ups.append(otlp_decoder.shutdown)
 
     bulk_inserter = BulkInserter(
         db,
         enable_prometheus=enable_prometheus,
         cache_for_dataloaders=cache_for_dataloaders,
+        span_query_cache=span_query_cache,
+        project_update_broker=project_update_broker,
+        span_store=span_store,
         initial_batch_of_spans=initial_batch_of_spans,
         initial_batch_of_evaluations=initial_batch_of_evaluations,
     )
+    retention_enforcer = RetentionEnforcer(
+        db,
+        db.dialect,
+        cache_for_dataloaders=cache_for_dataloaders,
+        span_query_cache=span_query_cache,
+        span_store=span_store,
+        disabled=read_only,
+    )
     tracer_provider = None
-    strawberry_extensions = schema.get_extensions()
+    strawberry_extensions = [*schema.get_extensions(), _ReadQueriesFromReader]
     if server_instrumentation_is_enabled():
         from opentelemetry.trace import TracerProvider
         from strawberry.extensions.tracing import OpenTelemetryExtension
@@ -427,6 +531,7 @@ def create_app(
 
     graphql = GraphQLWithContext(
         db=db,
+        read_db=db.reader,
         schema=strawberry.Schema(
             query=schema.query,
             mutation=schema.mutation,
@@ -440,6 +545,9 @@ def create_app(
         streaming_last_updated_at=bulk_inserter.last_updated_at,
         cache_for_dataloaders=cache_for_dataloaders,
         read_only=read_only,
+        span_query_cache=span_query_cache,
+        project_update_broker=project_update_broker,
+        span_store=span_store,
     )
     if enable_prometheus:
         from phoenix.server.prometheus import PrometheusMiddleware
@@ -449,11 +557,15 @@ def create_app(
         prometheus_middlewares = []
     app = Starlette(
         lifespan=_lifespan(
+            db=db,
             read_only=read_only,
             bulk_inserter=bulk_inserter,
+            retention_enforcer=retention_enforcer,
+            otlp_decoder=otlp_decoder,
             tracer_provider=tracer_provider,
             enable_prometheus=enable_prometheus,
             clean_ups=clean_ups,
+            enable_span_full_text_index=get_env_enable_span_full_text_index(),
         ),
         middleware=[
             Middleware(HeadersMiddleware),
@@ -481,6 +593,10 @@ def create_app(
                 "/graphql",
                 graphql,
             ),
+            WebSocketRoute(
+                "/graphql",
+                graphql,
+            ),
         ]
         + (
             [
@@ -505,6 +621,11 @@ def create_app(
     )
     app.state.read_only = read_only
     app.state.db = db
+    app.state.read_db = db.reader
+    app.state.span_query_cache = span_query_cache
+    app.state.span_store = span_store
+    app.state.otlp_decoder = otlp_decoder
+    app.state.has_span_full_text_index = False
     if tracer_provider:
         from opentelemetry.instrumentation.starlette import StarletteInstrumentor
 
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional
 
 import grpc
+from google.protobuf.message import DecodeError
 from grpc.aio import RpcContext, Server, ServerInterceptor
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
@@ -13,6 +14,7 @@ from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (
 from typing_extensions import TypeAlias
 
 from phoenix.config import get_env_grpc_port
+from phoenix.server.otlp_decoder import OtlpDecoder
 from phoenix.trace.otel import decode_otlp_span
 from phoenix.trace.schemas import Span
 from phoenix.utilities.project import get_project_name
@@ -45,6 +47,49 @@ class Servicer(TraceServiceServicer):
         return ExportTraceServiceResponse()
 
 
+class DecodingServicer:
+    """
+    Receives the export requests undeserialized, so that they are decoded by
+    the `OtlpDecoder` in its worker processes instead of on the event loop.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Span, ProjectName], Awaitable[None]],
+        otlp_decoder: OtlpDecoder,
+    ) -> None:
+        self._callback = callback
+        self._otlp_decoder = otlp_decoder
+
+    async def Export(
+        self,
+        request: bytes,
+        context: grpc.aio.ServicerContext[bytes, ExportTraceServiceResponse],
+    ) -> ExportTraceServiceResponse:
+        try:
+            spans = await self._otlp_decoder.decode(request)
+        except DecodeError:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Request is invalid ExportTraceServiceRequest",
+            )
+        for span, project_name in spans:
+            await self._callback(span, project_name)
+        return ExportTraceServiceResponse()
+
+    def add_to_server(self, server: Server) -> None:
+        handler = grpc.method_handlers_generic_handler(
+            "opentelemetry.proto.collector.trace.v1.TraceService",
+            {
+                "Export": grpc.unary_unary_rpc_method_handler(
+                    self.Export,
+                    response_serializer=ExportTraceServiceResponse.SerializeToString,
+                ),
+            },
+        )
+        server.add_generic_rpc_handlers((handler,))
+
+
 class GrpcServer:
     def __init__(
         self,
@@ -52,8 +97,10 @@ class GrpcServer:
         tracer_provider: Optional["TracerProvider"] = None,
         enable_prometheus: bool = False,
         disabled: bool = False,
+        otlp_decoder: Optional[OtlpDecoder] = None,
     ) -> None:
         self._callback = callback
+        self._otlp_decoder = otlp_decoder
         self._server: Optional[Server] = None
         self._tracer_provider = tracer_provider
         self._enable_prometheus = enable_prometheus
@@ -78,7 +125,10 @@ class GrpcServer:
             interceptors=interceptors,
         )
         server.add_insecure_port(f"[::]:{get_env_grpc_port()}")
-        add_TraceServiceServicer_to_server(Servicer(self._callback), server)  # type: ignore
+        if self._otlp_decoder is not None:
+            DecodingServicer(self._callback, self._otlp_decoder).add_to_server(server)
+        else:
+            add_TraceServiceServicer_to_server(Servicer(self._callback), server)  # type: ignore
         await server.start()
         self._server = server
 
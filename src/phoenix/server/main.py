@@ -2,6 +2,7 @@ import atexit
 import logging
 import os
 from argparse import ArgumentParser
+from itertools import chain
 from pathlib import Path, PosixPath
 from threading import Thread
 from time import sleep, time
@@ -18,12 +19,16 @@ from phoenix.config import (
     get_env_grpc_port,
     get_env_host,
     get_env_host_root_path,
+    get_env_ingestion_workers,
     get_env_port,
+    get_env_span_query_cache_size_mb,
+    get_env_span_store_size,
     get_pids_path,
     get_working_dir,
 )
 from phoenix.core.model_schema_adapter import create_model_from_inferences
 from phoenix.db import get_printable_db_url
+from phoenix.db.engines import create_read_only_engine
 from phoenix.inferences.fixtures import FIXTURES, get_inferences
 from phoenix.inferences.inferences import EMPTY_INFERENCES, Inferences
 from phoenix.pointcloud.umap_parameters import (
@@ -39,6 +44,7 @@ from phoenix.server.app import (
     create_engine_and_run_migrations,
     instrument_engine_if_enabled,
 )
+from phoenix.session.evaluation import encode_evaluations
 from phoenix.settings import Settings
 from phoenix.trace.fixtures import (
     TRACES_FIXTURES,
@@ -52,6 +58,7 @@ from phoenix.trace.fixtures import (
 from phoenix.trace.otel import decode_otlp_span, encode_span_to_otlp
 from phoenix.trace.schemas import Span
 from phoenix.trace.span_json_decoder import json_string_to_span
+from phoenix.trace.trace_dataset import TraceDataset
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +117,7 @@ if __name__ == "__main__":
     primary_inferences_name: str
     reference_inferences_name: Optional[str]
     trace_dataset_name: Optional[str] = None
+    trace_dataset: Optional[TraceDataset] = None
     simulate_streaming: Optional[bool] = None
 
     primary_inferences: Inferences = EMPTY_INFERENCES
@@ -170,6 +178,7 @@ if __name__ == "__main__":
         corpus_inferences = (
             None if corpus_inferences_name is None else Inferences.from_name(corpus_inferences_name)
         )
+        trace_dataset = None if args.trace is None else TraceDataset.from_name(args.trace)
     elif args.command == "fixture":
         fixture_name = args.fixture
         primary_only = args.primary_only
@@ -232,6 +241,11 @@ if __name__ == "__main__":
                 target=send_dataset_fixtures,
                 args=(f"http://{host}:{port}", dataset_fixtures),
             ).start()
+    elif trace_dataset is not None:
+        fixture_spans = list(trace_dataset.to_spans())
+        fixture_evals = list(
+            chain.from_iterable(map(encode_evaluations, trace_dataset.evaluations))
+        )
     umap_params_list = args.umap_params.split(",")
     umap_params = UMAPParameters(
         min_dist=float(umap_params_list[0]),
@@ -247,8 +261,21 @@ if __name__ == "__main__":
 
     working_dir = get_working_dir().resolve()
     engine = create_engine_and_run_migrations(db_connection_str)
-    instrumentation_cleanups = instrument_engine_if_enabled(engine)
-    factory = SessionFactory(session_factory=_db(engine), dialect=engine.dialect.name)
+    read_engine = create_read_only_engine(db_connection_str)
+    instrumentation_cleanups = instrument_engine_if_enabled(
+        *([engine] if read_engine is None else [engine, read_engine])
+    )
+    if enable_prometheus:
+        from phoenix.server.prometheus import register_database_pool
+
+        register_database_pool("write", engine)
+        if read_engine is not None:
+            register_database_pool("read", read_engine)
+    factory = SessionFactory(
+        session_factory=_db(engine),
+        dialect=engine.dialect.name,
+        reader_session_factory=None if read_engine is None else _db(read_engine),
+    )
     app = create_app(
         db=factory,
         export_path=export_path,
@@ -260,6 +287,9 @@ if __name__ == "__main__":
         debug=args.debug,
         read_only=read_only,
         enable_prometheus=enable_prometheus,
+        span_query_cache_size_mb=get_env_span_query_cache_size_mb(),
+        span_store_size=get_env_span_store_size(),
+        ingestion_workers=get_env_ingestion_workers(),
         initial_spans=fixture_spans,
         initial_evaluations=fixture_evals,
         clean_up_callbacks=instrumentation_cleanups,
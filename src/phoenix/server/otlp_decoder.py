@@ -0,0 +1,72 @@
+import asyncio
+import gzip
+import multiprocessing
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from typing_extensions import TypeAlias
+
+from phoenix.trace.otel import decode_otlp_span
+from phoenix.trace.schemas import Span
+from phoenix.utilities.project import get_project_name
+
+ProjectName: TypeAlias = str
+
+
+class OtlpDecoder:
+    """
+    Decompresses and decodes OTLP trace export requests in a pool of worker
+    processes, so that ingestion is not limited to the one core running the
+    server's event loop. Only the decoded spans are sent back to the server
+    process, which remains the sole writer to the database.
+    """
+
+    def __init__(self, num_workers: int) -> None:
+        # Worker processes are spawned rather than forked, because the server
+        # process is running threads and an event loop when they are started.
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    async def decode(
+        self,
+        body: bytes,
+        content_encoding: Optional[str] = None,
+    ) -> List[Tuple[Span, ProjectName]]:
+        """
+        Returns the spans in the serialized request along with their project
+        names. Raises `google.protobuf.message.DecodeError` if the request is
+        invalid.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            decode_export_trace_service_request,
+            body,
+            content_encoding,
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def decode_export_trace_service_request(
+    body: bytes,
+    content_encoding: Optional[str] = None,
+) -> List[Tuple[Span, ProjectName]]:
+    if content_encoding == "gzip":
+        body = gzip.decompress(body)
+    elif content_encoding == "deflate":
+        body = zlib.decompress(body)
+    req = ExportTraceServiceRequest()
+    req.ParseFromString(body)
+    spans = []
+    for resource_spans in req.resource_spans:
+        project_name = get_project_name(resource_spans.resource.attributes)
+        for scope_span in resource_spans.scope_spans:
+            for otlp_span in scope_span.spans:
+                spans.append((decode_otlp_span(otlp_span), project_name))
+    return spans
@@ -0,0 +1,80 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Dict, List, Set
+
+from typing_extensions import TypeAlias
+
+ProjectRowId: TypeAlias = int
+
+
+@dataclass
+class ProjectUpdate:
+    """
+    The changes to a project committed since the previous update, i.e. the
+    newly inserted spans and the deltas of the project's summaries.
+    """
+
+    project_rowid: ProjectRowId
+    span_rowids: List[int] = field(default_factory=list)
+    is_truncated: bool = False
+    """Whether the span row IDs were dropped for exceeding the maximum."""
+    record_count_delta: int = 0
+    trace_count_delta: int = 0
+    token_count_prompt_delta: int = 0
+    token_count_completion_delta: int = 0
+    has_new_evaluations: bool = False
+
+    def merge(self, other: "ProjectUpdate", max_span_rowids: int) -> None:
+        self.is_truncated |= other.is_truncated
+        self.is_truncated |= len(self.span_rowids) + len(other.span_rowids) > max_span_rowids
+        if self.is_truncated:
+            self.span_rowids.clear()
+        else:
+            self.span_rowids.extend(other.span_rowids)
+        self.record_count_delta += other.record_count_delta
+        self.trace_count_delta += other.trace_count_delta
+        self.token_count_prompt_delta += other.token_count_prompt_delta
+        self.token_count_completion_delta += other.token_count_completion_delta
+        self.has_new_evaluations |= other.has_new_evaluations
+
+
+class _Subscriber:
+    def __init__(self, project_rowid: ProjectRowId) -> None:
+        self.project_rowid = project_rowid
+        self.pending: ProjectUpdate = ProjectUpdate(project_rowid)
+        self.has_pending = asyncio.Event()
+
+
+class ProjectUpdateBroker:
+    """
+    Relays the updates committed by the bulk inserter to the subscribers of
+    each project. Updates that arrive while a subscriber is busy are merged
+    into a single pending update, so a slow subscriber holds at most one
+    update per project. Once the pending update would exceed the maximum
+    number of span row IDs, the row IDs are dropped and the update is marked
+    as truncated, upon which the subscriber should refetch the project's spans.
+    """
+
+    def __init__(self, max_span_rowids: int = 1000) -> None:
+        self._max_span_rowids = max_span_rowids
+        self._subscribers: Dict[ProjectRowId, Set[_Subscriber]] = {}
+
+    def publish(self, update: ProjectUpdate) -> None:
+        for subscriber in self._subscribers.get(update.project_rowid, ()):
+            subscriber.pending.merge(update, self._max_span_rowids)
+            subscriber.has_pending.set()
+
+    async def subscribe(self, project_rowid: ProjectRowId) -> AsyncGenerator[ProjectUpdate, None]:
+        subscriber = _Subscriber(project_rowid)
+        self._subscribers.setdefault(project_rowid, set()).add(subscriber)
+        try:
+            while True:
+                await subscriber.has_pending.wait()
+                update, subscriber.pending = subscriber.pending, ProjectUpdate(project_rowid)
+                subscriber.has_pending.clear()
+                yield update
+        finally:
+            subscribers = self._subscribers[project_rowid]
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[project_rowid]
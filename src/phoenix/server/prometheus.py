@@ -1,5 +1,6 @@
 import time
 from threading import Thread
+from typing import Dict
 
 import psutil
 from prometheus_client import (
@@ -8,6 +9,8 @@ from prometheus_client import (
     Summary,
     start_http_server,
 )
+from sqlalchemy import QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
@@ -49,6 +52,23 @@ BULK_LOADER_EXCEPTIONS = Counter(
     name="bulk_loader_exceptions_total",
     documentation="Total count of bulk loader exceptions",
 )
+DB_POOL_CONNECTIONS = Gauge(
+    name="db_pool_connections",
+    documentation="Count of database connections by pool and state",
+    labelnames=["pool", "state"],
+)
+
+_DATABASE_POOLS: Dict[str, QueuePool] = {}
+
+
+def register_database_pool(name: str, engine: AsyncEngine) -> None:
+    """
+    Registers the connection pool of an engine, e.g. the engine for reads, to
+    be reported in the pool metrics. Pools that don't keep connections, such
+    as `NullPool`, have nothing to report and are ignored.
+    """
+    if isinstance(pool := engine.pool, QueuePool):
+        _DATABASE_POOLS[name] = pool
 
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
@@ -89,3 +109,8 @@ def gather_system_data() -> None:
 
         for core, percent in enumerate(psutil.cpu_percent(interval=1, percpu=True)):
             CPU_METRIC.labels(core=core).set(percent)
+
+        for name, pool in _DATABASE_POOLS.items():
+            DB_POOL_CONNECTIONS.labels(pool=name, state="checked_out").set(pool.checkedout())
+            DB_POOL_CONNECTIONS.labels(pool=name, state="idle").set(pool.checkedin())
+            DB_POOL_CONNECTIONS.labels(pool=name, state="overflow").set(max(pool.overflow(), 0))
@@ -0,0 +1,59 @@
+import json
+from hashlib import sha256
+from secrets import token_hex
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from cachetools import LRUCache
+from typing_extensions import TypeAlias
+
+ProjectRowId: TypeAlias = int
+
+
+class SpanQueryCache:
+    """
+    Caches the serialized results of span queries, up to a total number of
+    bytes. Each result is keyed on the query together with the data version of
+    its project, which the bulk inserter advances whenever spans or evaluations
+    are inserted for the project, and which is also advanced whenever spans or
+    the project itself are deleted. Results for outdated versions are therefore
+    never served again and simply age out of the cache.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._results: LRUCache[str, Tuple[bytes, Dict[str, str]]] = LRUCache(
+            maxsize=max_bytes,
+            getsizeof=lambda content_and_headers: len(content_and_headers[0]),
+        )
+        self._data_versions: Dict[ProjectRowId, int] = {}
+        # Data versions restart along with the server, so the entity tags
+        # are salted to keep those issued by a previous server from matching.
+        self._salt = token_hex(8)
+
+    def data_version(self, project_rowid: ProjectRowId) -> int:
+        return self._data_versions.get(project_rowid, 0)
+
+    def invalidate(self, project_rowid: ProjectRowId) -> None:
+        self._data_versions[project_rowid] = self.data_version(project_rowid) + 1
+
+    def etag(self, project_rowid: ProjectRowId, request: Mapping[str, Any]) -> str:
+        """
+        Returns the entity tag for the results of the request at the current
+        data version of the project.
+        """
+        key = json.dumps(
+            [self._salt, project_rowid, self.data_version(project_rowid), request],
+            sort_keys=True,
+            default=str,
+        )
+        return f'"{sha256(key.encode()).hexdigest()}"'
+
+    def get(self, etag: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """
+        Returns the content and the headers of the response cached for the
+        entity tag.
+        """
+        return self._results.get(etag)
+
+    def set(self, etag: str, content: bytes, headers: Mapping[str, str]) -> None:
+        if len(content) <= self._results.maxsize:
+            self._results[etag] = (content, dict(headers))
@@ -1,5 +1,6 @@
 import csv
 import gzip
+import json
 import logging
 import re
 import weakref
@@ -20,12 +21,14 @@ from typing import (
     Tuple,
     Union,
     cast,
+    overload,
 )
 from urllib.parse import quote, urljoin
 
 import httpx
 import pandas as pd
 import pyarrow as pa
+from cachetools import LRUCache
 from httpx import HTTPStatusError, Response
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
 from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
@@ -53,6 +56,15 @@ logger = logging.getLogger(__name__)
 
 DatasetAction: TypeAlias = Literal["create", "append"]
 
+# Total size in bytes of the span query results kept for revalidation with the
+# server, which replies Not Modified when its cached results are still current.
+_SPAN_QUERY_RESULTS_CACHE_SIZE = 64 * 1024 * 1024
+
+_NEXT_CURSOR_HEADER = "X-Phoenix-Next-Cursor"
+
+# The maximum number of rows of evaluations uploaded per request.
+_EVALUATIONS_CHUNK_SIZE = 100_000
+
 
 class Client(TraceDataExtractor):
     def __init__(
@@ -89,6 +101,10 @@ class Client(TraceDataExtractor):
         base_url = endpoint or get_env_collector_endpoint() or f"http://{host}:{get_env_port()}"
         self._base_url = base_url if base_url.endswith("/") else base_url + "/"
         self._client = httpx.Client(headers=headers)
+        self._span_query_results: LRUCache[str, Tuple[str, bytes, Optional[str]]] = LRUCache(
+            maxsize=_SPAN_QUERY_RESULTS_CACHE_SIZE,
+            getsizeof=lambda etag_content_and_cursor: len(etag_content_and_cursor[1]),
+        )
         weakref.finalize(self, self._client.close)
         if warn_if_server_not_running:
             self._warn_if_phoenix_is_not_running()
@@ -110,6 +126,7 @@ class Client(TraceDataExtractor):
             return session.url
         return self._base_url
 
+    @overload
     def query_spans(
         self,
         *queries: SpanQuery,
@@ -118,9 +135,40 @@ class Client(TraceDataExtractor):
         limit: Optional[int] = DEFAULT_SPAN_LIMIT,
         root_spans_only: Optional[bool] = None,
         project_name: Optional[str] = None,
+        after_cursor: None = None,
         # Deprecated
         stop_time: Optional[datetime] = None,
-    ) -> Optional[Union[pd.DataFrame, List[pd.DataFrame]]]:
+    ) -> Optional[Union[pd.DataFrame, List[pd.DataFrame]]]: ...
+
+    @overload
+    def query_spans(
+        self,
+        *queries: SpanQuery,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = DEFAULT_SPAN_LIMIT,
+        root_spans_only: Optional[bool] = None,
+        project_name: Optional[str] = None,
+        after_cursor: str,
+        # Deprecated
+        stop_time: Optional[datetime] = None,
+    ) -> Tuple[Optional[Union[pd.DataFrame, List[pd.DataFrame]]], str]: ...
+
+    def query_spans(
+        self,
+        *queries: SpanQuery,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = DEFAULT_SPAN_LIMIT,
+        root_spans_only: Optional[bool] = None,
+        project_name: Optional[str] = None,
+        after_cursor: Optional[str] = None,
+        # Deprecated
+        stop_time: Optional[datetime] = None,
+    ) -> Union[
+        Optional[Union[pd.DataFrame, List[pd.DataFrame]]],
+        Tuple[Optional[Union[pd.DataFrame, List[pd.DataFrame]]], str],
+    ]:
         """
         Queries spans from the Phoenix server or active session based on specified criteria.
 
@@ -131,10 +179,16 @@ class Client(TraceDataExtractor):
             root_spans_only (bool, optional): If True, only root spans are returned. Default None.
             project_name (str, optional): The project name to query spans for. This can be set
                 using environment variables. If not provided, falls back to the default project.
+            after_cursor (str, optional): If provided, only spans inserted after the cursor
+                are returned, along with the cursor for the next call. An empty string starts
+                from the beginning. The limit then applies to the number of spans inserted
+                after the cursor that are considered, so the spans can be exported
+                incrementally by calling repeatedly with the cursor returned each time.
 
         Returns:
             Union[pd.DataFrame, List[pd.DataFrame]]: A pandas DataFrame or a list of pandas
                 DataFrames containing the queried span data, or None if no spans are found.
+                If `after_cursor` is provided, a tuple of the above and the next cursor.
         """
         project_name = project_name or get_env_project_name()
         if not queries:
@@ -145,27 +199,41 @@ class Client(TraceDataExtractor):
                 "stop_time is deprecated. Use end_time instead.",
             )
             end_time = end_time or stop_time
+        params = {
+            "project_name": project_name,
+            "project-name": project_name,  # for backward-compatibility
+        }
+        payload = {
+            "queries": [q.to_dict() for q in queries],
+            "start_time": _to_iso_format(normalize_datetime(start_time)),
+            "end_time": _to_iso_format(normalize_datetime(end_time)),
+            "limit": limit,
+            "root_spans_only": root_spans_only,
+            **({"after_cursor": after_cursor} if after_cursor is not None else {}),
+        }
+        key = json.dumps([params, payload], sort_keys=True)
+        cached = self._span_query_results.get(key)
         response = self._client.post(
             url=urljoin(self._base_url, "v1/spans"),
-            params={
-                "project_name": project_name,
-                "project-name": project_name,  # for backward-compatibility
-            },
-            json={
-                "queries": [q.to_dict() for q in queries],
-                "start_time": _to_iso_format(normalize_datetime(start_time)),
-                "end_time": _to_iso_format(normalize_datetime(end_time)),
-                "limit": limit,
-                "root_spans_only": root_spans_only,
-            },
+            params=params,
+            json=payload,
+            headers={"If-None-Match": cached[0]} if cached else None,
         )
         if response.status_code == 404:
             logger.info("No spans found.")
-            return None
+            return None if after_cursor is None else (None, after_cursor)
         elif response.status_code == 422:
             raise ValueError(response.content.decode())
-        response.raise_for_status()
-        source = BytesIO(response.content)
+        if response.status_code == 304 and cached:
+            _, content, next_cursor = cached
+        else:
+            response.raise_for_status()
+            content = response.content
+            next_cursor = response.headers.get(_NEXT_CURSOR_HEADER)
+            if etag := response.headers.get("etag"):
+                if len(content) <= self._span_query_results.maxsize:
+                    self._span_query_results[key] = (etag, content, next_cursor)
+        source = BytesIO(content)
         results = []
         while True:
             try:
@@ -173,10 +241,15 @@ class Client(TraceDataExtractor):
                     results.append(reader.read_pandas())
             except ArrowInvalid:
                 break
+        result: Optional[Union[pd.DataFrame, List[pd.DataFrame]]] = results
         if len(results) == 1:
             df = results[0]
-            return None if df.shape == (0, 0) else df
-        return results
+            result = None if df.shape == (0, 0) else df
+        if after_cursor is None:
+            return result
+        if next_cursor is None:
+            raise ValueError("The server does not support exporting spans by cursor.")
+        return result, next_cursor
 
     def get_evaluations(
         self,
@@ -246,15 +319,18 @@ class Client(TraceDataExtractor):
             raise TypeError(f"Unexpected keyword arguments: {', '.join(kwargs)}")
         for evaluation in evals:
             table = evaluation.to_pyarrow_table()
-            sink = pa.BufferOutputStream()
             headers = {"content-type": "application/x-pandas-arrow"}
-            with pa.ipc.new_stream(sink, table.schema) as writer:
-                writer.write_table(table)
-            self._client.post(
-                url=urljoin(self._base_url, "v1/evaluations"),
-                content=cast(bytes, sink.getvalue().to_pybytes()),
-                headers=headers,
-            ).raise_for_status()
+            # Large tables are uploaded in chunks, which are inserted in order.
+            for offset in range(0, max(table.num_rows, 1), _EVALUATIONS_CHUNK_SIZE):
+                chunk = table.slice(offset, _EVALUATIONS_CHUNK_SIZE)
+                sink = pa.BufferOutputStream()
+                with pa.ipc.new_stream(sink, chunk.schema) as writer:
+                    writer.write_table(chunk)
+                self._client.post(
+                    url=urljoin(self._base_url, "v1/evaluations"),
+                    content=cast(bytes, sink.getvalue().to_pybytes()),
+                    headers=headers,
+                ).raise_for_status()
 
     def log_traces(self, trace_dataset: TraceDataset, project_name: Optional[str] = None) -> None:
         """
@@ -34,10 +34,12 @@ from phoenix.config import (
     get_env_database_connection_str,
     get_env_host,
     get_env_port,
+    get_env_run_in_thread,
     get_exported_files,
     get_working_dir,
 )
 from phoenix.core.model_schema_adapter import create_model_from_inferences
+from phoenix.db.engines import create_read_only_engine
 from phoenix.inferences.inferences import EMPTY_INFERENCES, Inferences
 from phoenix.pointcloud.umap_parameters import get_umap_parameters
 from phoenix.server.app import (
@@ -370,8 +372,15 @@ class ThreadSession(Session):
         )
         # Initialize an app service that keeps the server running
         engine = create_engine_and_run_migrations(database_url)
-        instrumentation_cleanups = instrument_engine_if_enabled(engine)
-        factory = SessionFactory(session_factory=_db(engine), dialect=engine.dialect.name)
+        read_engine = create_read_only_engine(database_url)
+        instrumentation_cleanups = instrument_engine_if_enabled(
+            *([engine] if read_engine is None else [engine, read_engine])
+        )
+        factory = SessionFactory(
+            session_factory=_db(engine),
+            dialect=engine.dialect.name,
+            reader_session_factory=None if read_engine is None else _db(read_engine),
+        )
         self.app = create_app(
             db=factory,
             export_path=self.export_path,
@@ -436,7 +445,7 @@ def launch_app(
     default_umap_parameters: Optional[Mapping[str, Any]] = None,
     host: Optional[str] = None,
     port: Optional[int] = None,
-    run_in_thread: bool = True,
+    run_in_thread: Optional[bool] = None,
     notebook_environment: Optional[Union[NotebookEnvironment, str]] = None,
     use_temp_dir: bool = True,
 ) -> Optional[Session]:
@@ -461,8 +470,11 @@ def launch_app(
         The port on which the server listens. When using traces this should not be
         used and should instead set the environment variable `PHOENIX_PORT`.
         Defaults to 6006.
-    run_in_thread: bool, optional, default=True
-        Whether the server should run in a Thread or Process.
+    run_in_thread: bool, optional
+        Whether the server should run in a Thread or Process. Running the
+        server in a separate process keeps it from competing with the notebook
+        for the GIL. If not provided, it can be set using the environment
+        variable `PHOENIX_RUN_IN_THREAD`, otherwise it defaults to True.
     default_umap_parameters: Dict[str, Union[int, float]], optional, default=None
         User specified default UMAP parameters
         eg: {"n_neighbors": 10, "n_samples": 5, "min_dist": 0.5}
@@ -554,6 +566,8 @@ def launch_app(
     else:
         database_url = get_env_database_connection_str()
 
+    if run_in_thread is None:
+        run_in_thread = get_env_run_in_thread()
     if run_in_thread:
         _session = ThreadSession(
             database_url,
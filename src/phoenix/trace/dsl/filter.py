@@ -4,6 +4,7 @@ import sys
 import typing
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from functools import lru_cache
 from itertools import chain
 from random import randint
 from types import MappingProxyType
@@ -124,6 +125,15 @@ _NAMES: typing.Mapping[str, sqlalchemy.SQLColumnExpression[typing.Any]] = Mappin
         "events": models.Span.events,
     }
 )
+_PROMOTED_NAMES: typing.Mapping[str, sqlalchemy.SQLColumnExpression[typing.Any]] = MappingProxyType(
+    {name: getattr(models.Span, name) for name in models.PROMOTED_SPAN_ATTRIBUTES}
+)
+_PROMOTED_ATTRIBUTE_KEYS: typing.Mapping[typing.Tuple[str, ...], str] = MappingProxyType(
+    {tuple(keys): name for name, keys in models.PROMOTED_SPAN_ATTRIBUTES.items()}
+)
+_SEARCHABLE_ATTRIBUTE_KEYS: typing.Mapping[typing.Tuple[str, ...], str] = MappingProxyType(
+    {tuple(keys): name for name, keys in models.SEARCHABLE_SPAN_ATTRIBUTES.items()}
+)
 _BACKWARD_COMPATIBILITY_REPLACEMENTS: typing.Mapping[str, str] = MappingProxyType(
     {
         # for backward-compatibility
@@ -140,6 +150,9 @@ _BACKWARD_COMPATIBILITY_REPLACEMENTS: typing.Mapping[str, str] = MappingProxyTyp
 class SpanFilter:
     condition: str = ""
     valid_eval_names: typing.Optional[typing.Sequence[str]] = None
+    search_text_index: bool = False
+    """Whether substring searches use the full-text index, which is only true
+    if the index exists in the database."""
     translated: ast.Expression = field(init=False, repr=False)
     compiled: typing.Any = field(init=False, repr=False)
     _aliased_annotation_relations: typing.Tuple[AliasedAnnotationRelation] = field(
@@ -153,22 +166,13 @@ class SpanFilter:
         return bool(self.condition)
 
     def __post_init__(self) -> None:
-        if not (source := self.condition):
+        if not self.condition:
             return
-        root = ast.parse(source, mode="eval")
-        _validate_expression(root, source, valid_eval_names=self.valid_eval_names)
-        source, aliased_annotation_relations = _apply_eval_aliasing(source)
-        root = ast.parse(source, mode="eval")
-        translated = _FilterTranslator(
-            source=source,
-            reserved_keywords=(
-                alias
-                for aliased_annotation in aliased_annotation_relations
-                for alias, _ in aliased_annotation.attributes
-            ),
-        ).visit(root)
-        ast.fix_missing_locations(translated)
-        compiled = compile(translated, filename="", mode="eval")
+        translated, compiled, aliased_annotation_relations = _compile_filter(
+            self.condition,
+            None if self.valid_eval_names is None else tuple(self.valid_eval_names),
+            self.search_text_index,
+        )
         aliased_annotation_attributes = {
             alias: attribute
             for aliased_annotation in aliased_annotation_relations
@@ -187,6 +191,7 @@ class SpanFilter:
                 self.compiled,
                 {
                     **_NAMES,
+                    **_PROMOTED_NAMES,
                     **self._aliased_annotation_attributes,
                     "not_": sqlalchemy.not_,
                     "and_": sqlalchemy.and_,
@@ -195,6 +200,7 @@ class SpanFilter:
                     "Float": sqlalchemy.Float,
                     "String": sqlalchemy.String,
                     "TextContains": models.TextContains,
+                    "SpanTextContains": models.SpanTextContains,
                 },
             )
         )
@@ -207,10 +213,12 @@ class SpanFilter:
         cls,
         obj: typing.Mapping[str, typing.Any],
         valid_eval_names: typing.Optional[typing.Sequence[str]] = None,
+        search_text_index: bool = False,
     ) -> "SpanFilter":
         return cls(
             condition=obj.get("condition") or "",
             valid_eval_names=valid_eval_names,
+            search_text_index=search_text_index,
         )
 
     def _join_aliased_relations(self, stmt: Select[typing.Any]) -> Select[typing.Any]:
@@ -251,12 +259,9 @@ class Projector:
     compiled: typing.Any = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        if not (source := self.expression):
+        if not self.expression:
             raise ValueError("missing expression")
-        root = ast.parse(source, mode="eval")
-        translated = _ProjectionTranslator(source).visit(root)
-        ast.fix_missing_locations(translated)
-        compiled = compile(translated, filename="", mode="eval")
+        translated, compiled = _compile_projection(self.expression)
         object.__setattr__(self, "translated", translated)
         object.__setattr__(self, "compiled", compiled)
 
@@ -267,6 +272,47 @@ class Projector:
         )
 
 
+@lru_cache(maxsize=256)
+def _compile_filter(
+    source: str,
+    valid_eval_names: typing.Optional[typing.Tuple[str, ...]],
+    search_text_index: bool = False,
+) -> typing.Tuple[ast.Expression, typing.Any, typing.Tuple[AliasedAnnotationRelation, ...]]:
+    """
+    Parses, validates and compiles a filter condition. The results are cached
+    because the same few conditions are sent with almost every request. Reusing
+    the same aliased relations for a condition also keeps the SQL statements
+    generated from it identical, so SQLAlchemy can reuse their compiled form.
+    Substring searches are only rewritten to use the full-text index if
+    `search_text_index` is true, i.e. if the index exists.
+    """
+    root = ast.parse(source, mode="eval")
+    _validate_expression(root, source, valid_eval_names=valid_eval_names)
+    source, aliased_annotation_relations = _apply_eval_aliasing(source)
+    root = ast.parse(source, mode="eval")
+    translated = _FilterTranslator(
+        source=source,
+        reserved_keywords=(
+            alias
+            for aliased_annotation in aliased_annotation_relations
+            for alias, _ in aliased_annotation.attributes
+        ),
+    ).visit(root)
+    if search_text_index:
+        translated = ast.Expression(body=_search_text_index(translated.body))
+    ast.fix_missing_locations(translated)
+    compiled = compile(translated, filename="", mode="eval")
+    return translated, compiled, aliased_annotation_relations
+
+
+@lru_cache(maxsize=256)
+def _compile_projection(source: str) -> typing.Tuple[ast.Expression, typing.Any]:
+    root = ast.parse(source, mode="eval")
+    translated = _ProjectionTranslator(source).visit(root)
+    ast.fix_missing_locations(translated)
+    return translated, compile(translated, filename="", mode="eval")
+
+
 def _is_string_constant(node: typing.Any) -> TypeGuard[ast.Constant]:
     return isinstance(node, ast.Constant) and isinstance(node.value, str)
 
@@ -442,6 +488,9 @@ class _ProjectionTranslator(ast.NodeTransformer):
 
 
 class _FilterTranslator(_ProjectionTranslator):
+    def visit_Expression(self, node: ast.Expression) -> typing.Any:
+        return _PromotedAttributeTranslator().visit(super().visit_Expression(node))
+
     def visit_Compare(self, node: ast.Compare) -> typing.Any:
         if len(node.comparators) > 1:
             args: typing.List[typing.Any] = []
@@ -547,6 +596,50 @@ class _FilterTranslator(_ProjectionTranslator):
         return arg
 
 
+class _PromotedAttributeTranslator(ast.NodeTransformer):
+    """
+    Replaces string attributes that have been promoted to their own indexed
+    columns with those columns, e.g. `attributes[["llm", "model_name"]].as_string()`
+    becomes `llm_model_name`.
+    """
+
+    def visit_Call(self, node: ast.Call) -> typing.Any:
+        if _is_string_attribute(node) and (
+            keys := _get_attribute_keys_list(typing.cast(ast.Attribute, node.func).value)
+        ):
+            if name := _PROMOTED_ATTRIBUTE_KEYS.get(tuple(key.value for key in keys)):
+                return ast.Name(id=name, ctx=ast.Load())
+        return self.generic_visit(node)
+
+
+def _search_text_index(node: typing.Any) -> typing.Any:
+    """
+    Replaces substring searches of searchable attributes with searches of the
+    full-text index, e.g. `TextContains(attributes[["input", "value"]].as_string(), "abc")`
+    becomes `SpanTextContains("input_value", "abc")`. This is only done for the
+    terms of the top-level conjunction, because that's where the index can be
+    used, and where the two are equivalent.
+    """
+    if isinstance(node, ast.Call) and isinstance(func := node.func, ast.Name) and func.id == "and_":
+        return ast.Call(func=func, args=[_search_text_index(arg) for arg in node.args], keywords=[])
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(func := node.func, ast.Name)
+        and func.id == "TextContains"
+        and _is_string_attribute(string := node.args[0])
+        and _is_string_constant(substring := node.args[1])
+        and len(substring.value) >= 3
+        and (keys := _get_attribute_keys_list(typing.cast(ast.Attribute, string.func).value))
+        and (name := _SEARCHABLE_ATTRIBUTE_KEYS.get(tuple(key.value for key in keys)))
+    ):
+        return ast.Call(
+            func=ast.Name(id="SpanTextContains", ctx=ast.Load()),
+            args=[ast.Constant(value=name, kind=None), substring],
+            keywords=[],
+        )
+    return node
+
+
 def _validate_expression(
     expression: ast.Expression,
     source: str,
@@ -1,27 +1,43 @@
 import warnings
-from collections import defaultdict
 from dataclasses import dataclass, field, replace
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, lru_cache
 from itertools import chain
 from random import randint, random
 from types import MappingProxyType
 from typing import (
     Any,
-    DefaultDict,
     Dict,
     Iterable,
     List,
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     cast,
 )
 
+import numpy as np
 import pandas as pd
 from openinference.semconv.trace import SpanAttributes
-from sqlalchemy import JSON, Column, Label, Select, SQLColumnExpression, and_, func, select
+from sqlalchemy import (
+    JSON,
+    Column,
+    FunctionElement,
+    Integer,
+    Label,
+    Select,
+    SQLColumnExpression,
+    String,
+    and_,
+    case,
+    func,
+    literal,
+    select,
+    true,
+)
 from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Session, aliased
 from typing_extensions import assert_never
 
@@ -32,7 +48,6 @@ from phoenix.trace.attributes import (
     JSON_STRING_ATTRIBUTES,
     SEMANTIC_CONVENTIONS,
     flatten,
-    get_attribute_value,
     load_json_strings,
     unflatten,
 )
@@ -124,8 +139,8 @@ class Explosion(_HasTmpSuffix, Projection):
     _position_prefix: str = field(init=False, repr=False)
     _primary_index: Projection = field(init=False, repr=False)
     _array_tmp_col_label: str = field(init=False, repr=False)
-    """For sqlite we need to store the array in a temporary column to be able
-    to explode it later in pandas. `_array_tmp_col_label` is the name of this
+    """Without kwargs, each exploded object is stored in a temporary column to
+    be flattened later in pandas. `_array_tmp_col_label` is the name of this
     temporary column. The temporary column will have a unique name
     per instance.
     """
@@ -152,15 +167,17 @@ class Explosion(_HasTmpSuffix, Projection):
     ) -> Select[Any]:
         array = self()
         if dialect is SupportedSQLDialect.SQLITE:
-            # Because sqlite doesn't support `WITH ORDINALITY`, the order of
-            # the returned (table) values is not guaranteed. So we resort to
-            # post hoc processing using pandas.
-            stmt = stmt.where(
-                func.json_type(array) == "array",
-            ).add_columns(
-                array.label(self._array_tmp_col_label),
+            # The `key` of each element returned by `json_each` is its
+            # zero-based position in the array.
+            element = func.json_each(array).table_valued(
+                Column("key", Integer),
+                Column("value", JSON),
+                Column("type", String),
+                joins_implicitly=True,
             )
-            return stmt
+            obj = element.c.value
+            position_label = element.c.key.label(f"{self._position_prefix}position")
+            is_array, is_object = func.json_type(array) == "array", element.c.type == "object"
         elif dialect is SupportedSQLDialect.POSTGRESQL:
             element = (
                 func.jsonb_array_elements(array)
@@ -174,27 +191,30 @@ class Explosion(_HasTmpSuffix, Projection):
             obj, position = element.c.obj, element.c.position
             # Use zero-based indexing for backward-compatibility.
             position_label = (position - 1).label(f"{self._position_prefix}position")
-            if self.kwargs:
-                columns: Iterable[Label[Any]] = (
-                    obj[key.split(".")].label(self._add_tmp_suffix(name))
-                    for name, key in self.kwargs.items()
-                )
-            else:
-                columns = (obj.label(self._array_tmp_col_label),)
-            stmt = (
-                stmt.where(func.jsonb_typeof(array) == "array")
-                .where(func.jsonb_typeof(obj) == "object")
-                .add_columns(position_label, *columns)
-            )
-            return stmt
+            is_array = func.jsonb_typeof(array) == "array"
+            is_object = func.jsonb_typeof(obj) == "object"
         else:
             assert_never(dialect)
+        if self.kwargs:
+            columns: Iterable[Label[Any]] = (
+                _JsonValue(obj[key.split(".")]).label(self._add_tmp_suffix(name))
+                for name, key in self.kwargs.items()
+            )
+        else:
+            columns = (obj.label(self._array_tmp_col_label),)
+        stmt = stmt.where(is_array).where(is_object).add_columns(position_label, *columns)
+        return stmt
 
     def update_df(
         self,
         df: pd.DataFrame,
         dialect: SupportedSQLDialect,
     ) -> pd.DataFrame:
+        for name in self.kwargs:
+            if name in df and (tmp_col := self._add_tmp_suffix(name)) in df:
+                # The values of the concatenation with the same label take
+                # precedence.
+                df.loc[:, name] = df.loc[:, name].fillna(df.pop(tmp_col))
         df = df.rename(self._remove_tmp_suffix, axis=1)
         if df.empty:
             columns = list(
@@ -208,52 +228,27 @@ class Explosion(_HasTmpSuffix, Projection):
             )
             df = pd.DataFrame(columns=columns).set_index(self.index_keys)
             return df
-        if dialect != SupportedSQLDialect.SQLITE and self.kwargs:
-            df = df.set_index(self.index_keys)
-            return df
-        if dialect is SupportedSQLDialect.SQLITE:
-            # Because sqlite doesn't support `WITH ORDINALITY`, the order of
-            # the returned (table) values is not guaranteed. So we resort to
-            # post hoc processing using pandas.
-            def _extract_values(array: List[Any]) -> List[Dict[str, Any]]:
-                if not isinstance(array, Iterable):
-                    return []
-                if not self.kwargs:
-                    return [
-                        {
-                            **dict(flatten(obj)),
-                            f"{self._position_prefix}position": i,
-                        }
-                        for i, obj in enumerate(array)
-                        if isinstance(obj, Mapping)
-                    ]
-                res: List[Dict[str, Any]] = []
-                for i, obj in enumerate(array):
-                    if not isinstance(obj, Mapping):
-                        continue
-                    values: Dict[str, Any] = {f"{self._position_prefix}position": i}
-                    for name, key in self.kwargs.items():
-                        if (value := get_attribute_value(obj, key)) is not None:
-                            values[name] = value
-                    res.append(values)
-                return res
-
-            records = df.loc[:, self._array_tmp_col_label].dropna().map(_extract_values).explode()
-        elif dialect is SupportedSQLDialect.POSTGRESQL:
-            records = df.loc[:, self._array_tmp_col_label].dropna().map(flatten).map(dict)
-        else:
-            assert_never(dialect)
-        df = df.drop(self._array_tmp_col_label, axis=1)
-        if records.empty:
+        position = self.index_keys[-1]
+        if df.loc[:, position].isna().all():
+            # Only the spans of the concatenation are present, because nothing
+            # was exploded.
+            df = df.drop([position, self._array_tmp_col_label], axis=1, errors="ignore")
+            df = df.drop(
+                [name for name in self.kwargs if name in df and df.loc[:, name].isna().all()],
+                axis=1,
+            )
             df = df.set_index(self.index_keys[0])
             return df
-        df_explode = pd.DataFrame.from_records(records.to_list(), index=records.index)
-        if dialect is SupportedSQLDialect.SQLITE:
-            df = _outer_join(df, df_explode)
-        elif dialect is SupportedSQLDialect.POSTGRESQL:
+        if not self.kwargs:
+            # The row ids are not unique after the explosion, so the objects
+            # are aligned by their positions in the dataframe instead.
+            df = df.reset_index(drop=True)
+            records = df.pop(self._array_tmp_col_label).dropna().map(flatten).map(dict)
+            df_explode = pd.DataFrame.from_records(records.to_list(), index=records.index)
             df = pd.concat([df, df_explode], axis=1)
-        else:
-            assert_never(dialect)
+        elif dialect is SupportedSQLDialect.SQLITE:
+            # The missing values are NaN, as for the spans without the keys.
+            df = df.fillna({name: np.nan for name in self.kwargs if name in df})
         df = df.set_index(self.index_keys)
         return df
 
@@ -286,17 +281,6 @@ class Concatenation(_HasTmpSuffix, Projection):
     kwargs: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
     separator: str = "\n\n"
 
-    _array_tmp_col_label: str = field(init=False, repr=False)
-    """For SQLite we need to store the array in a temporary column to be able
-    to concatenate it later in pandas. `_array_tmp_col_label` is the name of
-    this temporary column. The temporary column will have a unique name
-    per instance.
-    """
-
-    def __post_init__(self) -> None:
-        super().__post_init__()
-        object.__setattr__(self, "_array_tmp_col_label", f"__array_tmp_col_{random()}")
-
     def with_separator(self, separator: str = "\n\n") -> "Concatenation":
         return replace(self, separator=separator)
 
@@ -307,13 +291,49 @@ class Concatenation(_HasTmpSuffix, Projection):
     ) -> Select[Any]:
         array = self()
         if dialect is SupportedSQLDialect.SQLITE:
-            # Because SQLite doesn't support `WITH ORDINALITY`, the order of
-            # the returned table-values is not guaranteed. So we resort to
-            # post hoc processing using pandas.
-            stmt = stmt.where(
-                func.json_type(array) == "array",
-            ).add_columns(
-                array.label(self._array_tmp_col_label),
+            # The elements are joined with a LEFT JOIN, so that the spans with
+            # empty arrays are kept. The `key` of each element returned by
+            # `json_each` is its zero-based position in the array.
+            element = func.json_each(array).table_valued(
+                Column("key", Integer),
+                Column("value", JSON),
+                Column("type", String),
+            )
+            obj, position = element.c.value, element.c.key
+            if self.kwargs:
+                columns: Iterable[Label[Any]] = (
+                    _GroupConcat(
+                        case(
+                            (
+                                element.c.type == "object",
+                                _sqlite_str(
+                                    obj[key.split(".")].as_string(),
+                                    func.json_type(_JsonValue(obj[key.split(".")])),
+                                    none=None,
+                                ),
+                            )
+                        ),
+                        literal(self.separator),
+                        position,
+                    ).label(self._add_tmp_suffix(label))
+                    for label, key in self.kwargs.items()
+                )
+            else:
+                columns = (
+                    func.coalesce(
+                        _GroupConcat(
+                            _sqlite_str(obj, element.c.type),
+                            literal(self.separator),
+                            position,
+                        ),
+                        "",
+                    ).label(self.key),
+                )
+            stmt = (
+                stmt.outerjoin(element, true())
+                .where(func.json_type(array) == "array")
+                .add_columns(*columns)
+                .group_by(*stmt.selected_columns.keys())
             )
             return stmt
         elif dialect is SupportedSQLDialect.POSTGRESQL:
@@ -332,7 +352,7 @@ class Concatenation(_HasTmpSuffix, Projection):
             )
             obj, position = element.c.obj, element.c.position
             if self.kwargs:
-                columns: Iterable[Label[Any]] = (
+                columns = (
                     func.string_agg(
                         obj[key.split(".")].as_string(),
                         aggregate_order_by(self.separator, position),  # type: ignore
@@ -370,37 +390,15 @@ class Concatenation(_HasTmpSuffix, Projection):
             columns = list(
                 set(
                     chain(
-                        df.drop(self._array_tmp_col_label, axis=1, errors="ignore").columns,
+                        df.columns,
                         self.kwargs.keys(),
                     )
                 )
             )
             return pd.DataFrame(columns=columns, index=df.index)
         if dialect is SupportedSQLDialect.SQLITE:
-            # Because SQLite doesn't support `WITH ORDINALITY`, the order of
-            # the returned table-values is not guaranteed. So we resort to
-            # post hoc processing using pandas.
-            def _concat_values(array: List[Any]) -> Dict[str, Any]:
-                if not isinstance(array, Iterable):
-                    return {}
-                if not self.kwargs:
-                    return {self.key: self.separator.join(str(obj) for obj in array)}
-                values: DefaultDict[str, List[str]] = defaultdict(list)
-                for i, obj in enumerate(array):
-                    if not isinstance(obj, Mapping):
-                        continue
-                    for label, key in self.kwargs.items():
-                        if (value := get_attribute_value(obj, key)) is not None:
-                            values[label].append(str(value))
-                return {label: self.separator.join(vs) for label, vs in values.items()}
-
-            records = df.loc[:, self._array_tmp_col_label].map(_concat_values)
-            df_concat = pd.DataFrame.from_records(records.to_list(), index=records.index)
-            return df.drop(self._array_tmp_col_label, axis=1).join(df_concat, how="outer")
-        elif dialect is SupportedSQLDialect.POSTGRESQL:
-            pass
-        else:
-            assert_never(dialect)
+            # The missing values are NaN, as for the spans without the keys.
+            df = df.fillna({name: np.nan for name in self.kwargs if name in df})
         return df
 
     def to_dict(self) -> Dict[str, Any]:
@@ -511,9 +509,16 @@ class SpanQuery(_HasTmpSuffix):
         end_time: Optional[datetime] = None,
         limit: Optional[int] = DEFAULT_SPAN_LIMIT,
         root_spans_only: Optional[bool] = None,
+        after_span_rowid: Optional[int] = None,
+        until_span_rowid: Optional[int] = None,
         # Deprecated
         stop_time: Optional[datetime] = None,
     ) -> pd.DataFrame:
+        """
+        `after_span_rowid` and `until_span_rowid` restrict the spans to those
+        whose row ids, which increase in the order of insertion, fall in the
+        half-open interval (after_span_rowid, until_span_rowid].
+        """
         if not project_name:
             project_name = DEFAULT_PROJECT_NAME
         if stop_time:
@@ -532,6 +537,8 @@ class SpanQuery(_HasTmpSuffix):
                 end_time=end_time,
                 limit=limit,
                 root_spans_only=root_spans_only,
+                after_span_rowid=after_span_rowid,
+                until_span_rowid=until_span_rowid,
             )
         assert session.bind is not None
         dialect = SupportedSQLDialect(session.bind.dialect.name)
@@ -548,6 +555,10 @@ class SpanQuery(_HasTmpSuffix):
             stmt = stmt.where(start_time <= models.Span.start_time)
         if end_time:
             stmt = stmt.where(models.Span.start_time < end_time)
+        if after_span_rowid is not None:
+            stmt = stmt.where(after_span_rowid < models.Span.id)
+        if until_span_rowid is not None:
+            stmt = stmt.where(models.Span.id <= until_span_rowid)
         if limit is not None:
             stmt = stmt.limit(limit)
         if root_spans_only:
@@ -634,6 +645,7 @@ class SpanQuery(_HasTmpSuffix):
         cls,
         obj: Mapping[str, Any],
         valid_eval_names: Optional[Sequence[str]] = None,
+        search_text_index: bool = False,
     ) -> "SpanQuery":
         return cls(
             **(
@@ -653,6 +665,7 @@ class SpanQuery(_HasTmpSuffix):
                     "_filter": SpanFilter.from_dict(
                         cast(Mapping[str, Any], filter),
                         valid_eval_names=valid_eval_names,
+                        search_text_index=search_text_index,
                     )
                 }  # type: ignore
                 if (filter := obj.get("filter"))
@@ -693,6 +706,8 @@ def _get_spans_dataframe(
     end_time: Optional[datetime] = None,
     limit: Optional[int] = DEFAULT_SPAN_LIMIT,
     root_spans_only: Optional[bool] = None,
+    after_span_rowid: Optional[int] = None,
+    until_span_rowid: Optional[int] = None,
     # Deprecated
     stop_time: Optional[datetime] = None,
 ) -> pd.DataFrame:
@@ -730,6 +745,10 @@ def _get_spans_dataframe(
         stmt = stmt.where(start_time <= models.Span.start_time)
     if end_time:
         stmt = stmt.where(models.Span.start_time < end_time)
+    if after_span_rowid is not None:
+        stmt = stmt.where(after_span_rowid < models.Span.id)
+    if until_span_rowid is not None:
+        stmt = stmt.where(models.Span.id <= until_span_rowid)
     if limit is not None:
         stmt = stmt.limit(limit)
     if root_spans_only:
@@ -743,9 +762,10 @@ def _get_spans_dataframe(
     df = pd.read_sql_query(stmt, conn).set_index(span_id_label, drop=False)
     if df.empty:
         return df.drop("attributes", axis=1)
-    df_attributes = pd.DataFrame.from_records(
-        df.attributes.map(_flatten_semantic_conventions),
-    ).set_axis(df.index, axis=0)
+    df_attributes = pd.DataFrame(
+        _flatten_semantic_conventions_by_column(df.attributes),
+        index=df.index,
+    )
     df = pd.concat(
         [
             df.drop("attributes", axis=1),
@@ -756,6 +776,69 @@ def _get_spans_dataframe(
     return df
 
 
+def _sqlite_str(
+    value: SQLColumnExpression[Any],
+    type_: SQLColumnExpression[Any],
+    none: Optional[str] = "None",
+) -> SQLColumnExpression[Any]:
+    """
+    For SQLite, renders a JSON value, given its type from `json_type`, as
+    Python's `str()` would render the decoded value. Numbers, objects and
+    arrays are rendered by the `python_str` function registered on each
+    connection, and nulls are rendered as `none`.
+    """
+    return case(
+        (type_ == "text", value),
+        (type_ == "true", literal("True")),
+        (type_ == "false", literal("False")),
+        (type_ == "null", literal(none)),
+        else_=func.python_str(value),
+    )
+
+
+class _JsonValue(FunctionElement[Any]):
+    """
+    Wraps `obj[path]`, which SQLite renders as `JSON_QUOTE(JSON_EXTRACT(...))`
+    turning booleans into integers, to render it with the `->` operator
+    instead, which keeps them.
+    """
+
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    inherit_cache = True
+    type = JSON()
+    name = "json_value"
+
+
+@compiles(_JsonValue)
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    (value,) = list(element.clauses)
+    return compiler.process(value, **kw)
+
+
+@compiles(_JsonValue, "sqlite")
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    (value,) = list(element.clauses)
+    return f"({compiler.process(value.left, **kw)} -> {compiler.process(value.right, **kw)})"
+
+
+class _GroupConcat(FunctionElement[Any]):
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    inherit_cache = True
+    type = String()
+    name = "group_concat"
+
+
+@compiles(_GroupConcat, "sqlite")
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    # The ORDER BY clause in aggregate functions requires SQLite 3.44.0
+    value, separator, position = list(element.clauses)
+    return (
+        f"group_concat({compiler.process(value, **kw)}, {compiler.process(separator, **kw)} "
+        f"ORDER BY {compiler.process(position, **kw)})"
+    )
+
+
 def _outer_join(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
     if (columns_intersection := left.columns.intersection(right.columns)).empty:
         df = left.join(right, how="outer")
@@ -767,6 +850,57 @@ def _outer_join(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _flatten_semantic_conventions_by_column(
+    attributes: Iterable[Mapping[str, Any]],
+) -> Dict[str, List[Any]]:
+    """
+    Same as `_flatten_semantic_conventions` applied to each row, but with the
+    values collected by column, and with missing values filled with NaN as in
+    `pd.DataFrame.from_records`. Rows having the same keys are unflattened the
+    same way, so the unflattening is planned only once for each distinct set
+    of keys, and then only the values are filled in for each row.
+    """
+    columns: Dict[str, List[Any]] = {}
+    for i, row in enumerate(attributes):
+        keys, values = [], []
+        for key, value in load_json_strings(
+            flatten(
+                row,
+                recurse_on_sequence=True,
+                json_string_attributes=JSON_STRING_ATTRIBUTES,
+            ),
+        ):
+            if value is not None:
+                keys.append(key)
+                values.append(value)
+        for name, template in _unflattening_plan(tuple(keys)):
+            if (column := columns.get(name)) is None:
+                column = columns[name] = [np.nan] * i
+            column.append(_fill_template(template, values))
+        for column in columns.values():
+            if len(column) == i:
+                column.append(np.nan)
+    return columns
+
+
+@lru_cache(maxsize=1024)
+def _unflattening_plan(keys: Tuple[str, ...]) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Unflattens the keys with each value replaced by its position, which serves
+    as the template of the unflattened values of any row having the same keys.
+    """
+    positions = zip(keys, range(len(keys)))
+    return tuple(unflatten(positions, prefix_exclusions=SEMANTIC_CONVENTIONS).items())
+
+
+def _fill_template(template: Any, values: Sequence[Any]) -> Any:
+    if isinstance(template, int):
+        return values[template]
+    if isinstance(template, dict):
+        return {key: _fill_template(value, values) for key, value in template.items()}
+    return [_fill_template(value, values) for value in template]
+
+
 def _flatten_semantic_conventions(attributes: Mapping[str, Any]) -> Dict[str, Any]:
     # This may be inefficient, but is needed to preserve backward-compatibility.
     # For example, custom attributes do not get flattened.
@@ -11,8 +11,8 @@ from openinference.semconv.trace import (
     RerankerAttributes,
     SpanAttributes,
 )
-from pandas import DataFrame, read_parquet
-from pyarrow import Schema, Table, parquet
+from pandas import DataFrame
+from pyarrow import Schema, Table, feather, parquet
 
 from phoenix.config import GENERATED_INFERENCES_NAME_PREFIX, INFERENCES_DIR, TRACE_DATASETS_DIR
 from phoenix.datetime_utils import normalize_timestamps
@@ -108,7 +108,7 @@ class TraceDataset:
     dataframe: pd.DataFrame
     evaluations: List[Evaluations] = []
     _id: UUID
-    _data_file_name: str = "data.parquet"
+    _data_file_name: str = "data.arrow"
 
     def __init__(
         self,
@@ -202,18 +202,25 @@ class TraceDataset:
     def from_name(cls, name: str) -> "TraceDataset":
         """Retrieves a dataset by name from the file system"""
         directory = INFERENCES_DIR / name
-        df = read_parquet(directory / cls._data_file_name)
-        return cls(df, name)
+        # The data is stored uncompressed in the Arrow IPC file format, so it
+        # can be memory-mapped instead of being read and decoded.
+        table = feather.read_table(directory / cls._data_file_name, memory_map=True)
+        dataset_id, _, eval_ids = _parse_schema_metadata(table.schema)
+        evaluations = [Evaluations.load(eval_id, directory) for eval_id in eval_ids]
+        ds = cls(table.to_pandas(), name, evaluations)
+        ds._id = dataset_id
+        return ds
 
     def to_disc(self) -> None:
         """writes the data to disc"""
         directory = INFERENCES_DIR / self.name
         directory.mkdir(parents=True, exist_ok=True)
-        get_serializable_spans_dataframe(self.dataframe).to_parquet(
-            directory / self._data_file_name,
-            allow_truncated_timestamps=True,
-            coerce_timestamps="ms",
+        for evals in self.evaluations:
+            evals.save(directory)
+        table = self._with_schema_metadata(
+            Table.from_pandas(get_serializable_spans_dataframe(self.dataframe))
         )
+        feather.write_feather(table, directory / self._data_file_name, compression="uncompressed")
 
     def save(self, directory: Optional[Union[str, Path]] = None) -> UUID:
         """
@@ -240,8 +247,14 @@ class TraceDataset:
             allow_truncated_timestamps=True,
             coerce_timestamps="ms",
         )
-        table = Table.from_pandas(self.dataframe)
-        table = table.replace_schema_metadata(
+        table = self._with_schema_metadata(Table.from_pandas(self.dataframe))
+        parquet.write_table(table, path)
+        print(f"💾 Trace dataset saved to under ID: {self._id}")
+        print(f"📂 Trace dataset path: {path}")
+        return self._id
+
+    def _with_schema_metadata(self, table: Table) -> Table:
+        return table.replace_schema_metadata(
             {
                 **(table.schema.metadata or {}),
                 # explicitly encode keys and values, which are automatically encoded regardless
@@ -254,10 +267,6 @@ class TraceDataset:
                 ).encode("utf-8"),
             }
         )
-        parquet.write_table(table, path)
-        print(f"💾 Trace dataset saved to under ID: {self._id}")
-        print(f"📂 Trace dataset path: {path}")
-        return self._id
 
     @classmethod
     def load(
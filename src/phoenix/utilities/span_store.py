@@ -0,0 +1,344 @@
+import json
+from bisect import bisect_left, insort
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm.attributes import set_committed_value
+from typing_extensions import TypeAlias, assert_never
+
+from phoenix.datetime_utils import normalize_datetime
+from phoenix.db import models
+from phoenix.db.engines import _dumps
+from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.insertion.span import SpanInsertionEvent
+from phoenix.trace.schemas import Span
+
+ProjectRowId: TypeAlias = int
+TraceRowId: TypeAlias = int
+SpanRowId: TypeAlias = int
+Kind: TypeAlias = Literal["span", "trace"]
+
+
+@dataclass
+class _Trace:
+    project_rowid: ProjectRowId
+    record: models.Trace
+    span_rowids: Set[SpanRowId] = field(default_factory=set)
+    is_complete: bool = False
+    """Whether the store holds all the spans of the trace."""
+
+
+@dataclass
+class _Project:
+    watermark: Optional[datetime]
+    """
+    The latest start time of the spans of the project that the store may not
+    hold, or None if it holds all of them.
+    """
+    spans: Dict[SpanRowId, models.Span] = field(default_factory=dict)
+    start_times: List[Tuple[datetime, SpanRowId]] = field(default_factory=list)
+    trace_rowids: Set[TraceRowId] = field(default_factory=set)
+
+    def covers(self, start_time: Optional[datetime]) -> bool:
+        if self.watermark is None:
+            return True
+        return start_time is not None and self.watermark < start_time
+
+    def bounds(
+        self, start_time: Optional[datetime], end_time: Optional[datetime]
+    ) -> Tuple[int, int]:
+        """
+        Returns the slice of the start times that fall within the time range.
+        """
+        start_times = self.start_times
+        lo = 0 if start_time is None else bisect_left(start_times, (start_time,))
+        hi = len(start_times) if end_time is None else bisect_left(start_times, (end_time,))
+        return lo, hi
+
+    def span_rowids(
+        self, start_time: Optional[datetime], end_time: Optional[datetime]
+    ) -> List[SpanRowId]:
+        lo, hi = self.bounds(start_time, end_time)
+        return [span_rowid for _, span_rowid in self.start_times[lo:hi]]
+
+
+class SpanStore:
+    """
+    Keeps the most recently inserted spans of each project in memory, so that
+    live views, e.g. of the last 15 minutes, can be served without querying
+    the database. The bulk inserter adds the spans once they are committed,
+    and the spans with the earliest start times are evicted once a project
+    holds more than the maximum number of spans.
+
+    The store only answers for the time ranges of which it holds every span.
+    Each project has a watermark, at or before which the database may hold
+    spans that the store doesn't, i.e. those inserted before the project was
+    added to the store and those evicted since. A time range is therefore hot
+    only if it starts after the watermark. Otherwise, the methods return None
+    and the caller should query the database instead.
+    """
+
+    def __init__(self, max_spans_per_project: int, dialect: SupportedSQLDialect) -> None:
+        self._max_spans_per_project = max_spans_per_project
+        self._dialect = dialect
+        self._projects: Dict[ProjectRowId, _Project] = {}
+        self._traces: Dict[TraceRowId, _Trace] = {}
+        self._spans_by_span_id: Dict[str, models.Span] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Advances whenever spans are removed other than by eviction, so that the
+        bulk inserter can tell whether a deletion happened during its
+        transaction, in which case the spans it committed may already be gone.
+        """
+        return self._generation
+
+    def has_project(self, project_rowid: ProjectRowId) -> bool:
+        return project_rowid in self._projects
+
+    def add(
+        self,
+        spans: Sequence[Tuple[Span, SpanInsertionEvent]],
+        watermarks: Mapping[ProjectRowId, Optional[datetime]],
+        generation: int,
+    ) -> None:
+        """
+        Adds committed spans. The watermarks are those of the projects not yet
+        in the store, i.e. the latest start times of their spans committed
+        before these, and the generation is the one at the beginning of the
+        transaction that committed the spans.
+        """
+        if generation != self._generation:
+            for project_rowid in {event.project_rowid for _, event in spans}:
+                self.clear(project_rowid)
+            return
+        for span, event in spans:
+            if (project := self._projects.get(event.project_rowid)) is None:
+                project = self._projects[event.project_rowid] = _Project(
+                    watermark=watermarks[event.project_rowid]
+                )
+            self._add_span(project, span, event)
+            if len(project.spans) > self._max_spans_per_project:
+                self._evict(project)
+
+    def clear(self, project_rowid: ProjectRowId) -> None:
+        """
+        Removes the project from the store, e.g. after its traces are deleted.
+        Its spans are added again, under a new watermark, by the next insertion.
+        """
+        self._generation += 1
+        if (project := self._projects.pop(project_rowid, None)) is None:
+            return
+        for trace_rowid in project.trace_rowids:
+            del self._traces[trace_rowid]
+        for span in project.spans.values():
+            del self._spans_by_span_id[span.span_id]
+
+    def discard_traces(self, trace_rowids: Iterable[TraceRowId]) -> None:
+        """
+        Removes traces deleted from the database. The watermarks stay in place,
+        because the spans are gone from the database as well.
+        """
+        self._generation += 1
+        for trace_rowid in trace_rowids:
+            if (trace := self._traces.pop(trace_rowid, None)) is None:
+                continue
+            project = self._projects[trace.project_rowid]
+            project.trace_rowids.discard(trace_rowid)
+            for span_rowid in trace.span_rowids:
+                span = project.spans.pop(span_rowid)
+                project.start_times.remove((span.start_time, span_rowid))
+                del self._spans_by_span_id[span.span_id]
+
+    def get_spans(
+        self,
+        project_rowid: ProjectRowId,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        root_spans_only: bool = False,
+    ) -> Optional[List[models.Span]]:
+        """
+        Returns the spans of the project that start within the time range, in
+        the order of their row IDs, or None if the time range isn't hot.
+        """
+        if (project := self._projects.get(project_rowid)) is None:
+            return None
+        if not project.covers(start_time):
+            return None
+        spans = [
+            project.spans[rowid] for rowid in sorted(project.span_rowids(start_time, end_time))
+        ]
+        if not root_spans_only:
+            return spans
+        root_spans = []
+        for span in spans:
+            if span.parent_id is None:
+                root_spans.append(span)
+            elif span.parent_id in self._spans_by_span_id:
+                continue
+            elif self._traces[span.trace_rowid].is_complete:
+                # The parent isn't in the database either, since the store
+                # holds all the spans of the trace.
+                root_spans.append(span)
+            else:
+                return None
+        return root_spans
+
+    def get_trace_spans(self, trace_rowid: TraceRowId) -> Optional[List[models.Span]]:
+        """
+        Returns the spans of the trace in the order of their row IDs, or None
+        if the store doesn't hold all of them.
+        """
+        if (trace := self._traces.get(trace_rowid)) is None or not trace.is_complete:
+            return None
+        project = self._projects[trace.project_rowid]
+        return [project.spans[rowid] for rowid in sorted(trace.span_rowids)]
+
+    def count(
+        self,
+        kind: Kind,
+        project_rowid: ProjectRowId,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> Optional[int]:
+        """
+        Returns the number of spans or traces of the project that start within
+        the time range, or None if the time range isn't hot.
+        """
+        if kind == "span":
+            if (project := self._projects.get(project_rowid)) is None:
+                return None
+            if not project.covers(start_time):
+                return None
+            lo, hi = project.bounds(start_time, end_time)
+            return hi - lo
+        if (latencies := self.get_latencies(kind, project_rowid, start_time, end_time)) is None:
+            return None
+        return len(latencies)
+
+    def get_latencies(
+        self,
+        kind: Kind,
+        project_rowid: ProjectRowId,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> Optional[List[float]]:
+        """
+        Returns the latencies of the spans or traces of the project that start
+        within the time range, or None if the time range isn't hot.
+        """
+        if (project := self._projects.get(project_rowid)) is None:
+            return None
+        if not project.covers(start_time):
+            return None
+        if kind == "span":
+            spans = [project.spans[rowid] for rowid in project.span_rowids(start_time, end_time)]
+            return [_latency_ms(self._dialect, span.start_time, span.end_time) for span in spans]
+        # A trace that starts after the watermark has all of its spans in the
+        # store, so the traces that aren't complete can't be in the range.
+        latencies = []
+        for trace_rowid in project.trace_rowids:
+            trace = self._traces[trace_rowid]
+            if not trace.is_complete:
+                continue
+            record = trace.record
+            if start_time is not None and record.start_time < start_time:
+                continue
+            if end_time is not None and end_time <= record.start_time:
+                continue
+            latencies.append(_latency_ms(self._dialect, record.start_time, record.end_time))
+        return latencies
+
+    def _add_span(self, project: _Project, span: Span, event: SpanInsertionEvent) -> None:
+        if (trace := self._traces.get(event.trace_rowid)) is None:
+            trace = self._traces[event.trace_rowid] = _Trace(
+                project_rowid=event.project_rowid,
+                record=models.Trace(
+                    id=event.trace_rowid,
+                    project_rowid=event.project_rowid,
+                    trace_id=span.context.trace_id,
+                ),
+                is_complete=event.is_new_trace,
+            )
+            project.trace_rowids.add(event.trace_rowid)
+        start_time = normalize_datetime(span.start_time)
+        end_time = normalize_datetime(span.end_time)
+        assert start_time is not None and end_time is not None
+        record = models.Span(
+            id=event.span_rowid,
+            trace_rowid=event.trace_rowid,
+            span_id=span.context.span_id,
+            parent_id=span.parent_id,
+            span_kind=span.span_kind.value,
+            name=span.name,
+            start_time=start_time,
+            end_time=end_time,
+            # The values round-trip through JSON, as they would through the
+            # database, e.g. to turn the timestamps of events into strings.
+            attributes=json.loads(_dumps(span.attributes)),
+            events=json.loads(_dumps([asdict(event) for event in span.events])),
+            status_code=span.status_code.value,
+            status_message=span.status_message,
+            cumulative_error_count=event.cumulative_error_count,
+            cumulative_llm_token_count_prompt=event.cumulative_llm_token_count_prompt,
+            cumulative_llm_token_count_completion=event.cumulative_llm_token_count_completion,
+        )
+        # The trace is set without its back-reference, so that the trace
+        # doesn't keep the evicted spans alive.
+        set_committed_value(record, "trace", trace.record)
+        trace_record = trace.record
+        if not trace.span_rowids or start_time < trace_record.start_time:
+            trace_record.start_time = start_time
+        if not trace.span_rowids or trace_record.end_time < end_time:
+            trace_record.end_time = end_time
+        trace.span_rowids.add(event.span_rowid)
+        project.spans[event.span_rowid] = record
+        insort(project.start_times, (start_time, event.span_rowid))
+        self._spans_by_span_id[record.span_id] = record
+        for ancestor_id in event.ancestor_ids:
+            if (ancestor := self._spans_by_span_id.get(ancestor_id)) is None:
+                continue
+            ancestor.cumulative_error_count += event.cumulative_error_count
+            ancestor.cumulative_llm_token_count_prompt += event.cumulative_llm_token_count_prompt
+            ancestor.cumulative_llm_token_count_completion += (
+                event.cumulative_llm_token_count_completion
+            )
+
+    def _evict(self, project: _Project) -> None:
+        start_time, span_rowid = project.start_times.pop(0)
+        project.watermark = (
+            start_time if project.watermark is None else max(project.watermark, start_time)
+        )
+        span = project.spans.pop(span_rowid)
+        del self._spans_by_span_id[span.span_id]
+        trace = self._traces[span.trace_rowid]
+        trace.span_rowids.discard(span_rowid)
+        trace.is_complete = False
+        if not trace.span_rowids:
+            del self._traces[span.trace_rowid]
+            project.trace_rowids.discard(span.trace_rowid)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _latency_ms(dialect: SupportedSQLDialect, start_time: datetime, end_time: datetime) -> float:
+    """
+    Computes the latency in milliseconds the way `models.LatencyMs` does in the
+    database, so that the latencies from the store match those from queries.
+    """
+    if dialect is SupportedSQLDialect.SQLITE:
+        # SQLite rounds each timestamp to the nearest millisecond.
+        start_ms = ((start_time - _EPOCH) // _MICROSECOND + 500) // 1000
+        end_ms = ((end_time - _EPOCH) // _MICROSECOND + 500) // 1000
+        return float(end_ms - start_ms)
+    if dialect is SupportedSQLDialect.POSTGRESQL:
+        # PostgreSQL rounds the exact latency to a tenth of a millisecond.
+        latency_ms = Decimal((end_time - start_time) // _MICROSECOND).scaleb(-3)
+        return float(latency_ms.quantize(Decimal("0.1"), rounding=ROUND_HALF_UP))
+    assert_never(dialect)
@@ -1,3 +1,4 @@
+from io import BytesIO
 from itertools import chain
 from random import random
 from typing import Any, Iterable, Union
@@ -5,7 +6,7 @@ from typing import Any, Iterable, Union
 import numpy as np
 import pandas as pd
 import pytest
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 from phoenix.core.model_schema import (
     ACTUAL_LABEL,
     ACTUAL_SCORE,
@@ -27,6 +28,7 @@ from phoenix.core.model_schema import (
     Schema,
     SingularDimensionalRole,
 )
+from pyarrow import parquet
 
 # Reverse the strings here for testing to make sure these values are not
 # hardcoded internally.
@@ -367,3 +369,52 @@ def test_raise_if_dim_role_is_unassigned():
 )
 def test_schema_to_json(schema: Schema):
     assert schema == Schema.from_json(schema.to_json())
+
+
+def test_reference_summary_is_computed_once() -> None:
+    model = Schema(prediction_id="A")(pd.DataFrame({"A": ["x"]}), pd.DataFrame({"A": ["y"]}))
+    calls = []
+
+    def summarize() -> int:
+        calls.append(None)
+        return len(calls)
+
+    assert model.reference_summary(("A", "count"), summarize) == 1
+    assert model.reference_summary(("A", "count"), summarize) == 1
+    assert model.reference_summary(("A", "other"), summarize) == 2
+    assert len(calls) == 2
+
+
+def test_export_rows_as_parquet_file() -> None:
+    model = Schema(prediction_id="ID", features=["A", "B"])(
+        pd.DataFrame({"ID": ["p0", "p1", "p2"], "A": [0, 1, 2], "B": ["x", "y", "z"]}),
+        pd.DataFrame({"ID": ["r0", "r1"], "A": [0.5, 1.5]}),
+    )
+    parquet_file = BytesIO()
+    model.export_rows_as_parquet_file(
+        {PRIMARY: [2, 0, 2], REFERENCE: [1]},
+        parquet_file,
+        cluster_ids={PRIMARY: {0: "1", 2: "0"}},
+        columns=["ID", "A"],
+        row_group_size=1,
+    )
+    parquet_file.seek(0)
+    assert parquet.ParquetFile(parquet_file).metadata.num_row_groups == 3
+    parquet_file.seek(0)
+    actual = pd.read_parquet(parquet_file)
+    expected = pd.concat(
+        [
+            model[PRIMARY]
+            .iloc[[0, 2]][["ID", "A"]]
+            .assign(
+                __phoenix_dataset_name__=model[PRIMARY].display_name,
+                __phoenix_cluster_id__=["1", "0"],
+            ),
+            model[REFERENCE]
+            .iloc[[1]][["ID", "A"]]
+            .assign(
+                __phoenix_dataset_name__=model[REFERENCE].display_name,
+            ),
+        ]
+    ).reset_index(drop=True)
+    assert_frame_equal(actual, expected, check_dtype=False)
@@ -1,8 +1,10 @@
 from typing import AsyncContextManager, Callable
 
+import pytest
 from phoenix.db import models
-from phoenix.db.insertion.dataset import ExampleContent, add_dataset_examples
-from sqlalchemy import select
+from phoenix.db.insertion import dataset
+from phoenix.db.insertion.dataset import DatasetAction, ExampleContent, add_dataset_examples
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -38,3 +40,34 @@ async def test_create_dataset(
     assert rev.input == {"x": 11, "y": 22}
     assert rev.output == {"z": 33}
     assert rev.metadata_ == {"zz": 44}
+
+
+async def test_append_dataset_examples_in_chunks(
+    db: Callable[[], AsyncContextManager[AsyncSession]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(dataset, "_EXAMPLES_CHUNK_SIZE", 2)
+    async with db() as session:
+        for action in (DatasetAction.CREATE, DatasetAction.APPEND):
+            await add_dataset_examples(
+                session=session,
+                examples=(ExampleContent(input={"x": i}, output={"y": -i}) for i in range(5)),
+                name="abc",
+                action=action,
+            )
+    async with db() as session:
+        revisions = (
+            await session.scalars(
+                select(models.DatasetExampleRevision).order_by(
+                    models.DatasetExampleRevision.dataset_example_id
+                )
+            )
+        ).all()
+        n_examples = await session.scalar(select(func.count(models.DatasetExample.id)))
+    assert n_examples == 10
+    assert len({rev.dataset_example_id for rev in revisions}) == 10
+    assert len({rev.dataset_version_id for rev in revisions}) == 2
+    assert [rev.input["x"] for rev in revisions] == [*range(5), *range(5)]
+    for rev in revisions:
+        assert rev.output == {"y": -rev.input["x"]}
+        assert rev.metadata_ == {}
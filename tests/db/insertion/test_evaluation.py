@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import pandas as pd
+from phoenix.db import models
+from phoenix.db.insertion.evaluation import (
+    DocumentEvaluationInsertionEvent,
+    SpanEvaluationInsertionEvent,
+    TraceEvaluationInsertionEvent,
+    insert_evaluations,
+)
+from phoenix.trace.span_evaluations import (
+    DocumentEvaluations,
+    SpanEvaluations,
+    TraceEvaluations,
+)
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def test_insert_evaluations(session: AsyncSession) -> None:
+    project_rowid = await session.scalar(
+        insert(models.Project).values(name="abc").returning(models.Project.id)
+    )
+    trace_rowid = await session.scalar(
+        insert(models.Trace)
+        .values(
+            trace_id="0123",
+            project_rowid=project_rowid,
+            start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+            end_time=datetime.fromisoformat("2021-01-01T00:01:00.000+00:00"),
+        )
+        .returning(models.Trace.id)
+    )
+    span_rowid = await session.scalar(
+        insert(models.Span)
+        .values(
+            trace_rowid=trace_rowid,
+            span_id="2345",
+            parent_id=None,
+            name="retriever span",
+            span_kind="RETRIEVER",
+            start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+            end_time=datetime.fromisoformat("2021-01-01T00:00:30.000+00:00"),
+            attributes={"retrieval": {"documents": [{"document": {"content": "A"}}]}},
+            events=[],
+            status_code="OK",
+            status_message="okay",
+            cumulative_error_count=0,
+            cumulative_llm_token_count_prompt=0,
+            cumulative_llm_token_count_completion=0,
+        )
+        .returning(models.Span.id)
+    )
+    # Rows without a result don't replace the earlier results of their subjects.
+    trace_evaluations = TraceEvaluations(
+        eval_name="correctness",
+        dataframe=pd.DataFrame(
+            {"trace_id": ["0123", "missing", "0123"], "score": [1.0, 0.0, None]},
+        ),
+    )
+    assert await insert_evaluations(session, trace_evaluations) == [
+        TraceEvaluationInsertionEvent(project_rowid, "correctness")
+    ]
+    span_evaluations = SpanEvaluations(
+        eval_name="toxicity",
+        dataframe=pd.DataFrame(
+            {
+                "span_id": ["2345", "2345", "missing", "2345"],
+                "label": ["toxic", "non-toxic", "toxic", None],
+                "explanation": [None, "ok", None, ""],
+            },
+        ),
+    )
+    assert await insert_evaluations(session, span_evaluations) == [
+        SpanEvaluationInsertionEvent(project_rowid, "toxicity")
+    ]
+    # Evaluations of the same subjects replace the earlier ones.
+    document_evaluations = DocumentEvaluations(
+        eval_name="relevance",
+        dataframe=pd.DataFrame(
+            {"span_id": ["2345", "2345"], "document_position": [0, 1], "score": [1, 1]},
+        ),
+    )
+    assert await insert_evaluations(session, document_evaluations) == [
+        DocumentEvaluationInsertionEvent(project_rowid, "relevance")
+    ]
+    document_evaluations = DocumentEvaluations(
+        eval_name="relevance",
+        dataframe=pd.DataFrame(
+            {"span_id": ["2345"], "document_position": [0], "score": [0], "label": ["no"]},
+        ),
+    )
+    await insert_evaluations(session, document_evaluations)
+
+    trace_annotations = (await session.scalars(select(models.TraceAnnotation))).all()
+    assert [(a.trace_rowid, a.name, a.score, a.label) for a in trace_annotations] == [
+        (trace_rowid, "correctness", 1.0, None)
+    ]
+    span_annotations = (await session.scalars(select(models.SpanAnnotation))).all()
+    assert [
+        (a.span_rowid, a.name, a.score, a.label, a.explanation, a.annotator_kind)
+        for a in span_annotations
+    ] == [(span_rowid, "toxicity", None, "non-toxic", "ok", "LLM")]
+    document_annotations = (await session.scalars(select(models.DocumentAnnotation))).all()
+    assert [
+        (a.span_rowid, a.document_position, a.name, a.score, a.label) for a in document_annotations
+    ] == [(span_rowid, 0, "relevance", 0.0, "no")]
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from phoenix.db import models
+from phoenix.db.insertion.span import insert_span
+from phoenix.server.api.dataloaders.span_descendants import SpanDescendantsDataLoader
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _span(
+    span_id: str,
+    parent_id: Optional[str],
+    status_code: SpanStatusCode,
+    start_time: datetime = datetime(2021, 1, 1, tzinfo=timezone.utc),
+    end_time: datetime = datetime(2021, 1, 1, 0, 1, tzinfo=timezone.utc),
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Span:
+    return Span(
+        name=span_id,
+        context=SpanContext(trace_id="0123", span_id=span_id),
+        parent_id=parent_id,
+        span_kind=SpanKind.CHAIN,
+        start_time=start_time,
+        end_time=end_time,
+        attributes=attributes or {},
+        status_code=status_code,
+        status_message="",
+        events=[],
+        conversation=None,
+    )
+
+
+async def test_insert_span_maintains_ancestors_in_any_order(db, session: AsyncSession) -> None:
+    # The tree is a -> b -> c -> d, plus a -> e, and the spans arrive out of
+    # order, e.g. a child before its parent and a parent between its children.
+    for span_id, parent_id, status_code in [
+        ("c", "b", SpanStatusCode.ERROR),
+        ("a", None, SpanStatusCode.OK),
+        ("e", "a", SpanStatusCode.ERROR),
+        ("d", "c", SpanStatusCode.ERROR),
+        ("b", "a", SpanStatusCode.OK),
+    ]:
+        await insert_span(session, _span(span_id, parent_id, status_code), "abc")
+
+    span_ancestors = await session.execute(
+        select(models.SpanAncestor.ancestor_id, models.Span.span_id).join(
+            models.Span, models.Span.id == models.SpanAncestor.span_rowid
+        )
+    )
+    assert sorted(span_ancestors) == [
+        ("a", "b"),
+        ("a", "c"),
+        ("a", "d"),
+        ("a", "e"),
+        ("b", "c"),
+        ("b", "d"),
+        ("c", "d"),
+    ]
+    cumulative_error_counts = await session.execute(
+        select(models.Span.span_id, models.Span.cumulative_error_count)
+    )
+    assert sorted(cumulative_error_counts) == [("a", 3), ("b", 2), ("c", 2), ("d", 1), ("e", 1)]
+
+    descendants = await SpanDescendantsDataLoader(db).load_many(["a", "c", "d"])
+    assert [sorted(span.span_id for span in spans) for spans in descendants] == [
+        ["b", "c", "d", "e"],
+        ["d"],
+        [],
+    ]
+
+
+async def test_insert_span_maintains_trace_summary(db, session: AsyncSession) -> None:
+    start_time = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    for span in [
+        _span(
+            "b",
+            "a",
+            SpanStatusCode.ERROR,
+            start_time + timedelta(seconds=1),
+            start_time + timedelta(seconds=3),
+            {"llm": {"token_count": {"prompt": 10, "completion": 5}}},
+        ),
+        _span("a", None, SpanStatusCode.OK, start_time, start_time + timedelta(seconds=2)),
+        _span(
+            "c",
+            "a",
+            SpanStatusCode.OK,
+            start_time,
+            start_time + timedelta(seconds=1),
+            {"llm": {"token_count": {"prompt": 1}}},
+        ),
+    ]:
+        await insert_span(session, span, "abc")
+    await insert_span(session, _span("c", "a", SpanStatusCode.ERROR), "abc")
+
+    trace = await session.scalar(select(models.Trace))
+    assert trace is not None
+    assert trace.start_time == start_time
+    assert trace.end_time == start_time + timedelta(seconds=3)
+    assert trace.latency_ms == 3000
+    assert (trace.root_span_id, trace.root_span_name, trace.root_span_status_code) == (
+        "a",
+        "a",
+        "OK",
+    )
+    assert (trace.span_count, trace.error_count) == (3, 1)
+    assert (trace.llm_token_count_prompt, trace.llm_token_count_completion) == (11, 5)
@@ -1,4 +1,6 @@
-from phoenix.db.engines import get_async_db_url
+import pytest
+from phoenix.db.engines import aio_sqlite_engine, create_read_only_engine, get_async_db_url
+from sqlalchemy import text
 
 
 def test_get_async_sqlite_db_url():
@@ -27,3 +29,25 @@ def test_get_async_postgresql_db_url():
     # NB(mikeldking): No idea why this fails to authenticate
     assert url.query["user"] == "user"
     assert url.query["password"] == "password"
+
+
+def test_create_read_only_engine_returns_none_for_sqlite_in_memory():
+    assert create_read_only_engine("sqlite:///:memory:") is None
+
+
+async def test_create_read_only_sqlite_engine_reads_but_does_not_write(tmp_path):
+    connection_str = f"sqlite:///{tmp_path / 'phoenix.db'}"
+    engine = aio_sqlite_engine(get_async_db_url(connection_str), migrate=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        await conn.execute(text("INSERT INTO t VALUES (1)"))
+    read_engine = create_read_only_engine(connection_str)
+    assert read_engine is not None
+    try:
+        async with read_engine.connect() as conn:
+            assert await conn.scalar(text("SELECT x FROM t")) == 1
+            with pytest.raises(Exception, match="readonly database"):
+                await conn.execute(text("INSERT INTO t VALUES (2)"))
+    finally:
+        await read_engine.dispose()
+        await engine.dispose()
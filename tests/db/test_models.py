@@ -1,5 +1,5 @@
 from phoenix.db import models
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 
 async def test_projects_with_session_injection(session, project):
@@ -22,3 +22,41 @@ async def test_empty_projects(session):
     statement = select(models.Project).where(models.Project.name == "test_project")
     result = (await session.execute(statement)).scalars().first()
     assert not result
+
+
+async def test_dataset_example_revisions_valid_to_version_id(session):
+    dataset_id = await session.scalar(
+        insert(models.Dataset).values(name="abc", metadata_={}).returning(models.Dataset.id)
+    )
+    version_ids = [
+        await session.scalar(
+            insert(models.DatasetVersion)
+            .values(dataset_id=dataset_id, metadata_={})
+            .returning(models.DatasetVersion.id)
+        )
+        for _ in range(3)
+    ]
+    example_id = await session.scalar(
+        insert(models.DatasetExample)
+        .values(dataset_id=dataset_id)
+        .returning(models.DatasetExample.id)
+    )
+    for version_id in (version_ids[0], version_ids[2], version_ids[1]):
+        await session.execute(
+            insert(models.DatasetExampleRevision).values(
+                dataset_example_id=example_id,
+                dataset_version_id=version_id,
+                input={},
+                output={},
+                metadata_={},
+                revision_kind="CREATE" if version_id == version_ids[0] else "PATCH",
+            )
+        )
+    valid_to_version_ids = (
+        await session.scalars(
+            select(models.DatasetExampleRevision.valid_to_version_id).order_by(
+                models.DatasetExampleRevision.dataset_version_id
+            )
+        )
+    ).all()
+    assert valid_to_version_ids == [version_ids[1], version_ids[2], None]
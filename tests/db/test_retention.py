@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from phoenix.db import models
+from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.retention import RetentionEnforcer
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _insert_trace(
+    session: AsyncSession,
+    project_rowid: int,
+    trace_id: str,
+    start_time: datetime,
+    num_spans: int,
+) -> List[int]:
+    trace_rowid = await session.scalar(
+        insert(models.Trace)
+        .values(
+            trace_id=trace_id,
+            project_rowid=project_rowid,
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=1),
+            span_count=num_spans,
+        )
+        .returning(models.Trace.id)
+    )
+    return [
+        await session.scalar(
+            insert(models.Span)
+            .values(
+                trace_rowid=trace_rowid,
+                span_id=f"{trace_id}-{i}",
+                parent_id=None,
+                name="span",
+                span_kind="UNKNOWN",
+                start_time=start_time,
+                end_time=start_time + timedelta(seconds=1),
+                attributes={},
+                events=[],
+                status_code="OK",
+                status_message="okay",
+                cumulative_error_count=0,
+                cumulative_llm_token_count_prompt=0,
+                cumulative_llm_token_count_completion=0,
+            )
+            .returning(models.Span.id)
+        )
+        for i in range(num_spans)
+    ]
+
+
+async def test_retention_enforcer_deletes_traces_in_batches(
+    dialect: str,
+    db,
+    session: AsyncSession,
+) -> None:
+    now = datetime.now(timezone.utc)
+    long_ago = now - timedelta(days=30)
+    by_age = await session.scalar(
+        insert(models.Project)
+        .values(name="by-age", retention_max_age_days=7)
+        .returning(models.Project.id)
+    )
+    [old_span_rowid] = await _insert_trace(session, by_age, "a0", long_ago, 1)
+    await _insert_trace(session, by_age, "a1", long_ago + timedelta(hours=1), 1)
+    await _insert_trace(session, by_age, "a2", now, 1)
+    await session.execute(
+        insert(models.SpanAnnotation).values(
+            span_rowid=old_span_rowid,
+            name="correctness",
+            label="correct",
+            score=1,
+            explanation=None,
+            metadata_={},
+            annotator_kind="LLM",
+        )
+    )
+    by_count = await session.scalar(
+        insert(models.Project)
+        .values(name="by-count", retention_max_span_count=2)
+        .returning(models.Project.id)
+    )
+    await _insert_trace(session, by_count, "c0", long_ago, 1)
+    await _insert_trace(session, by_count, "c1", long_ago + timedelta(hours=1), 2)
+    await _insert_trace(session, by_count, "c2", long_ago + timedelta(hours=2), 2)
+    unlimited = await session.scalar(
+        insert(models.Project).values(name="unlimited").returning(models.Project.id)
+    )
+    await _insert_trace(session, unlimited, "u0", long_ago, 1)
+
+    retention_enforcer = RetentionEnforcer(db, SupportedSQLDialect(dialect), batch_size=1)
+    assert await retention_enforcer.delete_batch() == 2
+    assert await retention_enforcer.delete_batch() == 2
+    assert await retention_enforcer.delete_batch() == 0
+
+    trace_ids = await session.scalars(select(models.Trace.trace_id).order_by(models.Trace.id))
+    assert list(trace_ids) == ["a2", "c2", "u0"]
+    assert not list(await session.scalars(select(models.SpanAnnotation.id)))
+
+    await session.execute(
+        update(models.Project)
+        .where(models.Project.id == by_count)
+        .values(retention_max_span_count=0)
+    )
+    assert await retention_enforcer.delete_batch() == 1
+    trace_ids = await session.scalars(select(models.Trace.trace_id).order_by(models.Trace.id))
+    assert list(trace_ids) == ["a2", "u0"]
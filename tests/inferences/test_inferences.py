@@ -1321,6 +1321,34 @@ def test_normalize_timestamps_raises_value_error_for_invalid_input() -> None:
         )
 
 
+def test_inferences_to_disc_and_from_name_preserve_values(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("phoenix.inferences.inferences.INFERENCES_DIR", tmp_path)
+    inferences = Inferences(
+        dataframe=DataFrame(
+            {
+                "timestamp": [Timestamp.utcnow()] * 3,
+                "prediction_label": ["apple", "orange", "grape"],
+                "embedding": [np.ones(4), np.zeros(4), np.ones(4)],
+                "feature": [1.0, np.nan, 3.0],
+            }
+        ),
+        schema=Schema(
+            timestamp_column_name="timestamp",
+            prediction_label_column_name="prediction_label",
+            embedding_feature_column_names={
+                "embedding": EmbeddingColumnNames(vector_column_name="embedding"),
+            },
+        ),
+        name="inferences-name",
+    )
+    inferences.to_disc()
+
+    read_inferences = Inferences.from_name("inferences-name")
+    assert read_inferences.name == inferences.name
+    assert read_inferences.schema == inferences.schema
+    pd.testing.assert_frame_equal(read_inferences.dataframe, inferences.dataframe)
+
+
 def test_inferences_with_arize_schema() -> None:
     from arize.utils.types import EmbeddingColumnNames as ArizeEmbeddingColumnNames
     from arize.utils.types import Schema as ArizeSchema
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from phoenix.core.model_schema import Column
+from phoenix.metrics.metrics import (
+    ApproximateCardinality,
+    ApproximateQuantile,
+    Cardinality,
+)
+
+column_name = "x"
+
+
+@pytest.mark.parametrize("probability", [0.01, 0.25, 0.5, 0.75, 0.99])
+@pytest.mark.parametrize("relative_accuracy", [0.01, 0.05])
+def test_approximate_quantile_is_within_relative_accuracy(
+    probability: float,
+    relative_accuracy: float,
+) -> None:
+    values = np.random.default_rng(12345).normal(size=10_000) * 100
+    df = pd.DataFrame({column_name: pd.Series(values)})
+    metric = ApproximateQuantile(
+        operand=Column(column_name),
+        probability=probability,
+        relative_accuracy=relative_accuracy,
+    )
+    # the sketch doesn't interpolate, so the value at the rank (rounded down) is the reference
+    desired = np.sort(values)[int(probability * (len(values) - 1))]
+    assert abs(metric(df) - desired) <= relative_accuracy * abs(desired)
+
+
+def test_approximate_quantile_ignores_missing_values() -> None:
+    df = pd.DataFrame({column_name: pd.Series([None, 0, "", 1, 1, np.inf], dtype=object)})
+    assert ApproximateQuantile(operand=Column(column_name), probability=0)(df) == 0
+    assert np.isnan(ApproximateQuantile(operand=Column(column_name))(df.iloc[:1]))
+
+
+def test_approximate_quantile_invalid_relative_accuracy() -> None:
+    with pytest.raises(ValueError):
+        ApproximateQuantile(operand=Column(column_name), relative_accuracy=0)
+
+
+@pytest.mark.parametrize("n_distinct", [0, 1, 100, 10_000, 100_000])
+def test_approximate_cardinality_is_within_error_bound(n_distinct: int) -> None:
+    values = np.random.default_rng(12345).permutation(np.arange(2 * n_distinct) % n_distinct)
+    df = pd.DataFrame({column_name: pd.Series(values.astype(str))})
+    desired = Cardinality(operand=Column(column_name))(df)
+    actual = ApproximateCardinality(operand=Column(column_name))(df)
+    # six standard errors, i.e. 1.04 / sqrt(2 ** 12) each
+    assert abs(actual - desired) <= 0.1 * desired
+
+
+def test_approximate_cardinality_excludes_missing_and_floats() -> None:
+    df = pd.DataFrame({column_name: pd.Series(["a", None, "b", "a"])})
+    assert ApproximateCardinality(operand=Column(column_name))(df) == 2
+    df = pd.DataFrame({column_name: pd.Series([1.0, 2.0])})
+    assert np.isnan(ApproximateCardinality(operand=Column(column_name))(df))
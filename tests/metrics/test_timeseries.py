@@ -5,10 +5,25 @@ from typing import NamedTuple, Union, cast
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+import pytest
 from phoenix.core.model_schema import Column
-from phoenix.metrics import Metric
-from phoenix.metrics.metrics import CountNotNull, EuclideanDistance, Mean, VectorMean, VectorSum
-from phoenix.metrics.timeseries import timeseries
+from phoenix.metrics import Metric, binning
+from phoenix.metrics.metrics import (
+    PSI,
+    ApproximateCardinality,
+    ApproximateQuantile,
+    Cardinality,
+    Count,
+    CountNotNull,
+    EuclideanDistance,
+    JSDistance,
+    KLDivergence,
+    Mean,
+    Sum,
+    VectorMean,
+    VectorSum,
+)
+from phoenix.metrics.timeseries import _results, timeseries
 
 
 def txt2arr(s: str) -> Union[float, npt.NDArray[np.float64]]:
@@ -304,6 +319,109 @@ def test_timeseries_empty_result() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "metric",
+    [
+        Count(),
+        Sum(operand=Column("x")),
+        PSI(operand=Column("y"), reference_data=reference_data),
+        KLDivergence(operand=Column("y"), reference_data=reference_data),
+        JSDistance(
+            operand=Column("x"),
+            reference_data=reference_data,
+            binning_method=binning.QuantileBinning(reference_series=reference_data.loc[:, "x"]),
+        ),
+        Cardinality(operand=Column("y")),
+        ApproximateCardinality(operand=Column("y")),
+        ApproximateQuantile(operand=Column("x"), probability=0.25),
+    ],
+)
+@pytest.mark.parametrize(
+    "evaluation_window,sampling_interval",
+    [
+        (timedelta(hours=72), timedelta(hours=24)),
+        (timedelta(hours=100), timedelta(hours=99)),
+        (timedelta(hours=80), timedelta(hours=80)),
+    ],
+)
+def test_timeseries_matches_calculation_on_each_window(
+    metric: Metric,
+    evaluation_window: timedelta,
+    sampling_interval: timedelta,
+) -> None:
+    actual = data.pipe(
+        timeseries(
+            start_time=start,
+            end_time=stop,
+            evaluation_window=evaluation_window,
+            sampling_interval=sampling_interval,
+        ),
+        metrics=(metric,),
+    )
+    timestamp = stop
+    while start <= timestamp:
+        window = data.loc[
+            (timestamp - evaluation_window <= data.index) & (data.index < timestamp),
+            :,
+        ]
+        if not window.empty:
+            row_id = cast(int, actual.index.get_loc(timestamp))
+            assert np.allclose(
+                metric(window),
+                metric.get_value(actual.iloc[row_id, :].to_dict()),
+                equal_nan=True,
+            )
+        timestamp -= sampling_interval
+
+
+@pytest.mark.parametrize(
+    "evaluation_window,sampling_interval",
+    [
+        (timedelta(hours=72), timedelta(hours=24)),
+        (timedelta(hours=1), timedelta(hours=1)),
+        (timedelta(hours=100), timedelta(hours=99)),
+        (timedelta(hours=80), timedelta(hours=80)),
+        (stop - start, stop - start),
+    ],
+)
+def test_timeseries_decomposed_matches_groupers(
+    evaluation_window: timedelta,
+    sampling_interval: timedelta,
+) -> None:
+    calcs = (
+        Count(),
+        Mean(operand=Column("x")),
+        PSI(operand=Column("y"), reference_data=reference_data),
+    )
+    actual = data.pipe(
+        timeseries(
+            start_time=start,
+            end_time=stop,
+            evaluation_window=evaluation_window,
+            sampling_interval=sampling_interval,
+        ),
+        metrics=calcs,
+    ).sort_index()
+    expected = pd.concat(
+        _results(
+            calcs=calcs,
+            dataframe=data,
+            start_time=start,
+            end_time=stop,
+            evaluation_window=evaluation_window,
+            sampling_interval=sampling_interval,
+        ),
+    ).sort_index()
+    assert actual.index.equals(expected.index)
+    for (_, expected_row), (_, actual_row) in zip(expected.iterrows(), actual.iterrows()):
+        for calc in calcs:
+            assert np.allclose(
+                calc.get_value(expected_row.to_dict()),
+                calc.get_value(actual_row.to_dict()),
+                equal_nan=True,
+            )
+
+
 def compare(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
     assert len(expected) >= len(actual)
     for timestamp, row in expected.iterrows():
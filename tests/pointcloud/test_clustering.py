@@ -0,0 +1,59 @@
+import sys
+
+import numpy as np
+import pytest
+from hdbscan import HDBSCAN
+from phoenix.pointcloud.clustering import Hdbscan, _single_linkage_trees
+
+
+@pytest.fixture
+def mat() -> np.ndarray:
+    rng = np.random.default_rng(12345)
+    return np.concatenate([rng.normal(center, 0.5, (60, 3)) for center in (0, 3, 6, 9)])
+
+
+@pytest.fixture(autouse=True)
+def clear_single_linkage_trees() -> None:
+    _single_linkage_trees.clear()
+
+
+@pytest.mark.parametrize("min_cluster_size", [5, 70, 10])
+@pytest.mark.parametrize("cluster_selection_epsilon", [0.0, 0.5])
+@pytest.mark.parametrize("cached", [False, True])
+def test_find_clusters_matches_hdbscan(
+    min_cluster_size: int,
+    cluster_selection_epsilon: float,
+    cached: bool,
+    mat: np.ndarray,
+) -> None:
+    if cached:
+        # Caches the single linkage tree for different clustering parameters.
+        Hdbscan(min_cluster_size=20, min_samples=3).find_clusters(mat)
+        assert len(_single_linkage_trees) == 1
+    cluster_ids = HDBSCAN(
+        min_cluster_size=min_cluster_size,
+        min_samples=3,
+        cluster_selection_epsilon=cluster_selection_epsilon,
+    ).fit_predict(mat)
+    clusters = Hdbscan(
+        min_cluster_size=min_cluster_size,
+        min_samples=3,
+        cluster_selection_epsilon=cluster_selection_epsilon,
+    ).find_clusters(mat)
+    assert len(clusters) == np.max(cluster_ids) + 1
+    for cluster_id, cluster in enumerate(clusters):
+        np.testing.assert_array_equal(cluster, np.flatnonzero(cluster_ids == cluster_id))
+    assert len(_single_linkage_trees) == 1
+
+
+def test_find_clusters_falls_back_to_hdbscan_without_its_private_api(
+    mat: np.ndarray,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(sys.modules, "hdbscan.hdbscan_", None)
+    cluster_ids = HDBSCAN(min_cluster_size=10, min_samples=3).fit_predict(mat)
+    clusters = Hdbscan(min_cluster_size=10, min_samples=3).find_clusters(mat)
+    assert len(clusters) == np.max(cluster_ids) + 1
+    for cluster_id, cluster in enumerate(clusters):
+        np.testing.assert_array_equal(cluster, np.flatnonzero(cluster_ids == cluster_id))
+    assert not _single_linkage_trees
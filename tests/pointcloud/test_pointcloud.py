@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from itertools import chain, cycle
-from typing import Dict, List, Set
+from typing import Dict, List
 
 import numpy as np
 import numpy.typing as npt
@@ -21,11 +21,9 @@ class MockDimensionalityReducer:
 class MockClustersFinder:
     cluster_assignments: Dict[int, int]
 
-    def find_clusters(self, arr: npt.NDArray[np.float64]) -> List[Set[int]]:
-        ans: List[Set[int]] = [set() for _ in range(len(set(self.cluster_assignments.values())))]
-        for i in range(arr.shape[0]):
-            ans[self.cluster_assignments[i]].add(i)
-        return ans
+    def find_clusters(self, arr: npt.NDArray[np.float64]) -> List[npt.NDArray[np.intp]]:
+        cluster_ids = np.array([self.cluster_assignments[i] for i in range(arr.shape[0])])
+        return [np.flatnonzero(cluster_ids == i) for i in range(np.max(cluster_ids) + 1)]
 
 
 @pytest.mark.parametrize(
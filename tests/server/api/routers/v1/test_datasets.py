@@ -1,3 +1,4 @@
+import asyncio
 import gzip
 import inspect
 import io
@@ -10,10 +11,19 @@ import pyarrow as pa
 import pytest
 from httpx import HTTPStatusError
 from pandas.testing import assert_frame_equal
+from phoenix.config import EXPORT_DIR
+from phoenix.core.model_schema_adapter import create_model_from_inferences
 from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine, create_read_only_engine, get_async_db_url
+from phoenix.inferences.inferences import EMPTY_INFERENCES
+from phoenix.pointcloud.umap_parameters import get_umap_parameters
+from phoenix.server.api.routers.v1.datasets import get_dataset_csv
 from phoenix.server.api.types.Dataset import Dataset
 from phoenix.server.api.types.DatasetVersion import DatasetVersion
+from phoenix.server.app import SessionFactory, create_app
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.requests import Request
 from strawberry.relay import GlobalID
 
 
@@ -546,3 +556,72 @@ async def test_delete_dataset(test_client, empty_dataset) -> None:
     assert len((await test_client.get("v1/datasets")).json()["data"]) == 0
     with pytest.raises(HTTPStatusError):
         (await test_client.delete(url)).raise_for_status()
+
+
+async def test_dataset_download_does_not_hold_the_sqlite_writer(tmp_path) -> None:
+    connection_str = f"sqlite:///{tmp_path / 'phoenix.db'}"
+    engine = aio_sqlite_engine(get_async_db_url(connection_str), migrate=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    read_engine = create_read_only_engine(connection_str)
+    assert read_engine is not None
+    db = async_sessionmaker(engine, expire_on_commit=False).begin
+    try:
+        async with db() as session:
+            session.add(models.Dataset(id=1, name="dataset", metadata_={}))
+            await session.flush()
+            session.add(models.DatasetVersion(id=1, dataset_id=1, metadata_={}))
+            await session.flush()
+            for i in range(3):
+                session.add(models.DatasetExample(id=i, dataset_id=1))
+                await session.flush()
+                session.add(
+                    models.DatasetExampleRevision(
+                        dataset_example_id=i,
+                        dataset_version_id=1,
+                        input={"in": i},
+                        output={"out": i},
+                        metadata_={},
+                        revision_kind="CREATE",
+                    )
+                )
+        app = create_app(
+            db=SessionFactory(
+                session_factory=db,
+                dialect="sqlite",
+                reader_session_factory=async_sessionmaker(
+                    read_engine, expire_on_commit=False
+                ).begin,
+            ),
+            model=create_model_from_inferences(EMPTY_INFERENCES, None),
+            export_path=EXPORT_DIR,
+            umap_params=get_umap_parameters(None),
+            serve_ui=False,
+        )
+        request = Request(
+            {
+                "type": "http",
+                "app": app,
+                "path_params": {"id": str(GlobalID(Dataset.__name__, "1"))},
+                "query_string": b"",
+                "headers": [],
+            }
+        )
+        response = await get_dataset_csv(request)
+        body = response.body_iterator  # type: ignore[attr-defined]
+        chunks = [await body.__anext__()]
+
+        # The download is now suspended with its session open, while the
+        # single connection for writes remains available to others.
+        async def write() -> None:
+            async with db() as session:
+                session.add(models.Dataset(id=2, name="another dataset", metadata_={}))
+
+        await asyncio.wait_for(write(), timeout=5)
+        chunks.extend([chunk async for chunk in body])
+        assert gzip.decompress(b"".join(chunks)).decode().splitlines()[1:] == [
+            f"{GlobalID('DatasetExample', str(i))},{i},{i}" for i in range(3)
+        ]
+    finally:
+        await read_engine.dispose()
+        await engine.dispose()
@@ -0,0 +1,168 @@
+from datetime import datetime
+from io import BytesIO
+from typing import List, Tuple
+
+import httpx
+import pyarrow as pa
+import pytest
+from phoenix.config import EXPORT_DIR
+from phoenix.core.model_schema_adapter import create_model_from_inferences
+from phoenix.db import models
+from phoenix.inferences.inferences import EMPTY_INFERENCES
+from phoenix.pointcloud.umap_parameters import get_umap_parameters
+from phoenix.server.app import SessionFactory, create_app
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+async def abc_project_rowid(session: AsyncSession) -> int:
+    project_rowid = await session.scalar(
+        insert(models.Project).values(name="abc").returning(models.Project.id)
+    )
+    trace_rowid = await session.scalar(
+        insert(models.Trace)
+        .values(
+            trace_id="0123",
+            project_rowid=project_rowid,
+            start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+            end_time=datetime.fromisoformat("2021-01-01T00:01:00.000+00:00"),
+        )
+        .returning(models.Trace.id)
+    )
+    assert project_rowid is not None and trace_rowid is not None
+    for i in range(3):
+        await _insert_span(session, trace_rowid, i)
+    return project_rowid
+
+
+async def _insert_span(session: AsyncSession, trace_rowid: int, i: int) -> None:
+    await session.execute(
+        insert(models.Span).values(
+            trace_rowid=trace_rowid,
+            span_id=str(i),
+            parent_id=None,
+            name=f"span {i}",
+            span_kind="UNKNOWN",
+            start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+            end_time=datetime.fromisoformat("2021-01-01T00:00:30.000+00:00"),
+            attributes={"input": {"value": "210"}},
+            events=[],
+            status_code="OK",
+            status_message="okay",
+            cumulative_error_count=0,
+            cumulative_llm_token_count_prompt=0,
+            cumulative_llm_token_count_completion=0,
+        )
+    )
+
+
+async def test_query_spans_is_revalidated_with_etag(dialect, db, abc_project_rowid: int) -> None:
+    app = create_app(
+        db=SessionFactory(session_factory=db, dialect=dialect),
+        model=create_model_from_inferences(EMPTY_INFERENCES, None),
+        export_path=EXPORT_DIR,
+        umap_params=get_umap_parameters(None),
+        serve_ui=False,
+        span_query_cache_size_mb=1,
+    )
+    payload = {"queries": [{"select": {"name": {"key": "name"}}}], "limit": 10}
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.post("/v1/spans", params={"project_name": "abc"}, json=payload)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        content = response.content
+
+        response = await client.post(
+            "/v1/spans",
+            params={"project_name": "abc"},
+            json=payload,
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+        response = await client.post("/v1/spans", params={"project_name": "abc"}, json=payload)
+        assert response.status_code == 200
+        assert response.headers["etag"] == etag
+        assert response.content == content
+
+        app.state.span_query_cache.invalidate(abc_project_rowid)
+        response = await client.post(
+            "/v1/spans",
+            params={"project_name": "abc"},
+            json=payload,
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.content == content
+
+
+async def test_query_spans_after_cursor(test_client, abc_project_rowid: int) -> None:
+    payload = {"queries": [{"select": {"name": {"key": "name"}}}], "limit": 2}
+    names, cursor = [], ""
+    for expected_count in (2, 1, 0):
+        response = await test_client.post(
+            "/v1/spans",
+            params={"project_name": "abc"},
+            json={**payload, "after_cursor": cursor},
+        )
+        assert response.status_code == 200
+        with pa.ipc.open_stream(BytesIO(response.content)) as reader:
+            df = reader.read_pandas()
+        assert len(df) == expected_count
+        names.extend(df["name"])
+        cursor = response.headers["x-phoenix-next-cursor"]
+    assert sorted(names) == ["span 0", "span 1", "span 2"]
+
+    response = await test_client.post(
+        "/v1/spans",
+        params={"project_name": "abc"},
+        json={**payload, "after_cursor": "x"},
+    )
+    assert response.status_code == 422
+
+
+async def test_query_spans_after_cursor_returns_spans_inserted_after_deletions(
+    test_client, session: AsyncSession, abc_project_rowid: int
+) -> None:
+    async def insert_trace(trace_id: str, span_index: int) -> None:
+        trace_rowid = await session.scalar(
+            insert(models.Trace)
+            .values(
+                trace_id=trace_id,
+                project_rowid=abc_project_rowid,
+                start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+                end_time=datetime.fromisoformat("2021-01-01T00:01:00.000+00:00"),
+            )
+            .returning(models.Trace.id)
+        )
+        assert trace_rowid is not None
+        await _insert_span(session, trace_rowid, span_index)
+
+    async def query_spans(cursor: str) -> Tuple[List[str], str]:
+        response = await test_client.post(
+            "/v1/spans",
+            params={"project_name": "abc"},
+            json={
+                "queries": [{"select": {"name": {"key": "name"}}}],
+                "limit": 10,
+                "after_cursor": cursor,
+            },
+        )
+        assert response.status_code == 200
+        with pa.ipc.open_stream(BytesIO(response.content)) as reader:
+            df = reader.read_pandas()
+        return sorted(df["name"]), response.headers["x-phoenix-next-cursor"]
+
+    await insert_trace("4567", 3)
+    names, cursor = await query_spans("")
+    assert names == ["span 0", "span 1", "span 2", "span 3"]
+    # The row ids of the newest spans are not reused after they are deleted.
+    await session.execute(delete(models.Trace).where(models.Trace.trace_id == "4567"))
+    await insert_trace("89ab", 4)
+    names, _ = await query_spans(cursor)
+    assert names == ["span 4"]
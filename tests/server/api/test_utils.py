@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from phoenix.db import models
+from phoenix.server.api.utils import delete_projects, delete_traces
+from phoenix.server.span_query_cache import SpanQueryCache
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def test_deletions_invalidate_span_query_cache(db, session: AsyncSession) -> None:
+    project_rowids = [
+        await session.scalar(insert(models.Project).values(name=name).returning(models.Project.id))
+        for name in ("abc", "xyz")
+    ]
+    for i, project_rowid in enumerate(project_rowids):
+        await session.execute(
+            insert(models.Trace).values(
+                trace_id=str(i),
+                project_rowid=project_rowid,
+                start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+                end_time=datetime.fromisoformat("2021-01-01T00:01:00.000+00:00"),
+            )
+        )
+    cache = SpanQueryCache(max_bytes=1000)
+    abc, xyz = project_rowids
+    assert await delete_traces(db, "1", span_query_cache=cache)
+    assert cache.data_version(abc) == 0
+    assert cache.data_version(xyz) == 1
+    assert await delete_projects(db, "abc", span_query_cache=cache) == [abc]
+    assert cache.data_version(abc) == 1
+    assert cache.data_version(xyz) == 1
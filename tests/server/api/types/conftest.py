@@ -47,6 +47,7 @@ def context_factory() -> Callable[[Inferences, Optional[Inferences]], Context]:
             model=create_model_from_inferences(primary_inferences, reference_inferences),
             export_path=Path(TemporaryDirectory().name),
             db=None,  # TODO(persistence): add mock for db
+            read_db=None,
             data_loaders=None,  # TODO(persistence): add mock for data_loaders
             cache_for_dataloaders=None,
         )
@@ -2,10 +2,19 @@
 
 from datetime import datetime
 
+import httpx
 import pytest
-from phoenix.config import DEFAULT_PROJECT_NAME
+from phoenix.config import (
+    DEFAULT_PROJECT_NAME,
+    ENV_PHOENIX_ENABLE_SPAN_FULL_TEXT_INDEX,
+    EXPORT_DIR,
+)
+from phoenix.core.model_schema_adapter import create_model_from_inferences
 from phoenix.db import models
+from phoenix.inferences.inferences import EMPTY_INFERENCES
+from phoenix.pointcloud.umap_parameters import get_umap_parameters
 from phoenix.server.api.types.pagination import Cursor, CursorSortColumn, CursorSortColumnDataType
+from phoenix.server.app import SessionFactory, create_app
 from sqlalchemy import insert
 from strawberry.relay import GlobalID
 
@@ -528,6 +537,52 @@ async def test_project_spans(
     assert Cursor.from_string(edges[-1]["cursor"]) == end_cursor
 
 
+async def test_project_spans_contain_text_on_read_only_server_with_full_text_index_enabled(
+    dialect,
+    db,
+    llama_index_rag_spans,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A read-only server doesn't create the index, so it must not search it.
+    monkeypatch.setenv(ENV_PHOENIX_ENABLE_SPAN_FULL_TEXT_INDEX, "true")
+    app = create_app(
+        db=SessionFactory(session_factory=db, dialect=dialect),
+        model=create_model_from_inferences(EMPTY_INFERENCES, None),
+        export_path=EXPORT_DIR,
+        umap_params=get_umap_parameters(None),
+        serve_ui=False,
+        read_only=True,
+    )
+    query = """
+      query ($projectId: GlobalID!, $filterCondition: String!) {
+        node(id: $projectId) {
+          ... on Project {
+            recordCount(filterCondition: $filterCondition)
+            spans(filterCondition: $filterCondition, first: 100) {
+              edges {
+                node {
+                  name
+                }
+              }
+            }
+          }
+        }
+      }
+    """
+    variables = {"projectId": PROJECT_ID, "filterCondition": "'drift metrics' in input.value"}
+    async with app.router.lifespan_context(app):
+        assert app.state.has_span_full_text_index is False
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post("/graphql", json={"query": query, "variables": variables})
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json.get("errors") is None
+    project = response_json["data"]["node"]
+    assert project["recordCount"] == len(project["spans"]["edges"]) > 0
+
+
 @pytest.fixture
 async def llama_index_rag_spans(session):
     # Inserts the first three traces from the llama-index-rag trace fixture
@@ -0,0 +1,68 @@
+import gzip
+from datetime import datetime, timezone
+
+import pytest
+from google.protobuf.message import DecodeError
+from openinference.semconv.resource import ResourceAttributes
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans
+from phoenix.server.otlp_decoder import OtlpDecoder, decode_export_trace_service_request
+from phoenix.trace.otel import encode_span_to_otlp
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+
+
+@pytest.fixture
+def span() -> Span:
+    return Span(
+        name="test_span",
+        context=SpanContext(trace_id="0123", span_id="2345"),
+        parent_id=None,
+        span_kind=SpanKind.LLM,
+        start_time=datetime(2021, 12, 1, 0, 0, 10, tzinfo=timezone.utc),
+        end_time=datetime(2021, 12, 1, 0, 0, 20, tzinfo=timezone.utc),
+        attributes={"openinference": {"span": {"kind": "LLM"}}},
+        status_code=SpanStatusCode.OK,
+        status_message="",
+        events=[],
+        conversation=None,
+    )
+
+
+@pytest.fixture
+def body(span: Span) -> bytes:
+    req = ExportTraceServiceRequest(
+        resource_spans=[
+            ResourceSpans(
+                resource=Resource(
+                    attributes=[
+                        KeyValue(
+                            key=ResourceAttributes.PROJECT_NAME,
+                            value=AnyValue(string_value="abc"),
+                        )
+                    ]
+                ),
+                scope_spans=[ScopeSpans(spans=[encode_span_to_otlp(span)])],
+            )
+        ]
+    )
+    return req.SerializeToString()
+
+
+def test_decode_export_trace_service_request(body: bytes) -> None:
+    spans = decode_export_trace_service_request(gzip.compress(body), "gzip")
+    assert [(span.name, project_name) for span, project_name in spans] == [("test_span", "abc")]
+    with pytest.raises(DecodeError):
+        decode_export_trace_service_request(b"invalid")
+
+
+async def test_otlp_decoder_decodes_in_worker_process(body: bytes) -> None:
+    otlp_decoder = OtlpDecoder(num_workers=1)
+    try:
+        spans = await otlp_decoder.decode(body)
+        assert spans == decode_export_trace_service_request(body)
+        with pytest.raises(DecodeError):
+            await otlp_decoder.decode(b"invalid")
+    finally:
+        otlp_decoder.shutdown()
@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime, timezone
+
+from phoenix.db import models
+from phoenix.db.bulk_inserter import BulkInserter
+from phoenix.server.project_updates import ProjectUpdate, ProjectUpdateBroker
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def test_project_update_broker_merges_pending_updates() -> None:
+    broker = ProjectUpdateBroker(max_span_rowids=3)
+    updates = broker.subscribe(1)
+    next_update = asyncio.create_task(updates.__anext__())
+    await asyncio.sleep(0)
+    broker.publish(ProjectUpdate(1, span_rowids=[1], record_count_delta=1, trace_count_delta=1))
+    broker.publish(ProjectUpdate(2, span_rowids=[2], record_count_delta=1))
+    broker.publish(ProjectUpdate(1, span_rowids=[3], record_count_delta=1))
+    assert await next_update == ProjectUpdate(
+        1, span_rowids=[1, 3], record_count_delta=2, trace_count_delta=1
+    )
+
+    broker.publish(ProjectUpdate(1, span_rowids=[4, 5], record_count_delta=2))
+    broker.publish(ProjectUpdate(1, span_rowids=[6, 7], record_count_delta=2))
+    broker.publish(ProjectUpdate(1, has_new_evaluations=True))
+    assert await updates.__anext__() == ProjectUpdate(
+        1, is_truncated=True, record_count_delta=4, has_new_evaluations=True
+    )
+
+    await updates.aclose()
+    broker.publish(ProjectUpdate(1, span_rowids=[8], record_count_delta=1))
+    assert not broker._subscribers
+
+
+async def test_bulk_inserter_publishes_committed_spans(db, session: AsyncSession) -> None:
+    project_rowid = await session.scalar(
+        insert(models.Project).values(name="abc").returning(models.Project.id)
+    )
+    broker = ProjectUpdateBroker()
+    updates = broker.subscribe(project_rowid)
+    next_update = asyncio.create_task(updates.__anext__())
+    start_time = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    async with BulkInserter(db, project_update_broker=broker, sleep=0.001) as (queue_span, *_):
+        for span_id, parent_id in [("b", "a"), ("a", None)]:
+            await queue_span(
+                Span(
+                    name=span_id,
+                    context=SpanContext(trace_id="0123", span_id=span_id),
+                    parent_id=parent_id,
+                    span_kind=SpanKind.LLM,
+                    start_time=start_time,
+                    end_time=start_time,
+                    attributes={"llm": {"token_count": {"prompt": 10, "completion": 5}}},
+                    status_code=SpanStatusCode.OK,
+                    status_message="",
+                    events=[],
+                    conversation=None,
+                ),
+                "abc",
+            )
+        update = await asyncio.wait_for(next_update, 10)
+    await updates.aclose()
+
+    span_rowids = await session.scalars(select(models.Span.id).order_by(models.Span.span_id))
+    assert update == ProjectUpdate(
+        project_rowid,
+        span_rowids=list(reversed(list(span_rowids))),
+        record_count_delta=2,
+        trace_count_delta=1,
+        token_count_prompt_delta=20,
+        token_count_completion_delta=10,
+    )
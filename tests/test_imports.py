@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = (
+    "hdbscan",
+    "numba",
+    "phoenix.server.app",
+    "phoenix.session.session",
+    "scipy",
+    "sklearn",
+    "strawberry",
+    "umap",
+)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        pytest.param("import phoenix", id="import"),
+        pytest.param("from phoenix import Client", id="client"),
+        pytest.param("import phoenix as px; px.Inferences; px.TraceDataset", id="data"),
+    ],
+)
+def test_client_usage_does_not_import_heavy_modules(statement: str) -> None:
+    # The statement runs in a fresh interpreter, since the modules may already
+    # have been imported by other tests.
+    code = "\n".join(
+        [
+            "import sys",
+            statement,
+            f"print(*sorted(m for m in {_HEAVY_MODULES!r} if m in sys.modules))",
+        ]
+    )
+    imported = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert imported == []
+
+
+def test_lazy_attributes_are_exported() -> None:
+    import phoenix as px
+
+    assert set(px.__all__) - {"evals"} <= set(dir(px))
+    assert px.Client is px.session.client.Client
+    assert px.trace.SpanEvaluations is not None
+    with pytest.raises(AttributeError):
+        px.nonexistent_attribute
@@ -1,5 +1,6 @@
 import ast
 import sys
+from datetime import datetime
 from typing import List, Optional
 from unittest.mock import patch
 
@@ -7,7 +8,7 @@ import phoenix.trace.dsl.filter
 import pytest
 from phoenix.db import models
 from phoenix.trace.dsl.filter import SpanFilter, _apply_eval_aliasing, _get_attribute_keys_list
-from sqlalchemy import select
+from sqlalchemy import insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 if sys.version_info >= (3, 9):
@@ -230,3 +231,145 @@ def test_apply_eval_aliasing(filter_condition: str, expected: str) -> None:
     with patch.object(phoenix.trace.dsl.filter, "randint", return_value=0):
         aliased, _ = _apply_eval_aliasing(filter_condition)
     assert aliased == expected
+
+
+async def test_filter_is_compiled_once_per_condition(session: AsyncSession) -> None:
+    condition = "evals['Hallucination'].score < 0.5 and span_kind == 'LLM'"
+    f, g = SpanFilter(condition), SpanFilter(condition)
+    assert f.compiled is g.compiled
+    assert f._aliased_annotation_relations is g._aliased_annotation_relations
+    stmt_f, stmt_g = f(select(models.Span.id)), g(select(models.Span.id))
+    assert stmt_f._generate_cache_key() == stmt_g._generate_cache_key()
+    assert SpanFilter(condition, valid_eval_names=["Hallucination"]).compiled is not f.compiled
+    with pytest.raises(SyntaxError):
+        SpanFilter(condition, valid_eval_names=["Q&A Correctness"])
+
+
+@pytest.mark.parametrize(
+    "condition,index_name",
+    [
+        ("llm.model_name == 'gpt-4'", "ix_spans_llm_model_name"),
+        ("span_kind == 'LLM' and attributes['session']['id'] == 'abc'", "ix_spans_session_id"),
+        ("attributes[['user', 'id']] in ['a', 'b']", "ix_spans_user_id"),
+    ],
+)
+async def test_filter_uses_promoted_attribute_index(
+    session: AsyncSession, dialect: str, condition: str, index_name: str
+) -> None:
+    stmt = SpanFilter(condition)(select(models.Span.id))
+    conn = await session.connection()
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if dialect == "sqlite":
+        plan = (await session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))).all()
+    else:
+        await session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = (await session.execute(text(f"EXPLAIN {sql}"))).all()
+    assert index_name in str(plan)
+
+
+@pytest.mark.parametrize(
+    "condition,expected",
+    [
+        ("session.id == '123'", ["0", "1"]),
+        ("session.id in ['123', 'abc']", ["0", "1", "2"]),
+        ("session.id != '123'", ["2"]),
+    ],
+)
+async def test_filter_compares_promoted_attribute_as_string(
+    session: AsyncSession, condition: str, expected: List[str]
+) -> None:
+    # The promoted column holds the text of a numeric id, so on SQLite the id
+    # 123 matches '123', as it does on PostgreSQL, whereas the JSON value that
+    # the column replaces is a number that doesn't.
+    project_rowid = await session.scalar(
+        insert(models.Project).values(name="abc").returning(models.Project.id)
+    )
+    trace_rowid = await session.scalar(
+        insert(models.Trace)
+        .values(
+            trace_id="0",
+            project_rowid=project_rowid,
+            start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+            end_time=datetime.fromisoformat("2021-01-01T00:01:00.000+00:00"),
+        )
+        .returning(models.Trace.id)
+    )
+    for span_id, session_id in enumerate([123, "123", "abc"]):
+        await session.execute(
+            insert(models.Span).values(
+                trace_rowid=trace_rowid,
+                span_id=str(span_id),
+                parent_id=None,
+                name="span",
+                span_kind="LLM",
+                start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+                end_time=datetime.fromisoformat("2021-01-01T00:00:30.000+00:00"),
+                attributes={"session": {"id": session_id}},
+                events=[],
+                status_code="OK",
+                status_message="",
+                cumulative_error_count=0,
+                cumulative_llm_token_count_prompt=0,
+                cumulative_llm_token_count_completion=0,
+            )
+        )
+    stmt = SpanFilter(condition)(select(models.Span.span_id).order_by(models.Span.span_id))
+    assert [span_id async for span_id in await session.stream_scalars(stmt)] == expected
+
+
+async def test_filter_searches_full_text_index(
+    session: AsyncSession,
+    dialect: str,
+) -> None:
+    condition = """'y "hel' in input.value and span_kind == 'LLM'"""
+    assert "SpanTextContains" not in unparse(SpanFilter(condition).translated)
+    conn = await session.connection()
+    assert not await conn.run_sync(models.has_span_full_text_index)
+    await conn.run_sync(models.create_span_full_text_index)
+    assert await conn.run_sync(models.has_span_full_text_index)
+    project_rowid = await session.scalar(
+        insert(models.Project).values(name="abc").returning(models.Project.id)
+    )
+    trace_rowid = await session.scalar(
+        insert(models.Trace)
+        .values(
+            trace_id="0",
+            project_rowid=project_rowid,
+            start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+            end_time=datetime.fromisoformat("2021-01-01T00:01:00.000+00:00"),
+        )
+        .returning(models.Trace.id)
+    )
+    for span_id, value in enumerate(['say "hello"', 'SAY "HELLO"', "say hello", None]):
+        await session.execute(
+            insert(models.Span).values(
+                trace_rowid=trace_rowid,
+                span_id=str(span_id),
+                parent_id=None,
+                name="span",
+                span_kind="LLM",
+                start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+                end_time=datetime.fromisoformat("2021-01-01T00:00:30.000+00:00"),
+                attributes={"input": {"value": value}} if value else {},
+                events=[],
+                status_code="OK",
+                status_message="",
+                cumulative_error_count=0,
+                cumulative_llm_token_count_prompt=0,
+                cumulative_llm_token_count_completion=0,
+            )
+        )
+    stmt = SpanFilter(condition, search_text_index=True)(select(models.Span.span_id))
+    assert [span_id async for span_id in await session.stream_scalars(stmt)] == ["0"]
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if dialect == "sqlite":
+        plan = (await session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))).all()
+        assert "spans_fts" in str(plan)
+    else:
+        await session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = (await session.execute(text(f"EXPLAIN {sql}"))).all()
+        assert "ix_spans_input_value_trigram" in str(plan)
+    await conn.run_sync(models.drop_span_full_text_index)
+    assert not await conn.run_sync(models.has_span_full_text_index)
+    stmt = SpanFilter(condition)(select(models.Span.span_id))
+    assert [span_id async for span_id in await session.stream_scalars(stmt)] == ["0"]
@@ -1,12 +1,15 @@
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 import nest_asyncio
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
+from phoenix.db.insertion.span import insert_span
 from phoenix.trace.dsl import SpanQuery
 from phoenix.trace.dsl.helpers import get_qa_with_reference, get_retrieved_documents
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -52,6 +55,121 @@ def test_get_qa_with_reference(
     )
 
 
+async def test_get_retrieved_documents_keeps_the_values_of_the_documents_on_sqlite(
+    sqlite_session: AsyncSession,
+) -> None:
+    await _insert_retriever_spans(sqlite_session)
+    nest_asyncio.apply()  # needed to use an async session inside the client Mock
+    expected = pd.DataFrame(
+        {
+            "context.span_id": ["r1", "r1", "r1", "r1", "r3", "r3", "r3"],
+            "document_position": [0, 1, 2, 3, 0, 1, 2],
+            "context.trace_id": ["t1", "t1", "t1", "t1", "t3", "t3", "t3"],
+            "input": ["q1", "q1", "q1", "q1", "q3", "q3", "q3"],
+            "reference": ["A", "B", np.nan, np.nan, 3, {"a": [1, 2]}, "C"],
+            "document_score": [1, 2.5, np.nan, np.nan, True, 0.1, 1e20],
+        }
+    ).set_index(["context.span_id", "document_position"])
+    actual = get_retrieved_documents(_Mock(sqlite_session))
+    assert_frame_equal(
+        actual.sort_index().sort_index(axis=1),
+        expected.sort_index().sort_index(axis=1),
+    )
+
+
+async def test_get_qa_with_reference_keeps_the_values_of_the_documents_on_sqlite(
+    sqlite_session: AsyncSession,
+) -> None:
+    await _insert_retriever_spans(sqlite_session)
+    nest_asyncio.apply()  # needed to use an async session inside the client Mock
+    expected = pd.DataFrame(
+        {
+            "context.span_id": ["root1", "root3"],
+            "input": ["q1", "q3"],
+            "output": ["a1", "a3"],
+            "reference": ["A\n\nB", "3\n\n{'a': [1, 2]}\n\nC"],
+        }
+    ).set_index("context.span_id")
+    actual = get_qa_with_reference(_Mock(sqlite_session))
+    assert_frame_equal(
+        actual.sort_index().sort_index(axis=1),
+        expected.sort_index().sort_index(axis=1),
+    )
+
+
+async def _insert_retriever_spans(session: AsyncSession) -> None:
+    start_time = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    for i, (trace_id, span_id, parent_id, span_kind, attributes) in enumerate(
+        [
+            (
+                "t1",
+                "root1",
+                None,
+                SpanKind.CHAIN,
+                {"input": {"value": "q1"}, "output": {"value": "a1"}},
+            ),
+            (
+                "t1",
+                "r1",
+                "root1",
+                SpanKind.RETRIEVER,
+                {
+                    "input": {"value": "q1"},
+                    "retrieval": {
+                        "documents": [
+                            {"document": {"content": "A", "score": 1, "metadata": {"k": 1}}},
+                            {"document": {"content": "B", "score": 2.5}},
+                            {"document": {"id": "x"}},
+                            {"document": {"content": None, "score": None}},
+                        ]
+                    },
+                },
+            ),
+            (
+                "t3",
+                "root3",
+                None,
+                SpanKind.CHAIN,
+                {"input": {"value": "q3"}, "output": {"value": "a3"}},
+            ),
+            (
+                "t3",
+                "r3",
+                "root3",
+                SpanKind.RETRIEVER,
+                {
+                    "input": {"value": "q3"},
+                    "retrieval": {
+                        "documents": [
+                            {"document": {"content": 3, "score": True}},
+                            {"document": {"content": {"a": [1, 2]}, "score": 0.1}},
+                            {"document": {"content": "C", "score": 1e20}},
+                        ]
+                    },
+                },
+            ),
+            ("t4", "r4", None, SpanKind.RETRIEVER, {"input": {"value": "q4"}}),
+        ]
+    ):
+        await insert_span(
+            session,
+            Span(
+                name=span_id,
+                context=SpanContext(trace_id=trace_id, span_id=span_id),
+                parent_id=parent_id,
+                span_kind=span_kind,
+                start_time=start_time + timedelta(seconds=i),
+                end_time=start_time + timedelta(seconds=i + 1),
+                attributes=attributes,
+                status_code=SpanStatusCode.OK,
+                status_message="",
+                events=[],
+                conversation=None,
+            ),
+            "default",
+        )
+
+
 class _Mock:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
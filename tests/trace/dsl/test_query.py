@@ -1,9 +1,16 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
+from phoenix.db.insertion.span import insert_span
 from phoenix.trace.dsl import SpanQuery
+from phoenix.trace.dsl.query import (
+    _flatten_semantic_conventions,
+    _flatten_semantic_conventions_by_column,
+)
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -1006,6 +1013,59 @@ async def test_concat_documents_with_select_and_non_default_separator(
     )
 
 
+async def test_concat_documents_keeps_spans_without_documents_on_sqlite(
+    sqlite_session: AsyncSession,
+) -> None:
+    for span_id, documents in [
+        ("r1", []),
+        ("r2", [{"document": {"content": "D"}}, "x", {"document": {"content": {"b": 1}}}]),
+    ]:
+        await insert_span(
+            sqlite_session,
+            Span(
+                name=span_id,
+                context=SpanContext(trace_id=span_id, span_id=span_id),
+                parent_id=None,
+                span_kind=SpanKind.RETRIEVER,
+                start_time=datetime(2021, 1, 1, tzinfo=timezone.utc),
+                end_time=datetime(2021, 1, 1, tzinfo=timezone.utc),
+                attributes={"retrieval": {"documents": documents}},
+                status_code=SpanStatusCode.OK,
+                status_message="",
+                events=[],
+                conversation=None,
+            ),
+            "abc",
+        )
+    sq = SpanQuery().concat("retrieval.documents", content="document.content")
+    expected = pd.DataFrame(
+        {
+            "context.span_id": ["r1", "r2"],
+            "content": [np.nan, "D\n\n{'b': 1}"],
+        }
+    ).set_index("context.span_id")
+    actual = await sqlite_session.run_sync(sq, project_name="abc")
+    assert_frame_equal(
+        actual.sort_index().sort_index(axis=1),
+        expected.sort_index().sort_index(axis=1),
+    )
+    sq = SpanQuery().concat("retrieval.documents")
+    expected = pd.DataFrame(
+        {
+            "context.span_id": ["r1", "r2"],
+            "retrieval.documents": [
+                "",
+                "{'document': {'content': 'D'}}\n\nx\n\n{'document': {'content': {'b': 1}}}",
+            ],
+        }
+    ).set_index("context.span_id")
+    actual = await sqlite_session.run_sync(sq, project_name="abc")
+    assert_frame_equal(
+        actual.sort_index().sort_index(axis=1),
+        expected.sort_index().sort_index(axis=1),
+    )
+
+
 async def test_explode_and_concat_on_same_array(
     session: AsyncSession, default_project: None, abc_project: None
 ) -> None:
@@ -1185,3 +1245,16 @@ async def test_explode_and_concat_on_same_array_with_non_ascii_kwargs(
         actual.sort_index().sort_index(axis=1),
         expected.sort_index().sort_index(axis=1),
     )
+
+
+def test_flatten_semantic_conventions_by_column() -> None:
+    attributes = [
+        {"input": {"value": "x"}, "metadata": '{"a": 1}'},
+        {"retrieval": {"documents": [{"document": {"content": "A", "score": 1}}]}},
+        {"input": {"value": "y"}, "metadata": '{"a": 2}'},
+        {"input": {"value": None}, "llm": {"token_count": {"total": 3}}},
+        {},
+    ]
+    expected = pd.DataFrame.from_records(list(map(_flatten_semantic_conventions, attributes)))
+    actual = pd.DataFrame(_flatten_semantic_conventions_by_column(attributes))
+    assert_frame_equal(actual.sort_index(axis=1), expected.sort_index(axis=1))
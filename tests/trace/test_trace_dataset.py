@@ -261,6 +261,43 @@ def test_trace_dataset_save_and_load_preserve_values(tmp_path) -> None:
     assert_frame_equal(read_ds.evaluations[0].dataframe, eval_ds.dataframe)
 
 
+def test_trace_dataset_to_disc_and_from_name_preserve_values(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("phoenix.trace.trace_dataset.INFERENCES_DIR", tmp_path)
+    num_records = 5
+    traces_df = pd.DataFrame(
+        {
+            "name": [f"name_{index}" for index in range(num_records)],
+            "span_kind": ["LLM" for index in range(num_records)],
+            "parent_id": [None for index in range(num_records)],
+            "start_time": [datetime.now() for index in range(num_records)],
+            "end_time": [datetime.now() for index in range(num_records)],
+            "status_code": ["OK" for index in range(num_records)],
+            "status_message": ["" for index in range(num_records)],
+            "context.trace_id": [f"trace_{index}" for index in range(num_records)],
+            "context.span_id": [f"span_{index}" for index in range(num_records)],
+        }
+    )
+    ds = TraceDataset(traces_df, name="trace-dataset-name")
+    eval_ds = SpanEvaluations(
+        eval_name="my_eval",
+        dataframe=pd.DataFrame(
+            {
+                "context.span_id": [f"span_{index}" for index in range(num_records)],
+                "score": [index for index in range(num_records)],
+            }
+        ).set_index("context.span_id"),
+    )
+    ds.append_evaluations(eval_ds)
+    ds.to_disc()
+
+    read_ds = TraceDataset.from_name("trace-dataset-name")
+    assert read_ds._id == ds._id
+    assert read_ds.name == ds.name
+    assert_frame_equal(read_ds.dataframe, ds.dataframe)
+    assert read_ds.evaluations[0].id == eval_ds.id
+    assert_frame_equal(read_ds.evaluations[0].dataframe, eval_ds.dataframe)
+
+
 def test_trace_dataset_load_logs_warning_when_an_evaluation_cannot_be_loaded(tmp_path):
     num_records = 5
     traces_df = pd.DataFrame(
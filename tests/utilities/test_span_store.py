@@ -0,0 +1,163 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+import pytest
+from phoenix.db import models
+from phoenix.db.bulk_inserter import BulkInserter
+from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.insertion.span import insert_span
+from phoenix.server.api.dataloaders import LatencyMsQuantileDataLoader, RecordCountDataLoader
+from phoenix.server.api.input_types.TimeRange import TimeRange
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+from phoenix.utilities.span_store import SpanStore
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_START_TIME = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+
+def _span(
+    trace_id: str,
+    span_id: str,
+    parent_id: Optional[str],
+    seconds: float,
+    status_code: SpanStatusCode = SpanStatusCode.OK,
+) -> Span:
+    return Span(
+        name=span_id,
+        context=SpanContext(trace_id=trace_id, span_id=span_id),
+        parent_id=parent_id,
+        span_kind=SpanKind.LLM,
+        start_time=_START_TIME + timedelta(seconds=seconds),
+        end_time=_START_TIME + timedelta(seconds=2 * seconds),
+        attributes={"llm": {"token_count": {"prompt": 10, "completion": 5}}},
+        status_code=status_code,
+        status_message="",
+        events=[],
+        conversation=None,
+    )
+
+
+async def _bulk_insert(db, span_store: SpanStore, spans: List[Tuple[Span, str]]) -> None:
+    bulk_inserter = BulkInserter(db, span_store=span_store, sleep=0.001)
+    async with bulk_inserter as (queue_span, *_):
+        for span, project_name in spans:
+            await queue_span(span, project_name)
+        while bulk_inserter.last_updated_at() is None:
+            await asyncio.sleep(0.001)
+
+
+async def test_span_store_answers_hot_time_ranges_like_the_database(
+    db, session: AsyncSession, dialect: str
+) -> None:
+    # The span inserted before the project is added to the store sets the watermark.
+    await insert_span(session, _span("0", "x", None, 0), "abc")
+    span_store = SpanStore(max_spans_per_project=10, dialect=SupportedSQLDialect(dialect))
+    # The durations are not whole milliseconds, so the latencies depend on
+    # how the database rounds them.
+    await _bulk_insert(
+        db,
+        span_store,
+        [
+            (_span("1", "c", "b", 12.0003, SpanStatusCode.ERROR), "abc"),
+            (_span("1", "a", None, 5.00035), "abc"),
+            (_span("1", "b", "a", 10.00045), "abc"),
+            (_span("2", "d", None, 20.00001), "abc"),
+        ],
+    )
+    project_rowid = await session.scalar(select(models.Project.id))
+    assert project_rowid is not None
+
+    hot = TimeRange(start=_START_TIME + timedelta(seconds=1), end=_START_TIME + timedelta(hours=1))
+    cold = TimeRange(start=_START_TIME, end=_START_TIME + timedelta(hours=1))
+    assert span_store.get_spans(project_rowid, cold.start, cold.end) is None
+    assert span_store.count("span", project_rowid, cold.start, cold.end) is None
+
+    spans = span_store.get_spans(project_rowid, hot.start, hot.end)
+    assert spans is not None
+    db_spans = {
+        span.span_id: span
+        for span in await session.scalars(
+            select(models.Span).where(models.Span.start_time >= hot.start).order_by(models.Span.id)
+        )
+    }
+    assert [span.span_id for span in spans] == list(db_spans)
+    for span in spans:
+        db_span = db_spans[span.span_id]
+        assert (span.id, span.trace_rowid, span.start_time, span.latency_ms) == (
+            db_span.id,
+            db_span.trace_rowid,
+            db_span.start_time,
+            db_span.latency_ms,
+        )
+        assert (
+            span.cumulative_error_count,
+            span.cumulative_llm_token_count_prompt,
+            span.cumulative_llm_token_count_completion,
+        ) == (
+            db_span.cumulative_error_count,
+            db_span.cumulative_llm_token_count_prompt,
+            db_span.cumulative_llm_token_count_completion,
+        )
+    root_spans = span_store.get_spans(project_rowid, hot.start, hot.end, root_spans_only=True)
+    assert root_spans is not None
+    assert [span.span_id for span in root_spans] == ["a", "d"]
+    trace_spans = span_store.get_trace_spans(db_spans["a"].trace_rowid)
+    assert trace_spans is not None
+    assert [span.span_id for span in trace_spans] == ["c", "a", "b"]
+
+    for kind, latency_ms, start_time in (
+        ("span", models.Span.latency_ms, models.Span.start_time),
+        ("trace", models.Trace.latency_ms, models.Trace.start_time),
+    ):
+        latencies = span_store.get_latencies(kind, project_rowid, hot.start, hot.end)
+        assert latencies is not None
+        db_latencies = await session.scalars(select(latency_ms).where(start_time >= hot.start))
+        assert sorted(latencies) == sorted(db_latencies)
+
+    keys = [(kind, project_rowid, hot, None) for kind in ("span", "trace")]
+    assert await RecordCountDataLoader(db, span_store=span_store)._load_fn(
+        keys
+    ) == await RecordCountDataLoader(db)._load_fn(keys)
+    quantile_keys = [(*key, probability) for key in keys for probability in (0.1, 0.5, 0.99)]
+    # The interpolation of SQLite's percentile can differ in the last bit.
+    assert await LatencyMsQuantileDataLoader(db, span_store=span_store)._load_fn(
+        quantile_keys
+    ) == pytest.approx(await LatencyMsQuantileDataLoader(db)._load_fn(quantile_keys))
+
+
+async def test_span_store_evicts_the_earliest_spans(
+    db, session: AsyncSession, dialect: str
+) -> None:
+    span_store = SpanStore(max_spans_per_project=2, dialect=SupportedSQLDialect(dialect))
+    await _bulk_insert(
+        db,
+        span_store,
+        [
+            (_span("1", "b", "a", 2), "abc"),
+            (_span("1", "a", None, 1), "abc"),
+            (_span("2", "c", None, 3), "abc"),
+        ],
+    )
+    project_rowid = await session.scalar(select(models.Project.id))
+    assert project_rowid is not None
+    trace_rowids = dict(
+        (await session.execute(select(models.Trace.trace_id, models.Trace.id))).all()
+    )
+
+    assert span_store.count("span", project_rowid, None, None) is None
+    assert span_store.count("span", project_rowid, _START_TIME + timedelta(seconds=1), None) is None
+    assert span_store.count("span", project_rowid, _START_TIME + timedelta(seconds=1.5), None) == 2
+    assert span_store.count("trace", project_rowid, _START_TIME + timedelta(seconds=1.5), None) == 1
+    assert span_store.get_trace_spans(trace_rowids["1"]) is None
+    trace_spans = span_store.get_trace_spans(trace_rowids["2"])
+    assert trace_spans is not None
+    assert [span.span_id for span in trace_spans] == ["c"]
+
+    span_store.discard_traces([trace_rowids["2"]])
+    assert span_store.count("span", project_rowid, _START_TIME + timedelta(seconds=1.5), None) == 1
+    span_store.clear(project_rowid)
+    assert (
+        span_store.count("span", project_rowid, _START_TIME + timedelta(seconds=1.5), None) is None
+    )